@@ -1,14 +1,57 @@
-"""Accessibility features and utilities for the Pixel Drawing application."""
+"""Accessibility features and utilities for the Pixel Drawing application.
 
-from .keyboard_navigation import KeyboardNavigationMixin, CanvasKeyboardNavigation
-from .screen_reader import ScreenReaderSupport
-from .focus_management import FocusManager
-from .accessibility_utils import AccessibilityUtils
+Submodules are imported on first attribute access, so code that only needs
+one helper does not pay for loading the rest of the package.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .keyboard_navigation import KeyboardNavigationMixin, CanvasKeyboardNavigation
+    from .screen_reader import ScreenReaderSupport
+    from .focus_management import FocusManager
+    from .accessibility_utils import AccessibilityUtils
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    "KeyboardNavigationMixin": ".keyboard_navigation",
+    "CanvasKeyboardNavigation": ".keyboard_navigation",
+    "ScreenReaderSupport": ".screen_reader",
+    "FocusManager": ".focus_management",
+    "AccessibilityUtils": ".accessibility_utils",
+}
 
 __all__ = [
     "KeyboardNavigationMixin",
     "CanvasKeyboardNavigation",
-    "ScreenReaderSupport", 
+    "ScreenReaderSupport",
     "FocusManager",
     "AccessibilityUtils"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access.
+    
+    Args:
+        name: Attribute being looked up on the package
+    
+    Returns:
+        The requested class
+    
+    Raises:
+        AttributeError: If the name is not part of the package
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    """List the package's public names alongside its module attributes."""
+    return sorted(set(globals()) | set(__all__))
@@ -1,6 +1,8 @@
 """Accessibility utility functions and constants."""
 
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from weakref import WeakKeyDictionary
+from typing import Optional, Dict, Any, ClassVar, Iterable, List, Sequence, Tuple
 from PyQt6.QtGui import QColor
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QWidget
@@ -9,6 +11,278 @@ from ..constants import AppConstants
 from ..i18n import tr_panel, tr_dialog
 
 
+# Last accessibility properties applied to each widget; rebuilding a panel
+# with unchanged values then skips the Qt setters and the accessibility
+# tree updates they trigger
+_widget_a11y_fingerprints: "WeakKeyDictionary[QWidget, Tuple]" = WeakKeyDictionary()
+
+
+def _a11y_unchanged(widget: QWidget, fingerprint: Tuple) -> bool:
+    """Check a widget's applied accessibility properties against new ones.
+    
+    The new fingerprint is recorded when it differs, as the caller is about
+    to apply it.
+    
+    Args:
+        widget: Widget being configured
+        fingerprint: Tuple of every property value the caller sets
+    
+    Returns:
+        True if the widget already has exactly these properties
+    """
+    if _widget_a11y_fingerprints.get(widget) == fingerprint:
+        return True
+    _widget_a11y_fingerprints[widget] = fingerprint
+    return False
+
+
+def _apply_accessible_properties(widget: QWidget, accessible_name: str,
+                                 accessible_description: Optional[str]) -> None:
+    """Set a widget's accessible name and optional description.
+    
+    Args:
+        widget: Widget to configure
+        accessible_name: Name for screen readers
+        accessible_description: Optional detailed description
+    """
+    widget.setAccessibleName(accessible_name)
+    
+    if accessible_description:
+        widget.setAccessibleDescription(accessible_description)
+
+
+# Common color names for better accessibility, keyed by packed RGB
+_COLOR_NAMES: Dict[int, str] = {
+    0x000000: 'Black',
+    0xFFFFFF: 'White',
+    0xFF0000: 'Red',
+    0x00FF00: 'Green',
+    0x0000FF: 'Blue',
+    0xFFFF00: 'Yellow',
+    0xFF00FF: 'Magenta',
+    0x00FFFF: 'Cyan',
+    0x808080: 'Gray',
+    0xC0C0C0: 'Silver',
+    0x800000: 'Maroon',
+    0x008000: 'Dark Green',
+    0x000080: 'Navy',
+    0x808000: 'Olive',
+    0x800080: 'Purple',
+    0x008080: 'Teal',
+    0xFFA500: 'Orange',
+    0xFFC0CB: 'Pink'
+}
+
+
+@lru_cache(maxsize=256)
+def _color_name(rgb: int) -> str:
+    """Get the human-readable name of a 0xRRGGBB color.
+    
+    Args:
+        rgb: Packed RGB value without alpha
+    
+    Returns:
+        Human-readable color description
+    """
+    name = _COLOR_NAMES.get(rgb)
+    if name is not None:
+        return name
+    
+    # For custom colors, describe as RGB values
+    return f"RGB {(rgb >> 16) & 0xFF}, {(rgb >> 8) & 0xFF}, {rgb & 0xFF}"
+
+
+@lru_cache(maxsize=64)
+def _tool_a11y_strings(tool_name: str, shortcut: str, description: str) -> Tuple[str, str, str]:
+    """Compose the accessible name, description and what's-this of a tool button.
+    
+    Args:
+        tool_name: Name of the tool
+        shortcut: Keyboard shortcut
+        description: Tool description
+    
+    Returns:
+        Tuple of (accessible name, accessible description, what's this text)
+    """
+    return (f"{tool_name} Tool",
+            f"{description}. Keyboard shortcut: {shortcut}",
+            f"Use keyboard shortcut '{shortcut}' to activate {tool_name}")
+
+
+@lru_cache(maxsize=256)
+def _color_button_strings(rgb: int) -> Tuple[str, str, str]:
+    """Compose the accessible name, description and tooltip of a color button.
+    
+    Args:
+        rgb: Packed RGB value without alpha
+    
+    Returns:
+        Tuple of (accessible name, accessible description, tooltip)
+    """
+    color_name = _color_name(rgb)
+    hex_value = f"#{rgb:06X}"
+    
+    return (f"Color {color_name}",
+            f"Select color {color_name}, hex value {hex_value}",
+            f"{color_name} ({hex_value})")
+
+
+def _srgb_to_linear(channel: int) -> float:
+    """Convert an 8-bit sRGB channel value to linear light.
+    
+    Args:
+        channel: Channel value (0-255)
+    
+    Returns:
+        Linear channel intensity (0.0 to 1.0)
+    """
+    c = channel / 255.0
+    return c / 12.92 if c <= 0.03928 else ((c + 0.055) / 1.055) ** 2.4
+
+
+# An 8-bit channel has only 256 linear values, so they are computed once
+_SRGB_TO_LINEAR: Tuple[float, ...] = tuple(_srgb_to_linear(channel) for channel in range(256))
+
+
+def _relative_luminance(rgb: int) -> float:
+    """Calculate the relative luminance of a 0xRRGGBB color.
+    
+    Args:
+        rgb: Packed RGB value without alpha
+    
+    Returns:
+        Relative luminance (0.0 to 1.0)
+    """
+    return (0.2126 * _SRGB_TO_LINEAR[(rgb >> 16) & 0xFF]
+            + 0.7152 * _SRGB_TO_LINEAR[(rgb >> 8) & 0xFF]
+            + 0.0722 * _SRGB_TO_LINEAR[rgb & 0xFF])
+
+
+@lru_cache(maxsize=1024)
+def _contrast_ratio(rgb1: int, rgb2: int) -> float:
+    """Calculate the contrast ratio between two 0xRRGGBB colors.
+    
+    The ratio is symmetric, so callers pass the pair in sorted order and
+    both orderings share one cache entry.
+    
+    Args:
+        rgb1: First packed RGB value without alpha
+        rgb2: Second packed RGB value without alpha
+    
+    Returns:
+        Contrast ratio (1.0 to 21.0)
+    """
+    lum1 = _relative_luminance(rgb1)
+    lum2 = _relative_luminance(rgb2)
+    
+    # Ensure lighter color is numerator
+    if lum1 < lum2:
+        lum1, lum2 = lum2, lum1
+    
+    return (lum1 + 0.05) / (lum2 + 0.05)
+
+
+# Enhanced focus indicators never change, so the stylesheet is a constant
+_FOCUS_STYLESHEET = """
+    *:focus {
+        outline: 2px solid #0066CC;
+        outline-offset: 2px;
+    }
+    
+    QPushButton:focus {
+        border: 2px solid #0066CC;
+        background-color: #E6F3FF;
+    }
+    
+    QSpinBox:focus, QComboBox:focus {
+        border: 2px solid #0066CC;
+    }
+    """
+
+
+def _build_high_contrast_stylesheet(colors: Dict[str, str]) -> str:
+    """Format the high contrast stylesheet for a color scheme.
+    
+    Args:
+        colors: High contrast color scheme
+    
+    Returns:
+        CSS stylesheet for high contrast mode
+    """
+    return f"""
+    QWidget {{
+        background-color: {colors['background']};
+        color: {colors['foreground']};
+    }}
+    
+    QPushButton {{
+        background-color: {colors['background']};
+        color: {colors['foreground']};
+        border: 2px solid {colors['border']};
+        padding: 8px;
+        min-width: 80px;
+        min-height: 32px;
+    }}
+    
+    QPushButton:hover {{
+        background-color: {colors['selection']};
+        color: {colors['foreground']};
+    }}
+    
+    QPushButton:focus {{
+        border: 3px solid {colors['focus']};
+        outline: 2px solid {colors['focus']};
+    }}
+    
+    QPushButton:pressed {{
+        background-color: {colors['foreground']};
+        color: {colors['background']};
+    }}
+    
+    QPushButton:disabled {{
+        color: {colors['disabled']};
+        border-color: {colors['disabled']};
+    }}
+    
+    QGroupBox {{
+        border: 2px solid {colors['border']};
+        border-radius: 5px;
+        margin-top: 1ex;
+        padding-top: 10px;
+        font-weight: bold;
+    }}
+    
+    QGroupBox::title {{
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+        background-color: {colors['background']};
+        color: {colors['foreground']};
+    }}
+    
+    QSpinBox, QComboBox {{
+        background-color: {colors['background']};
+        color: {colors['foreground']};
+        border: 2px solid {colors['border']};
+        padding: 4px;
+        min-height: 24px;
+    }}
+    
+    QSpinBox:focus, QComboBox:focus {{
+        border: 3px solid {colors['focus']};
+    }}
+    
+    QLabel {{
+        color: {colors['foreground']};
+        font-weight: bold;
+    }}
+    
+    QScrollArea {{
+        border: 2px solid {colors['border']};
+    }}
+    """
+
+
 class AccessibilityUtils:
     """Utility functions for accessibility enhancements."""
     
@@ -28,6 +302,9 @@ class AccessibilityUtils:
         'disabled': '#808080'
     }
     
+    # Formatted once from HIGH_CONTRAST_COLORS after the class is defined
+    _HIGH_CONTRAST_STYLESHEET: ClassVar[str] = ""
+    
     @staticmethod
     def get_color_name(color: QColor) -> str:
         """Get human-readable color name for screen readers.
@@ -38,35 +315,7 @@ class AccessibilityUtils:
         Returns:
             Human-readable color description
         """
-        hex_value = color.name().upper()
-        
-        # Common color names for better accessibility
-        color_names = {
-            '#000000': 'Black',
-            '#FFFFFF': 'White', 
-            '#FF0000': 'Red',
-            '#00FF00': 'Green',
-            '#0000FF': 'Blue',
-            '#FFFF00': 'Yellow',
-            '#FF00FF': 'Magenta',
-            '#00FFFF': 'Cyan',
-            '#808080': 'Gray',
-            '#C0C0C0': 'Silver',
-            '#800000': 'Maroon',
-            '#008000': 'Dark Green',
-            '#000080': 'Navy',
-            '#808000': 'Olive',
-            '#800080': 'Purple',
-            '#008080': 'Teal',
-            '#FFA500': 'Orange',
-            '#FFC0CB': 'Pink'
-        }
-        
-        if hex_value in color_names:
-            return color_names[hex_value]
-        
-        # For custom colors, describe as RGB values
-        return f"RGB {color.red()}, {color.green()}, {color.blue()}"
+        return _color_name(color.rgb() & 0xFFFFFF)
     
     @staticmethod
     def get_contrast_ratio(color1: QColor, color2: QColor) -> float:
@@ -79,26 +328,8 @@ class AccessibilityUtils:
         Returns:
             Contrast ratio (1.0 to 21.0)
         """
-        def get_luminance(color: QColor) -> float:
-            """Calculate relative luminance of a color."""
-            def to_linear(channel: int) -> float:
-                c = channel / 255.0
-                return c / 12.92 if c <= 0.03928 else ((c + 0.055) / 1.055) ** 2.4
-            
-            r = to_linear(color.red())
-            g = to_linear(color.green()) 
-            b = to_linear(color.blue())
-            
-            return 0.2126 * r + 0.7152 * g + 0.0722 * b
-        
-        lum1 = get_luminance(color1)
-        lum2 = get_luminance(color2)
-        
-        # Ensure lighter color is numerator
-        if lum1 < lum2:
-            lum1, lum2 = lum2, lum1
-            
-        return (lum1 + 0.05) / (lum2 + 0.05)
+        rgb1, rgb2 = sorted((color1.rgb() & 0xFFFFFF, color2.rgb() & 0xFFFFFF))
+        return _contrast_ratio(rgb1, rgb2)
     
     @staticmethod
     def meets_contrast_requirement(color1: QColor, color2: QColor, level: str = "AA") -> bool:
@@ -116,6 +347,42 @@ class AccessibilityUtils:
         required_ratio = AccessibilityUtils.HIGH_CONTRAST_RATIO if level == "AAA" else AccessibilityUtils.NORMAL_CONTRAST_RATIO
         return ratio >= required_ratio
     
+    @staticmethod
+    def contrast_matrix(colors: Sequence[QColor]) -> List[List[float]]:
+        """Calculate the contrast ratio between every pair of colors.
+        
+        Each color's luminance is computed once, so auditing a palette costs
+        N luminance calculations rather than two per pair.
+        
+        Args:
+            colors: Colors to compare
+        
+        Returns:
+            Matrix where entry [i][j] is the contrast ratio of colors i and j
+        """
+        offset_luminances = [_relative_luminance(color.rgb() & 0xFFFFFF) + 0.05 for color in colors]
+        return [
+            [max(lum1, lum2) / min(lum1, lum2) for lum2 in offset_luminances]
+            for lum1 in offset_luminances
+        ]
+    
+    @staticmethod
+    def meets_contrast_requirement_batch(colors: Sequence[QColor], level: str = "AA") -> List[List[bool]]:
+        """Check every pair of colors against WCAG contrast requirements.
+        
+        Args:
+            colors: Colors to compare
+            level: WCAG level ("AA" or "AAA")
+        
+        Returns:
+            Matrix where entry [i][j] is True if colors i and j meet the level
+        """
+        required_ratio = AccessibilityUtils.HIGH_CONTRAST_RATIO if level == "AAA" else AccessibilityUtils.NORMAL_CONTRAST_RATIO
+        return [
+            [ratio >= required_ratio for ratio in row]
+            for row in AccessibilityUtils.contrast_matrix(colors)
+        ]
+    
     @staticmethod
     def setup_accessible_widget(widget: QWidget, 
                                accessible_name: str,
@@ -129,10 +396,10 @@ class AccessibilityUtils:
             accessible_description: Optional detailed description
             role: Optional accessibility role (as string)
         """
-        widget.setAccessibleName(accessible_name)
+        if _a11y_unchanged(widget, (accessible_name, accessible_description, role)):
+            return
         
-        if accessible_description:
-            widget.setAccessibleDescription(accessible_description)
+        _apply_accessible_properties(widget, accessible_name, accessible_description)
             
         # Note: QAccessible.Role usage removed for compatibility
         # Role setting would be handled through Qt accessibility system
@@ -150,18 +417,15 @@ class AccessibilityUtils:
             shortcut: Keyboard shortcut
             description: Tool description
         """
-        accessible_name = f"{tool_name} Tool"
-        accessible_desc = f"{description}. Keyboard shortcut: {shortcut}"
+        accessible_name, accessible_desc, whats_this = _tool_a11y_strings(tool_name, shortcut, description)
         
-        AccessibilityUtils.setup_accessible_widget(
-            button,
-            accessible_name,
-            accessible_desc,
-            "Button"
-        )
+        if _a11y_unchanged(button, (accessible_name, accessible_desc, "Button", whats_this)):
+            return
+        
+        _apply_accessible_properties(button, accessible_name, accessible_desc)
         
         # Add shortcut information to what's this
-        button.setWhatsThis(f"Use keyboard shortcut '{shortcut}' to activate {tool_name}")
+        button.setWhatsThis(whats_this)
     
     @staticmethod
     def setup_color_button_accessibility(button: QWidget, color: QColor) -> None:
@@ -171,21 +435,28 @@ class AccessibilityUtils:
             button: Color button widget
             color: Color value
         """
-        color_name = AccessibilityUtils.get_color_name(color)
-        hex_value = color.name().upper()
+        accessible_name, accessible_desc, tooltip = _color_button_strings(color.rgb() & 0xFFFFFF)
         
-        accessible_name = f"Color {color_name}"
-        accessible_desc = f"Select color {color_name}, hex value {hex_value}"
+        if _a11y_unchanged(button, (accessible_name, accessible_desc, "Button", tooltip)):
+            return
         
-        AccessibilityUtils.setup_accessible_widget(
-            button,
-            accessible_name, 
-            accessible_desc,
-            "Button"
-        )
+        _apply_accessible_properties(button, accessible_name, accessible_desc)
         
         # Update tooltip with accessible information
-        button.setToolTip(f"{color_name} ({hex_value})")
+        button.setToolTip(tooltip)
+    
+    @staticmethod
+    def setup_color_buttons_accessibility(items: Iterable[Tuple[QWidget, QColor]]) -> None:
+        """Configure accessibility for a whole palette of color buttons.
+        
+        Each color is read from Qt once as a packed RGB value and the strings
+        are derived from that, so repeated palette colors share their text.
+        
+        Args:
+            items: Pairs of (color button widget, color value)
+        """
+        for button, color in items:
+            AccessibilityUtils.setup_color_button_accessibility(button, color)
     
     @staticmethod
     def setup_canvas_accessibility(canvas: QWidget, width: int, height: int) -> None:
@@ -218,6 +489,9 @@ class AccessibilityUtils:
             widget: Widget to use for announcement
             message: Message to announce
         """
+        # The name no longer matches what was last applied to the widget
+        _widget_a11y_fingerprints.pop(widget, None)
+        
         # Update accessible name temporarily to trigger screen reader announcement
         original_name = widget.accessibleName()
         widget.setAccessibleName(f"{original_name} - {message}")
@@ -232,80 +506,7 @@ class AccessibilityUtils:
         Returns:
             CSS stylesheet for high contrast mode
         """
-        colors = AccessibilityUtils.HIGH_CONTRAST_COLORS
-        
-        return f"""
-        QWidget {{
-            background-color: {colors['background']};
-            color: {colors['foreground']};
-        }}
-        
-        QPushButton {{
-            background-color: {colors['background']};
-            color: {colors['foreground']};
-            border: 2px solid {colors['border']};
-            padding: 8px;
-            min-width: 80px;
-            min-height: 32px;
-        }}
-        
-        QPushButton:hover {{
-            background-color: {colors['selection']};
-            color: {colors['foreground']};
-        }}
-        
-        QPushButton:focus {{
-            border: 3px solid {colors['focus']};
-            outline: 2px solid {colors['focus']};
-        }}
-        
-        QPushButton:pressed {{
-            background-color: {colors['foreground']};
-            color: {colors['background']};
-        }}
-        
-        QPushButton:disabled {{
-            color: {colors['disabled']};
-            border-color: {colors['disabled']};
-        }}
-        
-        QGroupBox {{
-            border: 2px solid {colors['border']};
-            border-radius: 5px;
-            margin-top: 1ex;
-            padding-top: 10px;
-            font-weight: bold;
-        }}
-        
-        QGroupBox::title {{
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 5px 0 5px;
-            background-color: {colors['background']};
-            color: {colors['foreground']};
-        }}
-        
-        QSpinBox, QComboBox {{
-            background-color: {colors['background']};
-            color: {colors['foreground']};
-            border: 2px solid {colors['border']};
-            padding: 4px;
-            min-height: 24px;
-        }}
-        
-        QSpinBox:focus, QComboBox:focus {{
-            border: 3px solid {colors['focus']};
-        }}
-        
-        QLabel {{
-            color: {colors['foreground']};
-            font-weight: bold;
-        }}
-        
-        QScrollArea {{
-            border: 2px solid {colors['border']};
-        }}
-        """
+        return AccessibilityUtils._HIGH_CONTRAST_STYLESHEET
     
     @staticmethod
     def is_high_contrast_enabled() -> bool:
@@ -325,18 +526,9 @@ class AccessibilityUtils:
         Returns:
             CSS for enhanced focus indicators
         """
-        return """
-        *:focus {
-            outline: 2px solid #0066CC;
-            outline-offset: 2px;
-        }
-        
-        QPushButton:focus {
-            border: 2px solid #0066CC;
-            background-color: #E6F3FF;
-        }
-        
-        QSpinBox:focus, QComboBox:focus {
-            border: 2px solid #0066CC;
-        }
-        """
\ No newline at end of file
+        return _FOCUS_STYLESHEET
+
+
+AccessibilityUtils._HIGH_CONTRAST_STYLESHEET = _build_high_contrast_stylesheet(
+    AccessibilityUtils.HIGH_CONTRAST_COLORS
+)
@@ -1,10 +1,13 @@
 """Focus management for accessibility."""
 
-from typing import List, Optional, Dict, Any
-from PyQt6.QtCore import QObject, pyqtSignal, Qt
+from collections import deque
+from typing import Deque, List, Optional, Dict, Any, Set
+from PyQt6.QtCore import QObject, QEvent, pyqtSignal, Qt
 from PyQt6.QtWidgets import QWidget, QApplication
 from PyQt6.QtGui import QFocusEvent
 
+from ..constants import AppConstants
+from ..enums import AnnouncementPriority
 from .screen_reader import ScreenReaderSupport, AccessibilityAnnouncer
 
 
@@ -28,9 +31,17 @@ class FocusManager(QObject):
         
         self._focus_order: List[QWidget] = []
         self._current_focus_index = -1
-        self._focus_history: List[QWidget] = []
+        self._focus_history: Deque[QWidget] = deque(maxlen=AppConstants.FOCUS_HISTORY_LIMIT)
         self._focus_groups: Dict[str, List[QWidget]] = {}
         
+        # Widget positions alongside each list, so focus events find a
+        # widget's index with one hash lookup instead of scanning the list
+        self._focus_order_index: Dict[QWidget, int] = {}
+        self._focus_group_index: Dict[str, Dict[QWidget, int]] = {}
+        
+        # Focused widget as last reported by focusChanged
+        self._last_focus: Optional[QWidget] = None
+        
         # Install application-wide event filter
         if QApplication.instance():
             QApplication.instance().focusChanged.connect(self._on_focus_changed)
@@ -43,6 +54,7 @@ class FocusManager(QObject):
             widgets: List of widgets in the group
         """
         self._focus_groups[group_name] = widgets
+        self._focus_group_index[group_name] = {widget: i for i, widget in enumerate(widgets)}
         
         # Ensure widgets can receive focus
         for widget in widgets:
@@ -56,6 +68,7 @@ class FocusManager(QObject):
             widgets: List of widgets in desired tab order
         """
         self._focus_order = widgets
+        self._focus_order_index = {widget: i for i, widget in enumerate(widgets)}
         
         # Set Qt tab order
         for i in range(len(widgets) - 1):
@@ -96,19 +109,10 @@ class FocusManager(QObject):
             return False
             
         widgets = self._focus_groups[group_name]
-        current_widget = QApplication.focusWidget()
+        current_index = self._focus_group_index[group_name].get(self._current_focus_widget())
         
-        if current_widget in widgets:
-            current_index = widgets.index(current_widget)
-            next_index = (current_index + 1) % len(widgets)
-            
-            # Find next focusable widget
-            for i in range(len(widgets)):
-                widget_index = (next_index + i) % len(widgets)
-                widget = widgets[widget_index]
-                if widget.isVisible() and widget.isEnabled():
-                    widget.setFocus()
-                    return True
+        if current_index is not None:
+            return self._focus_nearest_in_group(widgets, current_index, 1)
         
         return False
     
@@ -125,44 +129,74 @@ class FocusManager(QObject):
             return False
             
         widgets = self._focus_groups[group_name]
-        current_widget = QApplication.focusWidget()
+        current_index = self._focus_group_index[group_name].get(self._current_focus_widget())
         
-        if current_widget in widgets:
-            current_index = widgets.index(current_widget)
-            prev_index = (current_index - 1) % len(widgets)
-            
-            # Find previous focusable widget
-            for i in range(len(widgets)):
-                widget_index = (prev_index - i) % len(widgets)
-                widget = widgets[widget_index]
-                if widget.isVisible() and widget.isEnabled():
-                    widget.setFocus()
-                    return True
+        if current_index is not None:
+            return self._focus_nearest_in_group(widgets, current_index, -1)
         
         return False
     
+    def _focus_nearest_in_group(self, widgets: List[QWidget], current_index: int, step: int) -> bool:
+        """Focus the nearest focusable widget from the current one, wrapping around.
+        
+        The current widget already has focus, so it is not queried again, and
+        the walk stops at the first widget that can take focus.
+        
+        Args:
+            widgets: Widgets in the group
+            current_index: Index of the focused widget
+            step: 1 to move forwards, -1 to move backwards
+        
+        Returns:
+            True, as focus either moves or stays on the current widget
+        """
+        count = len(widgets)
+        for offset in range(1, count):
+            widget = widgets[(current_index + step * offset) % count]
+            if widget.isVisible() and widget.isEnabled():
+                widget.setFocus()
+                return True
+        
+        # No other widget can take focus; it stays where it is
+        return True
+    
     def save_focus(self) -> Optional[QWidget]:
         """Save current focus for restoration.
         
         Returns:
             Currently focused widget
         """
-        current_widget = QApplication.focusWidget()
+        current_widget = self._current_focus_widget()
         if current_widget:
             self._focus_history.append(current_widget)
         return current_widget
     
+    def _current_focus_widget(self) -> Optional[QWidget]:
+        """Get the focused widget, preferring the one tracked from focus events.
+        
+        Returns:
+            Currently focused widget, or None if nothing has focus
+        """
+        if self._last_focus is not None:
+            return self._last_focus
+        return QApplication.focusWidget()
+    
     def restore_focus(self) -> bool:
         """Restore previously saved focus.
         
         Returns:
             True if focus was restored
         """
-        if self._focus_history:
+        while self._focus_history:
             widget = self._focus_history.pop()
-            if widget.isVisible() and widget.isEnabled():
-                widget.setFocus()
-                return True
+            try:
+                if widget.isVisible() and widget.isEnabled():
+                    widget.setFocus()
+                    return True
+            except RuntimeError:
+                # The widget was deleted after its focus was saved
+                continue
+            return False
         return False
     
     def ensure_focus_visible(self, widget: QWidget) -> None:
@@ -208,10 +242,13 @@ class FocusManager(QObject):
             old_widget: Previously focused widget
             new_widget: Newly focused widget
         """
+        self._last_focus = new_widget
+        
         if new_widget:
             # Update current focus index if in focus order
-            if new_widget in self._focus_order:
-                self._current_focus_index = self._focus_order.index(new_widget)
+            focus_index = self._focus_order_index.get(new_widget)
+            if focus_index is not None:
+                self._current_focus_index = focus_index
             
             # Ensure widget is visible
             self.ensure_focus_visible(new_widget)
@@ -238,6 +275,10 @@ class DialogFocusManager(FocusManager):
         self._dialog = dialog
         self._initial_focus_widget: Optional[QWidget] = None
         self._previous_focus_widget: Optional[QWidget] = None
+        
+        # Widgets known to be inside the dialog, so Tab navigation checks
+        # membership with one set lookup instead of walking parent chains
+        self._dialog_descendants: Set[QWidget] = {dialog}
     
     def setup_dialog_focus(self, initial_focus_widget: Optional[QWidget] = None) -> None:
         """Set up focus for dialog.
@@ -248,6 +289,12 @@ class DialogFocusManager(FocusManager):
         # Save focus from main window
         self._previous_focus_widget = QApplication.focusWidget()
         
+        # Index the dialog's widgets once and keep the index current as
+        # children are added or removed
+        self._dialog_descendants = set(self._dialog.findChildren(QWidget))
+        self._dialog_descendants.add(self._dialog)
+        self._dialog.installEventFilter(self)
+        
         # Set initial focus
         if initial_focus_widget:
             self._initial_focus_widget = initial_focus_widget
@@ -259,10 +306,33 @@ class DialogFocusManager(FocusManager):
     
     def close_dialog_focus(self) -> None:
         """Handle focus when dialog closes."""
+        self._dialog.removeEventFilter(self)
+        
         # Restore focus to main window
         if self._previous_focus_widget and self._previous_focus_widget.isVisible():
             self._previous_focus_widget.setFocus()
     
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:
+        """Track widgets added to or removed from the dialog.
+        
+        Args:
+            obj: Object receiving the event
+            event: Event being delivered
+        
+        Returns:
+            False so the event is always processed normally
+        """
+        if obj is self._dialog:
+            event_type = event.type()
+            if event_type == QEvent.Type.ChildAdded:
+                child = event.child()
+                if isinstance(child, QWidget):
+                    self._dialog_descendants.add(child)
+                    self._dialog_descendants.update(child.findChildren(QWidget))
+            elif event_type == QEvent.Type.ChildRemoved:
+                self._dialog_descendants.discard(event.child())
+        return False
+    
     def handle_tab_navigation(self, forward: bool = True) -> bool:
         """Handle tab navigation within dialog.
         
@@ -298,9 +368,15 @@ class DialogFocusManager(FocusManager):
         Returns:
             True if widget is in dialog
         """
-        parent = widget
+        if widget in self._dialog_descendants:
+            return True
+        
+        # Widgets added deeper in the tree after setup are not announced to
+        # the dialog, so fall back to the parent chain and remember hits
+        parent = widget.parentWidget()
         while parent:
             if parent == self._dialog:
+                self._dialog_descendants.add(widget)
                 return True
             parent = parent.parentWidget()
         return False
@@ -328,7 +404,7 @@ class CanvasFocusManager(FocusManager):
         
         # Announce canvas mode
         message = "Drawing mode. Use arrow keys to navigate, Space to draw, Escape to exit."
-        self._screen_reader.announce(message, "high")
+        self._screen_reader.announce(message, AnnouncementPriority.HIGH)
     
     def exit_canvas_mode(self) -> None:
         """Exit canvas-focused mode."""
@@ -339,7 +415,7 @@ class CanvasFocusManager(FocusManager):
         
         # Announce mode exit
         message = "Exited drawing mode."
-        self._screen_reader.announce(message, "normal")
+        self._screen_reader.announce(message, AnnouncementPriority.NORMAL)
     
     def is_in_canvas_mode(self) -> bool:
         """Check if in canvas-focused mode.
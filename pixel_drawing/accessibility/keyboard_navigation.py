@@ -1,20 +1,83 @@
 """Keyboard navigation enhancements for accessibility."""
 
+from functools import lru_cache
 from typing import Optional, Tuple, Callable
-from PyQt6.QtCore import Qt, QPoint, pyqtSignal, QObject
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QObject
 from PyQt6.QtGui import QKeyEvent
 from PyQt6.QtWidgets import QWidget
 
 from ..constants import AppConstants
-from ..i18n import tr_status
+from ..i18n import TranslationManager, tr_status
+
+
+# Cursor movement per arrow key as (dx, dy)
+_ARROW_DELTAS = {
+    Qt.Key.Key_Up: (0, -1),
+    Qt.Key.Key_Down: (0, 1),
+    Qt.Key.Key_Left: (-1, 0),
+    Qt.Key.Key_Right: (1, 0),
+}
+
+# Keys that activate the item under the cursor
+_ACTION_KEYS = frozenset({Qt.Key.Key_Space, Qt.Key.Key_Return, Qt.Key.Key_Enter})
+
+# Tool selected by each keyboard shortcut letter
+_TOOL_SHORTCUTS = {
+    'B': 'brush',
+    'F': 'fill',
+    'E': 'eraser',
+    'I': 'color_picker',
+    'H': 'pan'
+}
+
+
+@lru_cache(maxsize=4096)
+def _cursor_position_text(language: str, x: int, y: int) -> str:
+    """Format the cursor position announcement.
+    
+    The language is part of the cache key so switching languages never
+    returns a stale translation.
+    
+    Args:
+        language: Active language code
+        x: X coordinate
+        y: Y coordinate
+    
+    Returns:
+        Translated cursor position message
+    """
+    return tr_status("cursor_position", x=x, y=y)
+
+
+@lru_cache(maxsize=1024)
+def _grid_position_text(language: str, row: int, column: int) -> str:
+    """Format the grid position announcement.
+    
+    Args:
+        language: Active language code
+        row: One-based row number
+        column: One-based column number
+    
+    Returns:
+        Translated grid position message
+    """
+    return tr_status("grid_position", row=row, column=column)
 
 
 class KeyboardNavigationMixin:
-    """Mixin class to add keyboard navigation capabilities to widgets."""
+    """Mixin class to add keyboard navigation capabilities to widgets.
+    
+    The mixin is combined with Qt classes, whose sip wrappers always carry an
+    instance dict and refuse a second base with slot storage, so its state
+    lives in the host's dict and it declares no slots of its own.
+    """
+    
+    __slots__ = ()
     
     def __init__(self):
         """Initialize keyboard navigation."""
-        self._keyboard_cursor_pos = QPoint(0, 0)
+        self._cursor_x = 0
+        self._cursor_y = 0
         self._keyboard_navigation_enabled = True
         self._cursor_moved_callback: Optional[Callable[[int, int], None]] = None
         self._action_callback: Optional[Callable[[int, int], None]] = None
@@ -47,7 +110,8 @@ class KeyboardNavigationMixin:
             x: X coordinate
             y: Y coordinate
         """
-        self._keyboard_cursor_pos = QPoint(x, y)
+        self._cursor_x = x
+        self._cursor_y = y
         if self._cursor_moved_callback:
             self._cursor_moved_callback(x, y)
             
@@ -57,7 +121,7 @@ class KeyboardNavigationMixin:
         Returns:
             Tuple of (x, y) coordinates
         """
-        return (self._keyboard_cursor_pos.x(), self._keyboard_cursor_pos.y())
+        return (self._cursor_x, self._cursor_y)
     
     def handle_keyboard_navigation(self, event: QKeyEvent) -> bool:
         """Handle keyboard navigation events.
@@ -74,11 +138,11 @@ class KeyboardNavigationMixin:
         key = event.key()
         
         # Arrow key navigation
-        if key in [Qt.Key.Key_Up, Qt.Key.Key_Down, Qt.Key.Key_Left, Qt.Key.Key_Right]:
+        if key in _ARROW_DELTAS:
             return self._handle_arrow_navigation(key, event.modifiers())
             
         # Action keys
-        elif key in [Qt.Key.Key_Space, Qt.Key.Key_Return, Qt.Key.Key_Enter]:
+        elif key in _ACTION_KEYS:
             return self._handle_action_key()
             
         # Home/End for quick navigation
@@ -104,15 +168,11 @@ class KeyboardNavigationMixin:
         # Calculate step size (larger with Ctrl modifier)
         step = 5 if modifiers & Qt.KeyboardModifier.ControlModifier else 1
         
-        # Calculate new position
-        if key == Qt.Key.Key_Up:
-            y = max(0, y - step)
-        elif key == Qt.Key.Key_Down:
-            y = y + step  # Bounds checking handled by implementation
-        elif key == Qt.Key.Key_Left:
-            x = max(0, x - step)
-        elif key == Qt.Key.Key_Right:
-            x = x + step  # Bounds checking handled by implementation
+        # Calculate new position; the upper bounds are checked by the
+        # implementation
+        dx, dy = _ARROW_DELTAS[key]
+        x = max(0, x + dx * step)
+        y = max(0, y + dy * step)
             
         self.set_keyboard_cursor_position(x, y)
         return True
@@ -171,6 +231,14 @@ class CanvasKeyboardNavigation(QObject, KeyboardNavigationMixin):
         self._canvas_height = canvas_height
         self._current_tool = "brush"
         
+        # Held arrow keys move the cursor at key-repeat rate; only the
+        # position where movement stops is announced
+        self._pending_position: Tuple[int, int] = (0, 0)
+        self._announce_timer = QTimer(self)
+        self._announce_timer.setSingleShot(True)
+        self._announce_timer.setInterval(AppConstants.NAVIGATION_ANNOUNCE_DELAY)
+        self._announce_timer.timeout.connect(self._announce_cursor_position)
+        
         # Connect internal callbacks
         self.enable_keyboard_navigation(
             cursor_moved_callback=self._on_cursor_moved,
@@ -212,15 +280,22 @@ class CanvasKeyboardNavigation(QObject, KeyboardNavigationMixin):
         x = max(0, min(x, self._canvas_width - 1))
         y = max(0, min(y, self._canvas_height - 1))
         
-        # Update position if clamped
-        if (x, y) != self.get_keyboard_cursor_position():
-            self._keyboard_cursor_pos = QPoint(x, y)
+        # Store the clamped position
+        self._cursor_x = x
+        self._cursor_y = y
         
         # Emit signals
         self.cursor_moved.emit(x, y)
         
-        # Announce position to screen reader
-        message = tr_status("cursor_position", x=x, y=y)
+        # Announce position to screen reader once movement settles
+        self._pending_position = (x, y)
+        self._announce_timer.start()
+    
+    def _announce_cursor_position(self) -> None:
+        """Announce the cursor position where keyboard movement stopped."""
+        x, y = self._pending_position
+        language = TranslationManager.instance().get_current_language()
+        message = _cursor_position_text(language, x, y)
         self.navigation_announced.emit(message)
     
     def _on_pixel_activated(self, x: int, y: int) -> None:
@@ -258,24 +333,16 @@ class CanvasKeyboardNavigation(QObject, KeyboardNavigationMixin):
         Returns:
             True if handled
         """
-        tool_map = {
-            'B': 'brush',
-            'F': 'fill', 
-            'E': 'eraser',
-            'I': 'color_picker',
-            'H': 'pan'
-        }
-        
-        if tool_key.upper() in tool_map:
-            tool_name = tool_map[tool_key.upper()]
-            self.set_current_tool(tool_name)
-            
-            # Announce tool change
-            message = tr_status("tool_changed_keyboard", tool=tool_name)
-            self.navigation_announced.emit(message)
-            return True
+        tool_name = _TOOL_SHORTCUTS.get(tool_key.upper())
+        if tool_name is None:
+            return False
+        
+        self.set_current_tool(tool_name)
             
-        return False
+        # Announce tool change
+        message = tr_status("tool_changed_keyboard", tool=tool_name)
+        self.navigation_announced.emit(message)
+        return True
 
 
 class GridKeyboardNavigation(QObject):
@@ -299,6 +366,12 @@ class GridKeyboardNavigation(QObject):
         self._current_row = 0
         self._current_column = 0
         
+        # Only the cell where keyboard movement stops is announced
+        self._announce_timer = QTimer(self)
+        self._announce_timer.setSingleShot(True)
+        self._announce_timer.setInterval(AppConstants.NAVIGATION_ANNOUNCE_DELAY)
+        self._announce_timer.timeout.connect(self._announce_selection)
+    
     def handle_key_event(self, event: QKeyEvent) -> bool:
         """Handle keyboard navigation in grid.
         
@@ -310,23 +383,14 @@ class GridKeyboardNavigation(QObject):
         """
         key = event.key()
         
-        if key == Qt.Key.Key_Up:
-            self._current_row = max(0, self._current_row - 1)
-            self._emit_selection()
-            return True
-        elif key == Qt.Key.Key_Down:
-            self._current_row = min(self._rows - 1, self._current_row + 1)
-            self._emit_selection()
-            return True
-        elif key == Qt.Key.Key_Left:
-            self._current_column = max(0, self._current_column - 1)
-            self._emit_selection()
-            return True
-        elif key == Qt.Key.Key_Right:
-            self._current_column = min(self._columns - 1, self._current_column + 1)
+        delta = _ARROW_DELTAS.get(key)
+        if delta is not None:
+            dx, dy = delta
+            self._current_row = max(0, min(self._rows - 1, self._current_row + dy))
+            self._current_column = max(0, min(self._columns - 1, self._current_column + dx))
             self._emit_selection()
             return True
-        elif key in [Qt.Key.Key_Space, Qt.Key.Key_Return, Qt.Key.Key_Enter]:
+        elif key in _ACTION_KEYS:
             self.item_selected.emit(self._current_row, self._current_column)
             return True
             
@@ -352,6 +416,11 @@ class GridKeyboardNavigation(QObject):
         return (self._current_row, self._current_column)
     
     def _emit_selection(self) -> None:
-        """Emit selection change signals."""
-        message = tr_status("grid_position", row=self._current_row + 1, column=self._current_column + 1)
+        """Schedule the selection announcement for when movement settles."""
+        self._announce_timer.start()
+    
+    def _announce_selection(self) -> None:
+        """Announce the current grid position."""
+        language = TranslationManager.instance().get_current_language()
+        message = _grid_position_text(language, self._current_row + 1, self._current_column + 1)
         self.selection_announced.emit(message)
\ No newline at end of file
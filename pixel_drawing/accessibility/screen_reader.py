@@ -1,12 +1,23 @@
 """Screen reader support and announcements."""
 
-from typing import Optional, Dict, Any
+import heapq
+from itertools import count
+from typing import Optional, Dict, Any, List, Set, Tuple, Union
 from PyQt6.QtCore import QObject, QTimer, pyqtSignal
-from PyQt6.QtWidgets import QWidget, QApplication
+from PyQt6.QtWidgets import QWidget
 
+from ..enums import AnnouncementPriority
 from ..i18n import tr_status, tr_panel
 
 
+# Priority names still accepted by announce(); unknown names rank low
+_PRIORITY_NAMES = {
+    "high": AnnouncementPriority.HIGH,
+    "normal": AnnouncementPriority.NORMAL,
+    "low": AnnouncementPriority.LOW
+}
+
+
 class ScreenReaderSupport(QObject):
     """Manages screen reader announcements and accessibility events."""
     
@@ -20,7 +31,11 @@ class ScreenReaderSupport(QObject):
             parent: Parent object
         """
         super().__init__(parent)
-        self._announcement_queue = []
+        # Min-heap of (-rank, sequence, announcement): highest priority
+        # first, oldest first within a priority
+        self._announcement_queue: List[Tuple[int, int, Dict[str, Any]]] = []
+        self._announcement_sequence = count()
+        self._queued_messages: Set[str] = set()
         self._announcement_timer = QTimer()
         self._announcement_timer.timeout.connect(self._process_announcement_queue)
         self._announcement_timer.setSingleShot(True)
@@ -29,27 +44,36 @@ class ScreenReaderSupport(QObject):
         self._last_announcement = ""
         self._announcement_cooldown = 500  # ms
     
-    def announce(self, message: str, priority: str = "normal") -> None:
+    def announce(self, message: str,
+                 priority: Union[AnnouncementPriority, str] = AnnouncementPriority.NORMAL) -> None:
         """Announce a message to screen readers.
         
         Args:
             message: Message to announce
-            priority: Priority level ("low", "normal", "high")
+            priority: Priority level, or its name ("low", "normal", "high")
         """
         if not message or message == self._last_announcement:
             return
             
-        self._announcement_queue.append({
-            'message': message,
-            'priority': priority,
-            'timestamp': QTimer().elapsed() if hasattr(QTimer(), 'elapsed') else 0
-        })
+        if isinstance(priority, str):
+            priority = _PRIORITY_NAMES.get(priority, AnnouncementPriority.LOW)
         
         # Process immediately for high priority, otherwise queue
-        if priority == "high":
+        if priority == AnnouncementPriority.HIGH:
             self._process_announcement_immediately(message)
-        else:
-            self._schedule_announcement_processing()
+            return
+        
+        if message in self._queued_messages:
+            return
+        
+        announcement = {
+            'message': message,
+            'priority': priority
+        }
+        heapq.heappush(self._announcement_queue,
+                       (-priority, next(self._announcement_sequence), announcement))
+        self._queued_messages.add(message)
+        self._schedule_announcement_processing()
     
     def announce_canvas_state(self, x: int, y: int, color_name: str, tool_name: str) -> None:
         """Announce current canvas state.
@@ -61,7 +85,7 @@ class ScreenReaderSupport(QObject):
             tool_name: Name of current tool
         """
         message = tr_status("canvas_state", x=x, y=y, color=color_name, tool=tool_name)
-        self.announce(message, "normal")
+        self.announce(message, AnnouncementPriority.NORMAL)
     
     def announce_tool_change(self, tool_name: str, shortcut: str) -> None:
         """Announce tool change.
@@ -71,7 +95,7 @@ class ScreenReaderSupport(QObject):
             shortcut: Tool keyboard shortcut
         """
         message = tr_status("tool_selected", tool=tool_name, shortcut=shortcut)
-        self.announce(message, "high")
+        self.announce(message, AnnouncementPriority.HIGH)
     
     def announce_color_change(self, color_name: str, hex_value: str) -> None:
         """Announce color change.
@@ -81,7 +105,7 @@ class ScreenReaderSupport(QObject):
             hex_value: Hex color value
         """
         message = tr_status("color_selected", color=color_name, hex=hex_value)
-        self.announce(message, "normal")
+        self.announce(message, AnnouncementPriority.NORMAL)
     
     def announce_canvas_operation(self, operation: str, x: int, y: int) -> None:
         """Announce canvas drawing operation.
@@ -92,7 +116,7 @@ class ScreenReaderSupport(QObject):
             y: Y coordinate
         """
         message = tr_status("canvas_operation", operation=operation, x=x, y=y)
-        self.announce(message, "low")
+        self.announce(message, AnnouncementPriority.LOW)
     
     def announce_navigation(self, x: int, y: int, total_width: int, total_height: int) -> None:
         """Announce navigation position.
@@ -108,7 +132,7 @@ class ScreenReaderSupport(QObject):
         y_percent = int((y / max(1, total_height - 1)) * 100)
         
         message = tr_status("navigation_position", x=x, y=y, x_percent=x_percent, y_percent=y_percent)
-        self.announce(message, "low")
+        self.announce(message, AnnouncementPriority.LOW)
     
     def announce_validation_error(self, error_message: str) -> None:
         """Announce validation error.
@@ -117,7 +141,7 @@ class ScreenReaderSupport(QObject):
             error_message: Error message to announce
         """
         message = tr_status("validation_error", error=error_message)
-        self.announce(message, "high")
+        self.announce(message, AnnouncementPriority.HIGH)
     
     def announce_file_operation(self, operation: str, filename: str, success: bool) -> None:
         """Announce file operation result.
@@ -132,7 +156,7 @@ class ScreenReaderSupport(QObject):
         else:
             message = tr_status("file_operation_failed", operation=operation, filename=filename)
             
-        self.announce(message, "high")
+        self.announce(message, AnnouncementPriority.HIGH)
     
     def _process_announcement_immediately(self, message: str) -> None:
         """Process high priority announcement immediately.
@@ -141,16 +165,12 @@ class ScreenReaderSupport(QObject):
             message: Message to announce
         """
         self._last_announcement = message
-        self.announcement_requested.emit(message)
         
-        # Use Qt accessibility system for immediate announcement
-        if QApplication.instance():
-            # Create a temporary widget for the announcement
-            temp_widget = QWidget()
-            temp_widget.setAccessibleName(message)
-            
-            # Note: QAccessible usage removed for compatibility
-            # Screen reader announcements would be handled through platform-specific APIs
+        # PyQt6 does not expose QAccessible, so there is no way to post an
+        # announcement event or to tell whether assistive technology is
+        # listening; listeners of this signal deliver the message instead of
+        # building a throwaway widget that nothing can observe
+        self.announcement_requested.emit(message)
     
     def _schedule_announcement_processing(self) -> None:
         """Schedule processing of queued announcements."""
@@ -158,23 +178,28 @@ class ScreenReaderSupport(QObject):
             self._announcement_timer.start(100)  # Process after 100ms
     
     def _process_announcement_queue(self) -> None:
-        """Process queued announcements."""
+        """Speak the newest of the most urgent queued announcements.
+        
+        Everything else in the queue is superseded by it and dropped, so a
+        burst of announcements is spoken after one cooldown instead of one
+        stale message per cooldown.
+        """
         if not self._announcement_queue:
             return
             
-        # Get highest priority announcement
-        announcement = max(self._announcement_queue, 
-                         key=lambda x: {"high": 3, "normal": 2, "low": 1}.get(x['priority'], 1))
-        
-        self._announcement_queue.remove(announcement)
+        # Highest priority first, then the most recent within that priority
+        top_rank = self._announcement_queue[0][0]
+        _, _, announcement = max(entry for entry in self._announcement_queue
+                                 if entry[0] == top_rank)
+        self._announcement_queue.clear()
+        self._queued_messages.clear()
         
         message = announcement['message']
         if message != self._last_announcement:
             self._process_announcement_immediately(message)
         
-        # Schedule next processing if queue not empty
-        if self._announcement_queue:
-            self._announcement_timer.start(self._announcement_cooldown)
+        # Hold back the next queued announcement until the cooldown passes
+        self._announcement_timer.start(self._announcement_cooldown)
 
 
 class AccessibilityAnnouncer(QObject):
@@ -203,7 +228,7 @@ class AccessibilityAnnouncer(QObject):
             message = name
             if description:
                 message += f". {description}"
-            self._screen_reader.announce(message, "normal")
+            self._screen_reader.announce(message, AnnouncementPriority.NORMAL)
     
     def announce_button_activation(self, button_name: str, action_result: str = "") -> None:
         """Announce button activation.
@@ -215,7 +240,7 @@ class AccessibilityAnnouncer(QObject):
         message = tr_status("button_activated", button=button_name)
         if action_result:
             message += f". {action_result}"
-        self._screen_reader.announce(message, "normal")
+        self._screen_reader.announce(message, AnnouncementPriority.NORMAL)
     
     def announce_menu_navigation(self, menu_name: str, item_name: str) -> None:
         """Announce menu navigation.
@@ -225,7 +250,7 @@ class AccessibilityAnnouncer(QObject):
             item_name: Name of menu item
         """
         message = tr_status("menu_navigation", menu=menu_name, item=item_name)
-        self._screen_reader.announce(message, "normal")
+        self._screen_reader.announce(message, AnnouncementPriority.NORMAL)
     
     def announce_dialog_opened(self, dialog_title: str) -> None:
         """Announce dialog opening.
@@ -234,7 +259,7 @@ class AccessibilityAnnouncer(QObject):
             dialog_title: Title of opened dialog
         """
         message = tr_status("dialog_opened", title=dialog_title)
-        self._screen_reader.announce(message, "high")
+        self._screen_reader.announce(message, AnnouncementPriority.HIGH)
     
     def announce_value_change(self, control_name: str, old_value: str, new_value: str) -> None:
         """Announce value change in controls.
@@ -245,7 +270,7 @@ class AccessibilityAnnouncer(QObject):
             new_value: New value
         """
         message = tr_status("value_changed", control=control_name, value=new_value)
-        self._screen_reader.announce(message, "normal")
+        self._screen_reader.announce(message, AnnouncementPriority.NORMAL)
     
     def announce_selection_change(self, item_name: str, position: str = "") -> None:
         """Announce selection change.
@@ -257,4 +282,4 @@ class AccessibilityAnnouncer(QObject):
         message = tr_status("selection_changed", item=item_name)
         if position:
             message += f" {position}"
-        self._screen_reader.announce(message, "normal")
\ No newline at end of file
+        self._screen_reader.announce(message, AnnouncementPriority.NORMAL)
\ No newline at end of file
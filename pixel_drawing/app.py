@@ -1,13 +1,10 @@
 """Main application entry point for pixel_drawing package."""
 
+import os
 import sys
-import atexit
 from PyQt6.QtWidgets import QApplication
 
-from .views import PixelDrawingApp
 from .utils.logging import init_logging, shutdown_logging, log_info, log_error
-from .i18n import TranslationManager
-from .styles import initialize_style_manager, apply_modern_theme
 
 
 def main() -> None:
@@ -16,19 +13,26 @@ def main() -> None:
     This function can be called directly or used as a console script
     entry point in setup.py. Includes full initialization with logging,
     error handling, and proper cleanup.
+    
+    Nothing is left to persist once the event loop returns, so the process
+    exits without interpreter teardown; pass --debug to exit normally and
+    keep garbage-collection based leak checks working.
     """
     # Initialize logging system first
     init_logging()
     log_info("startup", "Initializing Pixel Drawing Application")
     
-    # Register cleanup handler
-    atexit.register(shutdown_logging)
-    
     try:
         app = QApplication(sys.argv)
         app.setApplicationName("Pixel Drawing")
         app.setOrganizationName("Pixel Drawing Team")
         
+        # Widget, translation and style modules are loaded once the
+        # QApplication exists
+        from .views import PixelDrawingApp
+        from .i18n import TranslationManager
+        from .styles import initialize_style_manager, apply_modern_theme
+        
         # Initialize translation system
         translation_manager = TranslationManager.instance()
         translation_manager.initialize(app)
@@ -46,13 +50,23 @@ def main() -> None:
         window.show()
         
         log_info("startup", "Application ready - entering main loop")
-        sys.exit(app.exec())
+        try:
+            exit_code = app.exec()
+        finally:
+            log_info("startup", "Application main loop ended")
+            shutdown_logging()
         
     except Exception as e:
         log_error("startup", f"Application startup failed: {e}")
+        shutdown_logging()
         raise
-    finally:
-        log_info("startup", "Application main loop ended")
+    
+    if "--debug" in sys.argv:
+        sys.exit(exit_code)
+    
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(exit_code)
 
 
 if __name__ == "__main__":
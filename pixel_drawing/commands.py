@@ -1,16 +1,27 @@
 """Command pattern implementation for efficient undo/redo system."""
 
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Tuple, List, Optional, TYPE_CHECKING
+from array import array
+from collections import deque
+from typing import Deque, Dict, Tuple, Optional, TYPE_CHECKING
 from PyQt6.QtGui import QColor
 
+from .constants import AppConstants
+
 if TYPE_CHECKING:
     from .models import PixelArtModel
 
 
+# Merge window in seconds, comparable with time.monotonic() directly
+_MERGE_WINDOW = AppConstants.COMMAND_MERGE_WINDOW / 1000
+
+
 class Command(ABC):
     """Abstract base class for undoable commands."""
     
+    __slots__ = ()
+    
     @abstractmethod
     def execute(self) -> None:
         """Execute the command."""
@@ -20,10 +31,28 @@ class Command(ABC):
     def undo(self) -> None:
         """Undo the command."""
         pass
+    
+    def try_merge(self, other: 'Command') -> Optional['Command']:
+        """Fold a command executed right after this one into a single step.
+        
+        Args:
+            other: Newer command that has already been executed
+        
+        Returns:
+            Command that undoes and redoes both, or None if they cannot merge
+        """
+        return None
 
 
 class SetPixelCommand(Command):
-    """Command for setting a single pixel."""
+    """Command for setting a single pixel.
+    
+    Colors are kept as packed 0xAARRGGBB integers, the model's storage
+    format, so a long undo history holds no QColor objects. One command is
+    recorded per painted pixel, so slots keep each record small.
+    """
+    
+    __slots__ = ('_model', '_x', '_y', '_new_rgba', '_old_rgba')
     
     def __init__(self, model: 'PixelArtModel', x: int, y: int, new_color: QColor):
         """Initialize set pixel command.
@@ -37,20 +66,71 @@ class SetPixelCommand(Command):
         self._model = model
         self._x = x
         self._y = y
-        self._new_color = QColor(new_color)
-        self._old_color = model.get_pixel(x, y)
+        self._new_rgba = new_color.rgba()
+        self._old_rgba = model.get_pixel_rgba(x, y)
+    
+    @classmethod
+    def _from_rgba(cls, model: 'PixelArtModel', x: int, y: int, new_rgba: int) -> 'SetPixelCommand':
+        """Build a command from a packed color without going through QColor.
+        
+        Args:
+            model: PixelArtModel to operate on
+            x: X coordinate
+            y: Y coordinate
+            new_rgba: Packed 0xAARRGGBB color to set
+        
+        Returns:
+            New SetPixelCommand
+        """
+        command = cls.__new__(cls)
+        command._model = model
+        command._x = x
+        command._y = y
+        command._new_rgba = new_rgba
+        command._old_rgba = model.get_pixel_rgba(x, y)
+        return command
     
     def execute(self) -> None:
         """Set the pixel to new color."""
-        self._model._set_pixel_direct(self._x, self._y, self._new_color)
+        self._model._set_pixel_direct(self._x, self._y, self._new_rgba)
     
     def undo(self) -> None:
         """Restore the pixel to old color."""
-        self._model._set_pixel_direct(self._x, self._y, self._old_color)
+        self._model._set_pixel_direct(self._x, self._y, self._old_rgba)
+
+    def try_merge(self, other: Command) -> Optional[Command]:
+        """Combine this pixel and the next painted ones into one command.
+        
+        Args:
+            other: Newer command that has already been executed
+        
+        Returns:
+            SetMultiplePixelsCommand covering all the pixels, or None
+        """
+        if (not isinstance(other, (SetPixelCommand, SetMultiplePixelsCommand)) or
+                other._model is not self._model):
+            return None
+        
+        merged = SetMultiplePixelsCommand._from_arrays(
+            self._model,
+            array('i', [self._x]),
+            array('i', [self._y]),
+            array('I', [self._new_rgba]),
+            array('I', [self._old_rgba])
+        )
+        return merged.try_merge(other)
 
 
 class SetMultiplePixelsCommand(Command):
-    """Command for setting multiple pixels efficiently."""
+    """Command for setting multiple pixels efficiently.
+    
+    Changes are kept as parallel arrays of coordinates and packed colors,
+    and applied with one model call that emits a single region update.
+    Merged strokes may touch a pixel more than once; changes are applied in
+    order and undone in reverse, so the pixel ends on the right color.
+    """
+    
+    __slots__ = ('_model', '_xs', '_ys', '_new_rgbas', '_old_rgbas')
     
     def __init__(self, model: 'PixelArtModel', pixel_changes: Dict[Tuple[int, int], QColor]):
         """Initialize multiple pixel command.
@@ -60,23 +140,68 @@ class SetMultiplePixelsCommand(Command):
             pixel_changes: Dictionary mapping coordinates to new colors
         """
         self._model = model
-        self._pixel_changes = {}
-        self._old_colors = {}
+        self._xs = array('i', [x for x, _ in pixel_changes])
+        self._ys = array('i', [y for _, y in pixel_changes])
+        self._new_rgbas = array('I', [color.rgba() for color in pixel_changes.values()])
+        
+        # Capture old colors with a single bulk read
+        self._old_rgbas = model.get_pixels_rgba(self._xs, self._ys)
+    
+    @classmethod
+    def _from_arrays(cls, model: 'PixelArtModel', xs: array, ys: array,
+                     new_rgbas: array, old_rgbas: array) -> 'SetMultiplePixelsCommand':
+        """Build a command from already captured change arrays.
+        
+        Args:
+            model: PixelArtModel to operate on
+            xs: X coordinates
+            ys: Y coordinates, parallel to xs
+            new_rgbas: Packed colors to apply, parallel to xs
+            old_rgbas: Packed colors to restore, parallel to xs
         
-        # Store changes and capture old colors
-        for (x, y), new_color in pixel_changes.items():
-            self._pixel_changes[(x, y)] = QColor(new_color)
-            self._old_colors[(x, y)] = model.get_pixel(x, y)
+        Returns:
+            New SetMultiplePixelsCommand
+        """
+        command = cls.__new__(cls)
+        command._model = model
+        command._xs = xs
+        command._ys = ys
+        command._new_rgbas = new_rgbas
+        command._old_rgbas = old_rgbas
+        return command
     
     def execute(self) -> None:
         """Apply all pixel changes."""
-        for (x, y), new_color in self._pixel_changes.items():
-            self._model._set_pixel_direct(x, y, new_color)
+        self._model._set_pixels_direct(self._xs, self._ys, self._new_rgbas)
     
     def undo(self) -> None:
         """Restore all pixels to old colors."""
-        for (x, y), old_color in self._old_colors.items():
-            self._model._set_pixel_direct(x, y, old_color)
+        self._model._set_pixels_direct(self._xs[::-1], self._ys[::-1], self._old_rgbas[::-1])
+    
+    def try_merge(self, other: Command) -> Optional[Command]:
+        """Append the next painted pixels to this command.
+        
+        Args:
+            other: Newer command that has already been executed
+        
+        Returns:
+            This command extended with the pixels, or None
+        """
+        if isinstance(other, SetPixelCommand) and other._model is self._model:
+            self._xs.append(other._x)
+            self._ys.append(other._y)
+            self._new_rgbas.append(other._new_rgba)
+            self._old_rgbas.append(other._old_rgba)
+            return self
+        
+        if isinstance(other, SetMultiplePixelsCommand) and other._model is self._model:
+            self._xs.extend(other._xs)
+            self._ys.extend(other._ys)
+            self._new_rgbas.extend(other._new_rgbas)
+            self._old_rgbas.extend(other._old_rgbas)
+            return self
+        
+        return None
 
 
 class CommandHistory:
@@ -88,10 +213,15 @@ class CommandHistory:
         Args:
             max_history: Maximum number of commands to store
         """
-        self._commands: List[Command] = []
+        # The deque drops the oldest command itself once max_history is hit
+        self._commands: Deque[Command] = deque(maxlen=max_history)
         self._current_index = -1
         self._max_history = max_history
     
+        # When the last command was executed; edits in quick succession are
+        # merged into one undo step
+        self._last_execute_time: Optional[float] = None
+    
     def execute_command(self, command: Command) -> None:
         """Execute a command and add it to history.
         
@@ -99,20 +229,28 @@ class CommandHistory:
             command: Command to execute and store
         """
         # Remove any commands after current index (redo history)
-        if self._current_index < len(self._commands) - 1:
-            self._commands = self._commands[:self._current_index + 1]
+        for _ in range(len(self._commands) - self._current_index - 1):
+            self._commands.pop()
         
         # Execute the command
         command.execute()
         
-        # Add to history
-        self._commands.append(command)
-        self._current_index += 1
+        # Fold it into the previous command if both belong to one stroke
+        now = time.monotonic()
+        last_time = self._last_execute_time
+        self._last_execute_time = now
+        if (self._commands and last_time is not None and
+                now - last_time <= _MERGE_WINDOW):
+            merged = self._commands[-1].try_merge(command)
+            if merged is not None:
+                self._commands[-1] = merged
+                return
         
-        # Limit history size
-        if len(self._commands) > self._max_history:
-            self._commands.pop(0)
-            self._current_index -= 1
+        # Add to history, keeping the index on the new command when the
+        # oldest one is dropped to stay within max_history
+        if len(self._commands) < self._max_history:
+            self._current_index += 1
+        self._commands.append(command)
     
     def can_undo(self) -> bool:
         """Check if undo is available."""
@@ -130,6 +268,7 @@ class CommandHistory:
         command = self._commands[self._current_index]
         command.undo()
         self._current_index -= 1
+        self._last_execute_time = None
         return True
     
     def redo(self) -> bool:
@@ -140,9 +279,19 @@ class CommandHistory:
         self._current_index += 1
         command = self._commands[self._current_index]
         command.execute()
+        self._last_execute_time = None
         return True
     
+    def end_merge_window(self) -> None:
+        """Make the next command a new undo step, however soon it follows."""
+        self._last_execute_time = None
+    
     def clear(self) -> None:
-        """Clear all command history."""
+        """Clear all command history.
+        
+        Also closes the merge window, so the next command never folds into
+        edits made before the model was reloaded or reset.
+        """
         self._commands.clear()
-        self._current_index = -1
\ No newline at end of file
+        self._current_index = -1
+        self._last_execute_time = None
\ No newline at end of file
@@ -38,6 +38,7 @@ class AppConstants:
     
     # UI settings
     RECENT_COLORS_COUNT = 6
+    FOCUS_HISTORY_LIMIT = 32  # Saved focus targets kept for restore_focus
     LARGE_CANVAS_THRESHOLD = 256
     
     # File formats (now use i18n keys)
@@ -50,6 +51,10 @@ class AppConstants:
     TMP_EXTENSION = ".tmp"
     BAK_EXTENSION = ".bak"
     
+    # Project file pixel encoding (base64 of little-endian 0xAARRGGBB words)
+    PIXEL_FORMAT_ARGB32 = "argb32"
+    PIXEL_COMPRESSION_ZLIB = "zlib"
+    
     # Icon paths
     ICON_BRUSH = "icons/paint-brush.svg"
     ICON_FILL = "icons/paint-bucket.svg"
@@ -59,11 +64,14 @@ class AppConstants:
     
     # Performance settings
     UPDATE_TIMER_INTERVAL = 16  # ~60 FPS
+    NAVIGATION_ANNOUNCE_DELAY = 100  # ms of keyboard idle before announcing position
     MAX_UNDO_HISTORY = 50
+    COMMAND_MERGE_WINDOW = 500  # ms between pixel edits folded into one undo step
     DIRTY_RECT_MERGE_THRESHOLD = 3
+    CANVAS_TILE_SIZE = 64  # Logical pixels per side of a canvas paint tile
     
     # Icon preload sizes
-    ICON_PRELOAD_SIZES = [16, 24, 32, 48]
+    ICON_PRELOAD_SIZES = (16, 24, 32, 48)
     
     # Error messages (now use i18n keys)
     ERROR_COORDS_OUT_OF_BOUNDS = "coords_out_of_bounds"
@@ -1,13 +1,63 @@
 """Abstract base class for drawing tools."""
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from PyQt6.QtGui import QColor, QCursor
 from PyQt6.QtCore import Qt
 
 from ...models import PixelArtModel
 
 
+@lru_cache(maxsize=None)
+def _shape_cursor(shape: Qt.CursorShape) -> QCursor:
+    """Get the cursor shared by every tool using a standard cursor shape.
+    
+    Cursors need a running QGuiApplication, so each one is created on first
+    use instead of at import.
+    
+    Args:
+        shape: Standard Qt cursor shape
+    
+    Returns:
+        Shared QCursor for the shape
+    """
+    return QCursor(shape)
+
+
+def _line_points(x0: int, y0: int, x1: int, y1: int) -> List[Tuple[int, int]]:
+    """Get the pixels of a line from one point to another, excluding the start.
+    
+    Mouse moves skip pixels on fast drags, so stroke tools fill the gap
+    between consecutive events with a Bresenham line.
+    
+    Args:
+        x0: Start X coordinate
+        y0: Start Y coordinate
+        x1: End X coordinate
+        y1: End Y coordinate
+    
+    Returns:
+        Coordinates after the start point up to and including the end point
+    """
+    dx = abs(x1 - x0)
+    dy = -abs(y1 - y0)
+    step_x = 1 if x0 < x1 else -1
+    step_y = 1 if y0 < y1 else -1
+    error = dx + dy
+    points = []
+    while x0 != x1 or y0 != y1:
+        doubled = 2 * error
+        if doubled >= dy:
+            error += dy
+            x0 += step_x
+        if doubled <= dx:
+            error += dx
+            y0 += step_y
+        points.append((x0, y0))
+    return points
+
+
 class DrawingTool(ABC):
     """Abstract base class for drawing tools.
     
@@ -19,6 +69,8 @@ class DrawingTool(ABC):
     professional tool switching and visual feedback.
     """
     
+    __slots__ = ('_name', '_model', '_cursor', '_shortcut', '_icon_path')
+    
     def __init__(self, name: str, model: PixelArtModel, cursor: Optional[QCursor] = None, shortcut: str = ""):
         """Initialize drawing tool.
         
@@ -30,7 +82,7 @@ class DrawingTool(ABC):
         """
         self._name = name
         self._model = model
-        self._cursor = cursor or QCursor(Qt.CursorShape.CrossCursor)
+        self._cursor = cursor or _shape_cursor(Qt.CursorShape.CrossCursor)
         self._shortcut = shortcut
         self._icon_path: Optional[str] = None
     
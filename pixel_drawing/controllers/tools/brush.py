@@ -2,7 +2,7 @@
 
 from PyQt6.QtGui import QColor
 
-from .base import DrawingTool
+from .base import DrawingTool, _line_points
 from ...models import PixelArtModel
 from ...exceptions import ValidationError
 from ...constants import AppConstants
@@ -17,6 +17,8 @@ class BrushTool(DrawingTool):
     continuous strokes.
     """
     
+    __slots__ = ('_is_drawing', '_last_point', '_width', '_height', '_rgba', '_set_pixels')
+    
     def __init__(self, model: PixelArtModel):
         """Initialize brush tool.
         
@@ -25,6 +27,11 @@ class BrushTool(DrawingTool):
         """
         super().__init__(tr_tool("brush"), model, shortcut="B")
         self._is_drawing = False
+        self._last_point = (0, 0)
+        self._width = 0
+        self._height = 0
+        self._rgba = 0
+        self._set_pixels = None
         self.set_icon_path(AppConstants.ICON_BRUSH)
     
     def on_press(self, x: int, y: int, color: QColor) -> bool:
@@ -41,6 +48,13 @@ class BrushTool(DrawingTool):
         try:
             self._model.set_pixel(x, y, color)
             self._is_drawing = True
+            self._last_point = (x, y)
+            # Canvas size, color and the model setter cannot change
+            # mid-stroke; cache them for on_move
+            self._width = self._model.width
+            self._height = self._model.height
+            self._rgba = color.rgba()
+            self._set_pixels = self._model.set_pixels_rgba
             return True  # Continue receiving move events
         except ValidationError:
             return False
@@ -48,16 +62,24 @@ class BrushTool(DrawingTool):
     def on_move(self, x: int, y: int, color: QColor) -> None:
         """Continue brush stroke to new coordinates.
         
+        Paints the line from the previous point so fast drags leave no gaps.
+        
         Args:
             x: X coordinate to paint
             y: Y coordinate to paint
             color: Color to paint with
         """
         if self._is_drawing:
-            try:
-                self._model.set_pixel(x, y, color)
-            except ValidationError:
-                pass  # Ignore out-of-bounds moves
+            # The pointer has not left the last painted pixel
+            if (x, y) == self._last_point:
+                return
+            
+            # Ignore out-of-bounds moves; the line between two in-bounds
+            # points stays in bounds
+            if 0 <= x < self._width and 0 <= y < self._height:
+                last_x, last_y = self._last_point
+                self._set_pixels(_line_points(last_x, last_y, x, y), self._rgba)
+                self._last_point = (x, y)
     
     def on_release(self, x: int, y: int, color: QColor) -> None:
         """End brush stroke.
@@ -67,4 +89,5 @@ class BrushTool(DrawingTool):
             y: Final Y coordinate
             color: Final color
         """
-        self._is_drawing = False
\ No newline at end of file
+        self._is_drawing = False
+        self._set_pixels = None
\ No newline at end of file
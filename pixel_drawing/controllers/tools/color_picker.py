@@ -1,5 +1,6 @@
 """Color picker tool for sampling colors from the canvas."""
 
+from typing import Optional
 from PyQt6.QtGui import QColor
 from PyQt6.QtCore import pyqtSignal, QObject
 
@@ -23,6 +24,7 @@ class ColorPickerTool(DrawingTool):
     to notify the UI to update the current color.
     """
     
+    __slots__ = ('_signals',)
     
     def __init__(self, model: PixelArtModel):
         """Initialize color picker tool.
@@ -32,9 +34,16 @@ class ColorPickerTool(DrawingTool):
         """
         super().__init__(tr_tool("color_picker"), model, shortcut="I")
         self.set_icon_path(AppConstants.ICON_COLOR_PICKER)
-        self.signals = ColorPickerToolSignals()
-        # Note: We'll need to connect the signal in the tool manager or main window
-        
+        # Created on first access so tools nobody listens to skip the QObject
+        self._signals: Optional[ColorPickerToolSignals] = None
+    
+    @property
+    def signals(self) -> ColorPickerToolSignals:
+        """Get the tool's signal container, creating it on first access."""
+        if self._signals is None:
+            self._signals = ColorPickerToolSignals()
+        return self._signals
+    
     def on_press(self, x: int, y: int, color: QColor) -> bool:
         """Sample color at specified coordinates.
         
@@ -48,7 +57,9 @@ class ColorPickerTool(DrawingTool):
         """
         try:
             sampled_color = self._model.get_pixel(x, y)
-            self.signals.color_picked.emit(sampled_color)
+            # No signal container yet means nothing is connected
+            if self._signals is not None:
+                self._signals.color_picked.emit(sampled_color)
             return False  # No move events needed for color picking
         except ValidationError:
             return False
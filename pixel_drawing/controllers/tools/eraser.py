@@ -2,13 +2,17 @@
 
 from PyQt6.QtGui import QColor
 
-from .base import DrawingTool
+from .base import DrawingTool, _line_points
 from ...models import PixelArtModel
 from ...exceptions import ValidationError
 from ...constants import AppConstants
 from ...i18n import tr_tool
 
 
+# Packed 0xAARRGGBB value of the background color that erasing paints
+_DEFAULT_BG_RGBA = QColor(AppConstants.DEFAULT_BG_COLOR).rgba()
+
+
 class EraserTool(DrawingTool):
     """Eraser tool for removing pixels by setting them to background color.
     
@@ -17,6 +21,9 @@ class EraserTool(DrawingTool):
     the default background color.
     """
     
+    __slots__ = ('_is_erasing', '_background_rgba', '_last_point', '_width', '_height',
+                 '_set_pixels')
+    
     def __init__(self, model: PixelArtModel):
         """Initialize eraser tool.
         
@@ -26,8 +33,12 @@ class EraserTool(DrawingTool):
         super().__init__(tr_tool("eraser"), model, shortcut="E")
         self.set_icon_path(AppConstants.ICON_ERASER)
         self._is_erasing = False
+        self._last_point = (0, 0)
+        self._width = 0
+        self._height = 0
+        self._set_pixels = None
         # Eraser uses background color for "erasing"
-        self._background_color = QColor(AppConstants.DEFAULT_BG_COLOR)
+        self._background_rgba = _DEFAULT_BG_RGBA
     
     def on_press(self, x: int, y: int, color: QColor) -> bool:
         """Start erasing at specified coordinates.
@@ -41,8 +52,14 @@ class EraserTool(DrawingTool):
             bool: True to continue receiving move events, False otherwise
         """
         try:
-            self._model.set_pixel(x, y, self._background_color)
+            self._model.set_pixel_rgba(x, y, self._background_rgba)
             self._is_erasing = True
+            self._last_point = (x, y)
+            # Canvas size and the model setter cannot change mid-stroke;
+            # cache them for on_move
+            self._width = self._model.width
+            self._height = self._model.height
+            self._set_pixels = self._model.set_pixels_rgba
             return True  # Continue receiving move events
         except ValidationError:
             return False
@@ -50,16 +67,25 @@ class EraserTool(DrawingTool):
     def on_move(self, x: int, y: int, color: QColor) -> None:
         """Continue erasing to new coordinates.
         
+        Erases the line from the previous point so fast drags leave no gaps.
+        
         Args:
             x: X coordinate to erase
             y: Y coordinate to erase
             color: Color parameter (ignored, always uses background)
         """
         if self._is_erasing:
-            try:
-                self._model.set_pixel(x, y, self._background_color)
-            except ValidationError:
-                pass  # Ignore out-of-bounds moves
+            # The pointer has not left the last erased pixel
+            if (x, y) == self._last_point:
+                return
+            
+            # Ignore out-of-bounds moves; the line between two in-bounds
+            # points stays in bounds
+            if 0 <= x < self._width and 0 <= y < self._height:
+                last_x, last_y = self._last_point
+                self._set_pixels(_line_points(last_x, last_y, x, y),
+                                 self._background_rgba)
+                self._last_point = (x, y)
     
     def on_release(self, x: int, y: int, color: QColor) -> None:
         """End erasing stroke.
@@ -69,4 +95,5 @@ class EraserTool(DrawingTool):
             y: Final Y coordinate
             color: Color parameter (ignored)
         """
-        self._is_erasing = False
\ No newline at end of file
+        self._is_erasing = False
+        self._set_pixels = None
\ No newline at end of file
@@ -17,6 +17,8 @@ class FillTool(DrawingTool):
     mouse move or release events.
     """
     
+    __slots__ = ()
+    
     def __init__(self, model: PixelArtModel):
         """Initialize fill tool.
         
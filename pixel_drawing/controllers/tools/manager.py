@@ -1,6 +1,7 @@
 """Tool manager for handling drawing tool selection and delegation."""
 
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, Optional
 from PyQt6.QtCore import QObject, pyqtSignal
 from PyQt6.QtGui import QColor
 
@@ -12,6 +13,17 @@ from .color_picker import ColorPickerTool
 from .pan import PanTool
 from ...models import PixelArtModel
 from ...enums import ToolType
+from ...utils.logging import log_debug, log_warning, log_error, log_tool_usage
+
+
+# Tools every ToolManager starts with, in registration order
+_BUILTIN_TOOLS = (
+    (ToolType.BRUSH, BrushTool),
+    (ToolType.FILL, FillTool),
+    (ToolType.ERASER, EraserTool),
+    (ToolType.COLOR_PICKER, ColorPickerTool),
+    (ToolType.PAN, PanTool),
+)
 
 
 class ToolManager(QObject):
@@ -34,14 +46,19 @@ class ToolManager(QObject):
         super().__init__()
         self._model = model
         self._tools: Dict[str, DrawingTool] = {}
+        # Tool ID -> display name, kept in step with register_tool
+        self._tool_names: Dict[str, str] = {}
         self._current_tool: Optional[DrawingTool] = None
+        self._current_tool_id: Optional[str] = None
+        # Event handlers of the current tool, bound once per tool change so
+        # mouse events skip the attribute lookups
+        self._on_press: Optional[Callable[[int, int, QColor], bool]] = None
+        self._on_move: Optional[Callable[[int, int, QColor], None]] = None
+        self._on_release: Optional[Callable[[int, int, QColor], None]] = None
         
         # Register all available tools using enum values
-        self.register_tool(ToolType.BRUSH.value, BrushTool(model))
-        self.register_tool(ToolType.FILL.value, FillTool(model))
-        self.register_tool(ToolType.ERASER.value, EraserTool(model))
-        self.register_tool(ToolType.COLOR_PICKER.value, ColorPickerTool(model))
-        self.register_tool(ToolType.PAN.value, PanTool(model))
+        for tool_type, tool_class in _BUILTIN_TOOLS:
+            self.register_tool(tool_type.value, tool_class(model))
         
         # Set default tool
         self.set_current_tool(ToolType.BRUSH.value)
@@ -54,44 +71,52 @@ class ToolManager(QObject):
             tool: DrawingTool instance
         """
         self._tools[tool_id] = tool
+        self._tool_names[tool_id] = tool.name
     
     def get_tool(self, tool_id: str) -> Optional[DrawingTool]:
         """Get tool by ID.
         
         Args:
-            tool_id: Tool identifier
+            tool_id: Tool identifier or ToolType member
             
         Returns:
             DrawingTool instance or None if not found
         """
         return self._tools.get(tool_id)
     
-    def get_available_tools(self) -> Dict[str, str]:
+    def get_available_tools(self) -> Mapping[str, str]:
         """Get available tools.
         
         Returns:
-            Dictionary mapping tool IDs to tool names
+            Read-only mapping of tool IDs to tool names
         """
-        return {tool_id: tool.name for tool_id, tool in self._tools.items()}
+        return MappingProxyType(self._tool_names)
     
     def set_current_tool(self, tool_id: str) -> bool:
         """Set the current active tool.
         
         Args:
-            tool_id: Tool identifier
+            tool_id: Tool identifier or ToolType member
             
         Returns:
-            True if tool was set successfully
+            True if tool was set successfully or was already active
         """
-        tool = self.get_tool(tool_id)
+        tool = self._tools.get(tool_id)
+        if tool is self._current_tool and tool is not None:
+            # Re-selecting the active tool changes nothing downstream
+            return True
         if tool:
-            from ...utils.logging import log_debug
+            if isinstance(tool_id, ToolType):
+                tool_id = tool_id.value
             log_debug("tools", f"Tool changed to: {tool_id}")
             self._current_tool = tool
+            self._current_tool_id = tool_id
+            self._on_press = tool.on_press
+            self._on_move = tool.on_move
+            self._on_release = tool.on_release
             self.tool_changed.emit(tool_id)
             return True
         else:
-            from ...utils.logging import log_warning
             log_warning("tools", f"Failed to set unknown tool: {tool_id}")
             return False
     
@@ -100,6 +125,11 @@ class ToolManager(QObject):
         """Get current active tool."""
         return self._current_tool
     
+    @property
+    def current_tool_id(self) -> Optional[str]:
+        """Get the ID the current tool was registered under."""
+        return self._current_tool_id
+    
     def handle_press(self, x: int, y: int, color: QColor) -> bool:
         """Handle mouse press with current tool.
         
@@ -111,12 +141,12 @@ class ToolManager(QObject):
         Returns:
             True if tool should receive move events
         """
-        if self._current_tool:
-            from ...utils.logging import log_tool_usage, log_error
+        on_press = self._on_press
+        if on_press is not None:
             tool_name = self._current_tool.name
             log_tool_usage(tool_name, "press", f"({x},{y})")
             try:
-                return self._current_tool.on_press(x, y, color)
+                return on_press(x, y, color)
             except Exception as e:
                 log_error("tools", f"Tool {tool_name} press handler failed: {e}")
                 return False
@@ -124,20 +154,20 @@ class ToolManager(QObject):
     
     def handle_move(self, x: int, y: int, color: QColor) -> None:
         """Handle mouse move with current tool."""
-        if self._current_tool:
+        on_move = self._on_move
+        if on_move is not None:
             try:
-                self._current_tool.on_move(x, y, color)
+                on_move(x, y, color)
             except Exception as e:
-                from ...utils.logging import log_error
                 tool_name = self._current_tool.name
                 log_error("tools", f"Tool {tool_name} move handler failed: {e}")
     
     def handle_release(self, x: int, y: int, color: QColor) -> None:
         """Handle mouse release with current tool."""
-        if self._current_tool:
+        on_release = self._on_release
+        if on_release is not None:
             try:
-                self._current_tool.on_release(x, y, color)
+                on_release(x, y, color)
             except Exception as e:
-                from ...utils.logging import log_error
                 tool_name = self._current_tool.name
                 log_error("tools", f"Tool {tool_name} release handler failed: {e}")
\ No newline at end of file
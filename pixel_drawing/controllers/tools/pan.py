@@ -1,17 +1,54 @@
 """Pan tool for moving the canvas viewport."""
 
-from PyQt6.QtGui import QColor, QCursor
-from PyQt6.QtCore import Qt, pyqtSignal, QPoint, QObject
+from PyQt6.QtGui import QColor
+from PyQt6.QtCore import Qt, pyqtSignal, QObject, QTimer
 
-from .base import DrawingTool
+from .base import DrawingTool, _shape_cursor
 from ...models import PixelArtModel
 from ...constants import AppConstants
 from ...i18n import tr_tool
 
 
 class PanToolSignals(QObject):
-    """Signal container for PanTool."""
+    """Signal container for PanTool.
+    
+    Movement queued with queue_pan is accumulated and emitted at most once
+    per frame, since pointer devices can report moves far faster than the
+    view can scroll.
+    """
     pan_requested = pyqtSignal(int, int)  # delta_x, delta_y
+    
+    def __init__(self):
+        """Initialize the signal container and its flush timer."""
+        super().__init__()
+        self._pending_dx = 0
+        self._pending_dy = 0
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(AppConstants.UPDATE_TIMER_INTERVAL)
+        self._flush_timer.timeout.connect(self.flush)
+    
+    def queue_pan(self, delta_x: int, delta_y: int) -> None:
+        """Add movement to the next pan_requested emission.
+        
+        Args:
+            delta_x: Horizontal movement in pixels
+            delta_y: Vertical movement in pixels
+        """
+        self._pending_dx += delta_x
+        self._pending_dy += delta_y
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def flush(self) -> None:
+        """Emit the movement queued since the last emission, if any."""
+        self._flush_timer.stop()
+        delta_x = self._pending_dx
+        delta_y = self._pending_dy
+        if delta_x or delta_y:
+            self._pending_dx = 0
+            self._pending_dy = 0
+            self.pan_requested.emit(delta_x, delta_y)
 
 
 class PanTool(DrawingTool):
@@ -22,6 +59,7 @@ class PanTool(DrawingTool):
     the viewport. Emits signals to coordinate with scrollable containers.
     """
     
+    __slots__ = ('signals', '_is_panning', '_last_x', '_last_y')
     
     def __init__(self, model: PixelArtModel):
         """Initialize pan tool.
@@ -30,12 +68,13 @@ class PanTool(DrawingTool):
             model: PixelArtModel (not directly modified by pan tool)
         """
         # Use hand cursor for pan tool
-        hand_cursor = QCursor(Qt.CursorShape.OpenHandCursor)
+        hand_cursor = _shape_cursor(Qt.CursorShape.OpenHandCursor)
         super().__init__(tr_tool("pan"), model, cursor=hand_cursor, shortcut="H")
         self.set_icon_path(AppConstants.ICON_PAN)
         self.signals = PanToolSignals()
         self._is_panning = False
-        self._last_pan_point = QPoint()
+        self._last_x = 0
+        self._last_y = 0
         
     def on_press(self, x: int, y: int, color: QColor) -> bool:
         """Start panning from specified coordinates.
@@ -49,7 +88,8 @@ class PanTool(DrawingTool):
             bool: True to continue receiving move events
         """
         self._is_panning = True
-        self._last_pan_point = QPoint(x, y)
+        self._last_x = x
+        self._last_y = y
         return True  # Continue receiving move events
     
     def on_move(self, x: int, y: int, color: QColor) -> None:
@@ -61,14 +101,17 @@ class PanTool(DrawingTool):
             color: Color parameter (ignored for pan tool)
         """
         if self._is_panning:
-            current_point = QPoint(x, y)
-            delta = current_point - self._last_pan_point
+            delta_x = x - self._last_x
+            delta_y = y - self._last_y
+            if not (delta_x or delta_y):
+                return
             
-            # Emit pan request with delta movement
-            self.signals.pan_requested.emit(delta.x(), delta.y())
+            # Queue pan request; emitted once per frame
+            self.signals.queue_pan(delta_x, delta_y)
             
             # Update last point for next move
-            self._last_pan_point = current_point
+            self._last_x = x
+            self._last_y = y
     
     def on_release(self, x: int, y: int, color: QColor) -> None:
         """End panning operation.
@@ -78,4 +121,6 @@ class PanTool(DrawingTool):
             y: Final Y coordinate
             color: Color parameter (ignored)
         """
-        self._is_panning = False
\ No newline at end of file
+        self._is_panning = False
+        # Deliver movement still waiting for the timer so none is lost
+        self.signals.flush()
\ No newline at end of file
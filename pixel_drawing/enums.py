@@ -1,10 +1,14 @@
 """Enumerations for improved type safety."""
 
-from enum import Enum
+from enum import Enum, IntEnum
 
 
-class ToolType(Enum):
-    """Tool type enumeration for type-safe tool management."""
+class ToolType(str, Enum):
+    """Tool type enumeration for type-safe tool management.
+    
+    Members compare and hash like their string values, so a ToolType and
+    its plain string ID find the same entry in tool registries.
+    """
     BRUSH = "brush"
     FILL = "fill"
     ERASER = "eraser"
@@ -19,10 +23,10 @@ class ToolType(Enum):
     @classmethod
     def from_string(cls, tool_string: str):
         """Convert string to ToolType enum."""
-        for tool in cls:
-            if tool.value == tool_string:
-                return tool
-        raise ValueError(f"Unknown tool type: {tool_string}")
+        try:
+            return cls(tool_string)
+        except ValueError:
+            raise ValueError(f"Unknown tool type: {tool_string}") from None
 
 
 class FileExtension(Enum):
@@ -30,4 +34,11 @@ class FileExtension(Enum):
     JSON = ".json"
     PNG = ".png"
     TMP = ".tmp"
-    BAK = ".bak"
\ No newline at end of file
+    BAK = ".bak"
+
+
+class AnnouncementPriority(IntEnum):
+    """Screen reader announcement priority; higher values are spoken first."""
+    LOW = 1
+    NORMAL = 2
+    HIGH = 3
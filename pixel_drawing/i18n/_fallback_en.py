@@ -0,0 +1,148 @@
+"""English fallback strings for the translation system.
+
+Used when no compiled translation provides a string; they also document the
+source text for translators. TranslationManager imports this module the
+first time a fallback is needed.
+"""
+
+from typing import Dict
+
+
+FALLBACK_STRINGS: Dict[str, Dict[str, str]] = {
+    "window_titles": {
+        "app_title": "Pixel Drawing - Retro Game Asset Creator",
+        "app_with_file": "Pixel Drawing - {filename}"
+    },
+    "toolbar": {
+        "new": "New",
+        "open": "Open",
+        "save": "Save",
+        "save_as": "Save As",
+        "export_png": "Export PNG",
+        "undo": "Undo",
+        "redo": "Redo"
+    },
+    "tools": {
+        "brush": "Brush",
+        "brush_tooltip": "Brush Tool (B)",
+        "fill": "Fill Bucket",
+        "fill_tooltip": "Fill Bucket Tool (F)",
+        "eraser": "Eraser",
+        "eraser_tooltip": "Eraser Tool (E)",
+        "color_picker": "Color Picker",
+        "color_picker_tooltip": "Color Picker Tool (I)",
+        "pan": "Pan",
+        "pan_tooltip": "Pan Tool (H)"
+    },
+    "panels": {
+        "tools_group": "Tools",
+        "color_group": "Color",
+        "canvas_size_group": "Canvas Size",
+        "actions_group": "Actions",
+        "width_label": "Width:",
+        "height_label": "Height:",
+        "resize_canvas": "Resize Canvas",
+        "clear_canvas": "Clear Canvas",
+        "choose_color": "Choose Color",
+        "recent_colors": "Recent Colors:",
+        "current_color_tooltip": "Current Color - Click to choose new color",
+        "background_color_tooltip": "Background Color (used by eraser tool)",
+        "file_menu": "File",
+        "edit_menu": "Edit", 
+        "settings_menu": "Settings",
+        "preferences": "Preferences...",
+        "quit": "Quit",
+        "drawing_canvas": "Drawing Canvas",
+        "canvas_description": "Pixel art drawing canvas, {width} by {height} pixels",
+        "canvas_keyboard_instructions": "Use arrow keys to navigate, Space to draw, tool shortcuts (B/F/E/I/H) to change tools"
+    },
+    "dialogs": {
+        "choose_color_title": "Choose Color",
+        "new_file_title": "New File",
+        "new_file_message": "Are you sure? Unsaved changes will be lost.",
+        "open_file_title": "Open Pixel Art File",
+        "save_file_title": "Save Pixel Art File",
+        "export_png_title": "Export as PNG",
+        "large_canvas_title": "Large Canvas",
+        "large_canvas_message": "Canvas size {width}x{height} may affect performance. Continue?",
+        "invalid_dimensions_title": "Invalid Dimensions",
+        "clear_canvas_title": "Clear Canvas",
+        "clear_canvas_message": "Are you sure you want to clear the canvas?",
+        "success_title": "Success",
+        "file_saved_message": "File saved successfully!",
+        "png_exported_message": "PNG exported successfully!",
+        "error_title_template": "{operation} Error"
+    },
+    "status": {
+        "ready": "Ready",
+        "undone": "Undone",
+        "redone": "Redone",
+        "canvas_resized": "Canvas resized to {width}x{height}",
+        "tool_changed": "Tool: {tool_id}",
+        "pixel_info": "Pixel ({x}, {y}): {color}",
+        "file_opened": "Opened: {filename}",
+        "file_saved": "Saved: {filename}",
+        "file_exported": "Exported: {filename}",
+        "cursor_position": "Cursor at pixel {x}, {y}",
+        "pixel_drawn": "Drew with {tool} at pixel {x}, {y}",
+        "tool_changed_keyboard": "Tool changed to {tool}",
+        "grid_position": "Row {row}, Column {column}",
+        "canvas_state": "Position {x}, {y}, color {color}, tool {tool}",
+        "tool_selected": "{tool} tool selected, shortcut {shortcut}",
+        "color_selected": "Color {color} selected, hex value {hex}",
+        "canvas_operation": "{operation} at position {x}, {y}",
+        "navigation_position": "Position {x}, {y}, {x_percent}% across, {y_percent}% down",
+        "validation_error": "Error: {error}",
+        "file_operation_success": "{operation} successful: {filename}",
+        "file_operation_failed": "{operation} failed: {filename}",
+        "button_activated": "{button} button activated",
+        "menu_navigation": "{menu} menu, {item}",
+        "dialog_opened": "{title} dialog opened",
+        "value_changed": "{control} changed to {value}",
+        "selection_changed": "{item} selected"
+    },
+    "errors": {
+        "coords_out_of_bounds": "Coordinates out of bounds",
+        "invalid_color": "Invalid color",
+        "invalid_dimensions": "Invalid canvas dimensions",
+        "dimensions_must_be_integers": "Canvas dimensions must be integers",
+        "dimensions_too_small": "Canvas dimensions must be at least {min_size}x{min_size}",
+        "dimensions_too_large": "Canvas dimensions cannot exceed {max_size}x{max_size}",
+        "file_path_empty": "File path cannot be empty",
+        "file_not_exists": "File does not exist: {path}",
+        "path_not_file": "Path is not a file: {path}",
+        "file_not_readable": "File is not readable: {path}",
+        "directory_not_exists": "Directory does not exist: {path}",
+        "file_not_writable": "File is not writable: {path}",
+        "directory_not_writable": "Directory is not writable: {path}",
+        "save_failed": "Failed to save file: {error}",
+        "export_failed": "Failed to export PNG: {error}"
+    },
+    "file_filters": {
+        "json_files": "JSON files (*.json)",
+        "png_files": "PNG files (*.png)"
+    },
+    "preferences": {
+        "preferences_title": "Preferences",
+        "language_settings": "Language",
+        "ui_settings": "Interface",
+        "canvas_settings": "Canvas",
+        "language_selection": "Language Selection",
+        "interface_language": "Interface Language:",
+        "language_restart_note": "Language changes take effect immediately.",
+        "appearance": "Appearance",
+        "enable_dark_mode": "Enable dark mode (coming soon)",
+        "performance": "Performance",
+        "smooth_scrolling": "Smooth scrolling",
+        "hardware_acceleration": "Hardware acceleration",
+        "default_canvas": "Default Canvas",
+        "default_width": "Default Width:",
+        "default_height": "Default Height:",
+        "grid_settings": "Grid",
+        "show_grid": "Show grid lines",
+        "language_changed_title": "Language Changed",
+        "language_changed_message": "The interface language has been changed successfully.",
+        "language_error_title": "Language Error",
+        "language_error_message": "Failed to change language. Please try again."
+    }
+}
@@ -1,10 +1,10 @@
 """Language configuration for internationalization system."""
 
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, Tuple
 
 
-@dataclass
+@dataclass(frozen=True)
 class LanguageConfig:
     """Configuration for supported languages.
     
@@ -23,7 +23,7 @@ class LanguageConfig:
 
 
 # Supported languages configuration
-SUPPORTED_LANGUAGES: List[LanguageConfig] = [
+SUPPORTED_LANGUAGES: Tuple[LanguageConfig, ...] = (
     LanguageConfig("en_US", "English", "English"),
     LanguageConfig("es_ES", "Spanish", "Español"), 
     LanguageConfig("fr_FR", "French", "Français"),
@@ -31,7 +31,7 @@ SUPPORTED_LANGUAGES: List[LanguageConfig] = [
     LanguageConfig("ja_JP", "Japanese", "日本語"),
     LanguageConfig("zh_CN", "Chinese (Simplified)", "中文(简体)"),
     LanguageConfig("ar_SA", "Arabic", "العربية", is_rtl=True),
-]
+)
 
 # Default language
 DEFAULT_LANGUAGE = "en_US"
@@ -39,6 +39,12 @@ DEFAULT_LANGUAGE = "en_US"
 # Language code to configuration mapping
 LANGUAGE_MAP = {lang.code: lang for lang in SUPPORTED_LANGUAGES}
 
+# Language family (e.g. 'en') to the first supported code in that family;
+# built in reverse so earlier entries win
+LANGUAGE_FAMILY_MAP: Dict[str, str] = {
+    lang.code.split('_')[0]: lang.code for lang in reversed(SUPPORTED_LANGUAGES)
+}
+
 
 def get_language_config(code: str) -> LanguageConfig:
     """Get language configuration by code.
@@ -1,9 +1,28 @@
 """Helper functions for internationalization."""
 
+from functools import lru_cache
+
 from .manager import TranslationManager
 from .contexts import UIContext
 
 
+@lru_cache(maxsize=1024)
+def _tr_cached(context: str, key: str) -> str:
+    """Translate a string that takes no formatting arguments.
+    
+    Results stay cached until TranslationManager changes the installed
+    translators and clears this cache.
+    
+    Args:
+        context: Translation context
+        key: Translation key
+        
+    Returns:
+        Translated string
+    """
+    return TranslationManager.instance().translate(context, key)
+
+
 def tr(context: str, key: str, **kwargs) -> str:
     """Primary translation function with formatting support.
     
@@ -18,6 +37,8 @@ def tr(context: str, key: str, **kwargs) -> str:
     Example:
         tr("dialogs", "save_error", filename="test.json")
     """
+    if not kwargs:
+        return _tr_cached(context, key)
     return TranslationManager.instance().translate(context, key, **kwargs)
 
 
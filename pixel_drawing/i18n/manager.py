@@ -1,11 +1,14 @@
 """Translation manager for internationalization system."""
 
 import os
-from typing import Dict, List, Optional, Any
+from typing import Dict, FrozenSet, List, Optional, Any
 from PyQt6.QtCore import QTranslator, QLocale, QCoreApplication
 from PyQt6.QtWidgets import QApplication
 
-from .config import LanguageConfig, SUPPORTED_LANGUAGES, DEFAULT_LANGUAGE, get_language_config
+from .config import (
+    LanguageConfig, SUPPORTED_LANGUAGES, DEFAULT_LANGUAGE, LANGUAGE_FAMILY_MAP,
+    get_language_config, is_language_supported
+)
 from ..utils.logging import log_info, log_error, log_debug
 
 
@@ -27,11 +30,29 @@ class TranslationManager:
         self._translators: Dict[str, QTranslator] = {}
         self._app: Optional[QApplication] = None
         self._translations_dir: str = os.path.join(os.path.dirname(__file__), "compiled")
-        self._fallback_strings: Dict[str, Dict[str, str]] = {}
-        
-        # Load fallback strings (English)
-        self._load_fallback_strings()
+        # English fallback strings, imported on first use
+        self._fallback_strings: Optional[Dict[str, Dict[str, str]]] = None
+        # Locale codes with a compiled .qm file in the translations directory
+        self._available_qm: FrozenSet[str] = frozenset()
+        self._scan_translations()
         
+    def _scan_translations(self) -> None:
+        """Record which compiled translation files exist, in one listing."""
+        try:
+            names = os.listdir(self._translations_dir)
+        except OSError:
+            self._available_qm = frozenset()
+            return
+        self._available_qm = frozenset(name[:-3] for name in names if name.endswith(".qm"))
+    
+    @property
+    def fallback_strings(self) -> Dict[str, Dict[str, str]]:
+        """Get the English fallback strings, loading them on first access."""
+        if self._fallback_strings is None:
+            from ._fallback_en import FALLBACK_STRINGS
+            self._fallback_strings = FALLBACK_STRINGS
+        return self._fallback_strings
+    
     @classmethod
     def instance(cls) -> 'TranslationManager':
         """Get singleton instance of TranslationManager."""
@@ -46,6 +67,8 @@ class TranslationManager:
             app: QApplication instance
         """
         self._app = app
+        # Strings cached before Qt was available bypassed its translators
+        self._clear_translation_cache()
         log_info("i18n", "Translation manager initialized")
         
         # Set default language
@@ -61,17 +84,15 @@ class TranslationManager:
         log_debug("i18n", f"System locale detected: {system_locale}")
         
         # Check for exact match
-        for lang in SUPPORTED_LANGUAGES:
-            if lang.code == system_locale:
-                log_info("i18n", f"Using exact language match: {system_locale}")
-                return system_locale
+        if is_language_supported(system_locale):
+            log_info("i18n", f"Using exact language match: {system_locale}")
+            return system_locale
         
         # Check for language family match (e.g., en_GB -> en_US)
-        system_lang = system_locale.split('_')[0]
-        for lang in SUPPORTED_LANGUAGES:
-            if lang.code.split('_')[0] == system_lang:
-                log_info("i18n", f"Using language family match: {lang.code} for {system_locale}")
-                return lang.code
+        family_code = LANGUAGE_FAMILY_MAP.get(system_locale.split('_')[0])
+        if family_code is not None:
+            log_info("i18n", f"Using language family match: {family_code} for {system_locale}")
+            return family_code
         
         # Fall back to default
         log_info("i18n", f"No match found, using default language: {DEFAULT_LANGUAGE}")
@@ -95,7 +116,7 @@ class TranslationManager:
             return True
         
         # Validate language is supported
-        if locale not in [lang.code for lang in SUPPORTED_LANGUAGES]:
+        if not is_language_supported(locale):
             log_error("i18n", f"Unsupported language: {locale}")
             return False
         
@@ -104,7 +125,10 @@ class TranslationManager:
             self._app.removeTranslator(self._translators[self._current_locale])
         
         # Load new translator
-        if self._load_translator(locale):
+        loaded = self._load_translator(locale)
+        # The installed translators changed either way; drop cached strings
+        self._clear_translation_cache()
+        if loaded:
             self._current_locale = locale
             log_info("i18n", f"Language changed to: {locale}")
             return True
@@ -130,7 +154,7 @@ class TranslationManager:
         translator = QTranslator()
         translation_file = os.path.join(self._translations_dir, f"{locale}.qm")
         
-        if os.path.exists(translation_file):
+        if locale in self._available_qm:
             if translator.load(translation_file):
                 self._translators[locale] = translator
                 self._app.installTranslator(translator)
@@ -148,6 +172,11 @@ class TranslationManager:
         
         return False
     
+    def _clear_translation_cache(self) -> None:
+        """Discard translations memoized by the tr helpers."""
+        from .helpers import _tr_cached
+        _tr_cached.cache_clear()
+    
     def get_current_language(self) -> str:
         """Get current active language code.
         
@@ -165,8 +194,7 @@ class TranslationManager:
         languages = []
         for lang in SUPPORTED_LANGUAGES:
             # Check if translation file exists (except for default language)
-            translation_file = os.path.join(self._translations_dir, f"{lang.code}.qm")
-            if lang.code == DEFAULT_LANGUAGE or os.path.exists(translation_file):
+            if lang.code == DEFAULT_LANGUAGE or lang.code in self._available_qm:
                 languages.append({
                     "code": lang.code,
                     "name": lang.name,
@@ -187,8 +215,9 @@ class TranslationManager:
         Returns:
             Translated and formatted string
         """
-        if not self._app:
-            # Fall back to English if not initialized
+        if not self._app or self._current_locale not in self._translators:
+            # Fall back to English if not initialized or no translator is
+            # installed for the language; Qt would only echo the key back
             return self._get_fallback_string(context, key, **kwargs)
         
         # Try Qt translation system first
@@ -219,8 +248,9 @@ class TranslationManager:
         Returns:
             Fallback string or key if not found
         """
-        if context in self._fallback_strings and key in self._fallback_strings[context]:
-            string = self._fallback_strings[context][key]
+        strings = self.fallback_strings.get(context)
+        string = strings.get(key) if strings is not None else None
+        if string is not None:
             if kwargs:
                 try:
                     return string.format(**kwargs)
@@ -229,146 +259,4 @@ class TranslationManager:
             return string
         else:
             log_debug("i18n", f"Fallback string not found: {context}.{key}")
-            return key
-    
-    def _load_fallback_strings(self) -> None:
-        """Load English fallback strings for development/testing."""
-        # These serve as fallbacks and documentation for translators
-        self._fallback_strings = {
-            "window_titles": {
-                "app_title": "Pixel Drawing - Retro Game Asset Creator",
-                "app_with_file": "Pixel Drawing - {filename}"
-            },
-            "toolbar": {
-                "new": "New",
-                "open": "Open",
-                "save": "Save",
-                "save_as": "Save As",
-                "export_png": "Export PNG",
-                "undo": "Undo",
-                "redo": "Redo"
-            },
-            "tools": {
-                "brush": "Brush",
-                "brush_tooltip": "Brush Tool (B)",
-                "fill": "Fill Bucket",
-                "fill_tooltip": "Fill Bucket Tool (F)",
-                "eraser": "Eraser",
-                "eraser_tooltip": "Eraser Tool (E)",
-                "color_picker": "Color Picker",
-                "color_picker_tooltip": "Color Picker Tool (I)",
-                "pan": "Pan",
-                "pan_tooltip": "Pan Tool (H)"
-            },
-            "panels": {
-                "tools_group": "Tools",
-                "color_group": "Color",
-                "canvas_size_group": "Canvas Size",
-                "actions_group": "Actions",
-                "width_label": "Width:",
-                "height_label": "Height:",
-                "resize_canvas": "Resize Canvas",
-                "clear_canvas": "Clear Canvas",
-                "choose_color": "Choose Color",
-                "recent_colors": "Recent Colors:",
-                "current_color_tooltip": "Current Color - Click to choose new color",
-                "background_color_tooltip": "Background Color (used by eraser tool)",
-                "file_menu": "File",
-                "edit_menu": "Edit", 
-                "settings_menu": "Settings",
-                "preferences": "Preferences...",
-                "quit": "Quit",
-                "drawing_canvas": "Drawing Canvas",
-                "canvas_description": "Pixel art drawing canvas, {width} by {height} pixels",
-                "canvas_keyboard_instructions": "Use arrow keys to navigate, Space to draw, tool shortcuts (B/F/E/I/H) to change tools"
-            },
-            "dialogs": {
-                "choose_color_title": "Choose Color",
-                "new_file_title": "New File",
-                "new_file_message": "Are you sure? Unsaved changes will be lost.",
-                "open_file_title": "Open Pixel Art File",
-                "save_file_title": "Save Pixel Art File",
-                "export_png_title": "Export as PNG",
-                "large_canvas_title": "Large Canvas",
-                "large_canvas_message": "Canvas size {width}x{height} may affect performance. Continue?",
-                "invalid_dimensions_title": "Invalid Dimensions",
-                "clear_canvas_title": "Clear Canvas",
-                "clear_canvas_message": "Are you sure you want to clear the canvas?",
-                "success_title": "Success",
-                "file_saved_message": "File saved successfully!",
-                "png_exported_message": "PNG exported successfully!",
-                "error_title_template": "{operation} Error"
-            },
-            "status": {
-                "ready": "Ready",
-                "undone": "Undone",
-                "redone": "Redone",
-                "canvas_resized": "Canvas resized to {width}x{height}",
-                "tool_changed": "Tool: {tool_id}",
-                "pixel_info": "Pixel ({x}, {y}): {color}",
-                "file_opened": "Opened: {filename}",
-                "file_saved": "Saved: {filename}",
-                "file_exported": "Exported: {filename}",
-                "cursor_position": "Cursor at pixel {x}, {y}",
-                "pixel_drawn": "Drew with {tool} at pixel {x}, {y}",
-                "tool_changed_keyboard": "Tool changed to {tool}",
-                "grid_position": "Row {row}, Column {column}",
-                "canvas_state": "Position {x}, {y}, color {color}, tool {tool}",
-                "tool_selected": "{tool} tool selected, shortcut {shortcut}",
-                "color_selected": "Color {color} selected, hex value {hex}",
-                "canvas_operation": "{operation} at position {x}, {y}",
-                "navigation_position": "Position {x}, {y}, {x_percent}% across, {y_percent}% down",
-                "validation_error": "Error: {error}",
-                "file_operation_success": "{operation} successful: {filename}",
-                "file_operation_failed": "{operation} failed: {filename}",
-                "button_activated": "{button} button activated",
-                "menu_navigation": "{menu} menu, {item}",
-                "dialog_opened": "{title} dialog opened",
-                "value_changed": "{control} changed to {value}",
-                "selection_changed": "{item} selected"
-            },
-            "errors": {
-                "coords_out_of_bounds": "Coordinates out of bounds",
-                "invalid_color": "Invalid color",
-                "invalid_dimensions": "Invalid canvas dimensions",
-                "dimensions_must_be_integers": "Canvas dimensions must be integers",
-                "dimensions_too_small": "Canvas dimensions must be at least {min_size}x{min_size}",
-                "dimensions_too_large": "Canvas dimensions cannot exceed {max_size}x{max_size}",
-                "file_path_empty": "File path cannot be empty",
-                "file_not_exists": "File does not exist: {path}",
-                "path_not_file": "Path is not a file: {path}",
-                "file_not_readable": "File is not readable: {path}",
-                "directory_not_exists": "Directory does not exist: {path}",
-                "file_not_writable": "File is not writable: {path}",
-                "directory_not_writable": "Directory is not writable: {path}",
-                "save_failed": "Failed to save file: {error}",
-                "export_failed": "Failed to export PNG: {error}"
-            },
-            "file_filters": {
-                "json_files": "JSON files (*.json)",
-                "png_files": "PNG files (*.png)"
-            },
-            "preferences": {
-                "preferences_title": "Preferences",
-                "language_settings": "Language",
-                "ui_settings": "Interface",
-                "canvas_settings": "Canvas",
-                "language_selection": "Language Selection",
-                "interface_language": "Interface Language:",
-                "language_restart_note": "Language changes take effect immediately.",
-                "appearance": "Appearance",
-                "enable_dark_mode": "Enable dark mode (coming soon)",
-                "performance": "Performance",
-                "smooth_scrolling": "Smooth scrolling",
-                "hardware_acceleration": "Hardware acceleration",
-                "default_canvas": "Default Canvas",
-                "default_width": "Default Width:",
-                "default_height": "Default Height:",
-                "grid_settings": "Grid",
-                "show_grid": "Show grid lines",
-                "language_changed_title": "Language Changed",
-                "language_changed_message": "The interface language has been changed successfully.",
-                "language_error_title": "Language Error",
-                "language_error_message": "Failed to change language. Please try again."
-            }
-        }
\ No newline at end of file
+            return key
\ No newline at end of file
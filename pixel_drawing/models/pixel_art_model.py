@@ -1,16 +1,169 @@
 """Data model for pixel art, managing canvas data and business logic."""
 
-from typing import Tuple, Optional, List, Dict
+import base64
+import binascii
+import sys
+import zlib
+from array import array
+from bisect import bisect_right
+from typing import Tuple, Optional, List, Dict, Iterable, Iterator, Sequence
 from PyQt6.QtCore import QObject, pyqtSignal
 from PyQt6.QtGui import QColor
 
 from ..constants import AppConstants
 from ..validators import validate_canvas_dimensions
 from ..exceptions import ValidationError
-from ..commands import CommandHistory, SetPixelCommand
+from ..commands import CommandHistory, SetPixelCommand, SetMultiplePixelsCommand
 from ..i18n import tr_error
 
 
+# Packed 0xAARRGGBB value of the default background color
+_DEFAULT_BG_RGBA = QColor(AppConstants.DEFAULT_BG_COLOR).rgba()
+
+# Span length after which _scanline_fill checks for a run to the row edge
+_LONG_RUN = 8
+
+
+def _scanline_fill(pixels: array, width: int, height: int, start_x: int, start_y: int,
+                   target: int, replacement: int) -> List[Tuple[int, int, int]]:
+    """Flood fill a packed pixel buffer in place using horizontal spans.
+    
+    Recolors whole runs of the target color at once and queues a single seed
+    per run of target pixels in the rows above and below. Recolored pixels
+    no longer match the target, so no visited set is needed. The kernel only
+    touches integers and the buffer, keeping it free of Qt objects.
+    
+    Args:
+        pixels: Row-major packed pixel buffer, modified in place
+        width: Buffer width in pixels
+        height: Buffer height in pixels
+        start_x: Seed X coordinate
+        start_y: Seed Y coordinate
+        target: Packed color being replaced
+        replacement: Packed color to fill with (must differ from target)
+        
+    Returns:
+        Filled spans as (y, left, right) tuples with inclusive x bounds
+    """
+    long_run = _LONG_RUN
+    target_row = array('I', [target]) * width
+    replacement_row = array('I', [replacement]) * width
+    spans = []
+    
+    # Seeds are linear indices on an int array that grows only as deep as
+    # the fill needs, so small fills stay cheap and no tuple is allocated
+    # per push.
+    stack = array('i', [start_y * width + start_x])
+    
+    while stack:
+        index = stack.pop()
+        if pixels[index] != target:
+            continue
+        y, x = divmod(index, width)
+        row = index - x
+        
+        # Extend the span left and right along the row. Once a run proves
+        # long, test whether it reaches the edge with one C-level slice
+        # comparison instead of stepping pixel by pixel.
+        left = x
+        while left > 0 and pixels[row + left - 1] == target:
+            left -= 1
+            if x - left == long_run and pixels[row:row + left] == target_row[:left]:
+                left = 0
+        right = x
+        last = width - 1
+        while right < last and pixels[row + right + 1] == target:
+            right += 1
+            if right - x == long_run and pixels[row + right + 1:row + width] == target_row[right + 1:]:
+                right = last
+        
+        pixels[row + left:row + right + 1] = replacement_row[:right - left + 1]
+        spans.append((y, left, right))
+        
+        for next_y in (y - 1, y + 1):
+            if not 0 <= next_y < height:
+                continue
+            # Scan a copied slice of the adjacent row; the membership test
+            # runs in C and skips rows with nothing left to fill (such as
+            # the row this span was seeded from)
+            first = next_y * width + left
+            segment = pixels[first:first + right - left + 1]
+            if target not in segment:
+                continue
+            if segment == target_row[:len(segment)]:
+                # One run covers the whole segment and needs a single seed
+                stack.append(first)
+                continue
+            in_run = False
+            for offset, value in enumerate(segment):
+                if value == target:
+                    if not in_run:
+                        stack.append(first + offset)
+                        in_run = True
+                else:
+                    in_run = False
+    
+    return spans
+
+
+class _SpanPixels(Sequence):
+    """Read-only sequence of the (x, y) coordinates covered by fill spans.
+    
+    flood_fill reports every pixel it changed, but callers mostly need only
+    the count. Coordinates are therefore produced from the spans on demand
+    instead of allocating a tuple per filled pixel up front. Coordinates run
+    row by row in fill order, and the sequence compares equal to any other
+    sequence holding the same coordinates in that order, such as a list.
+    """
+    
+    def __init__(self, spans: List[Tuple[int, int, int]]):
+        """Initialize from filled spans.
+        
+        Args:
+            spans: Filled spans as (y, left, right) tuples with inclusive x bounds
+        """
+        self._spans = spans
+        self._offsets: List[int] = []
+        total = 0
+        for _, left, right in spans:
+            self._offsets.append(total)
+            total += right - left + 1
+        self._length = total
+    
+    def __len__(self) -> int:
+        return self._length
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(other) == self._length and all(a == b for a, b in zip(self, other))
+    
+    __hash__ = None
+    
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        for y, left, right in self._spans:
+            for x in range(left, right + 1):
+                yield (x, y)
+    
+    def __contains__(self, item) -> bool:
+        try:
+            x, y = item
+        except (TypeError, ValueError):
+            return False
+        return any(span_y == y and left <= x <= right for span_y, left, right in self._spans)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("fill pixel index out of range")
+        span = bisect_right(self._offsets, index) - 1
+        y, left, _ = self._spans[span]
+        return (left + index - self._offsets[span], y)
+
+
 class PixelArtModel(QObject):
     """Data model for pixel art, managing canvas data and business logic.
     
@@ -19,6 +172,10 @@ class PixelArtModel(QObject):
     application. It provides signals for UI updates and maintains the integrity
     of the canvas data.
     
+    Pixels are stored in a flat, row-major ``array('I')`` of packed 0xAARRGGBB
+    values (index ``y * width + x``) rather than a dictionary of QColor
+    objects, keeping memory contiguous and bulk operations cheap.
+    
     Attributes:
         width: Canvas width in pixels (read-only)
         height: Canvas height in pixels (read-only) 
@@ -27,6 +184,8 @@ class PixelArtModel(QObject):
         
     Signals:
         pixel_changed(int, int, QColor): Emitted when a pixel color changes
+        region_changed(int, int, int, int): Emitted once with the bounding
+            rectangle (x, y, width, height) of a bulk edit such as a flood fill
         canvas_resized(int, int): Emitted when canvas dimensions change
         canvas_cleared(): Emitted when canvas is cleared
         model_loaded(): Emitted when a file is loaded into the model
@@ -35,6 +194,7 @@ class PixelArtModel(QObject):
     
     # Signals for model changes
     pixel_changed = pyqtSignal(int, int, QColor)  # x, y, new_color
+    region_changed = pyqtSignal(int, int, int, int)  # x, y, width, height
     canvas_resized = pyqtSignal(int, int)  # new_width, new_height
     canvas_cleared = pyqtSignal()
     model_loaded = pyqtSignal()
@@ -60,15 +220,25 @@ class PixelArtModel(QObject):
         
         self._width = width
         self._height = height
-        self._pixels: Dict[Tuple[int, int], QColor] = {}
+        self._pixels = self._new_pixel_buffer(width, height)
         self._current_file: Optional[str] = None
         self._is_modified = False
         
         # Command-based undo/redo system
         self._command_history = CommandHistory(AppConstants.MAX_UNDO_HISTORY)
+    
+    @staticmethod
+    def _new_pixel_buffer(width: int, height: int) -> array:
+        """Create a packed pixel buffer filled with the background color.
         
-        # Initialize with default background color (don't mark as modified)
-        self._pixels.clear()  # Start with empty pixels dict
+        Args:
+            width: Buffer width in pixels
+            height: Buffer height in pixels
+            
+        Returns:
+            Row-major array of packed 0xAARRGGBB values
+        """
+        return array('I', [_DEFAULT_BG_RGBA]) * (width * height)
     
     @property
     def width(self) -> int:
@@ -122,7 +292,54 @@ class PixelArtModel(QObject):
         if not (0 <= x < self._width and 0 <= y < self._height):
             raise ValidationError(tr_error(AppConstants.ERROR_COORDS_OUT_OF_BOUNDS))
         
-        return self._pixels.get((x, y), QColor(AppConstants.DEFAULT_BG_COLOR))
+        return QColor.fromRgba(self._pixels[y * self._width + x])
+    
+    def get_pixel_rgba(self, x: int, y: int) -> int:
+        """Get the packed color value of pixel at coordinates.
+        
+        Cheaper than get_pixel when only the color value is needed, as no
+        QColor object is created.
+        
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            
+        Returns:
+            Color as a packed 0xAARRGGBB integer
+            
+        Raises:
+            ValidationError: If coordinates are out of bounds
+        """
+        if not (0 <= x < self._width and 0 <= y < self._height):
+            raise ValidationError(tr_error(AppConstants.ERROR_COORDS_OUT_OF_BOUNDS))
+        
+        return self._pixels[y * self._width + x]
+    
+    def get_pixels_rgba(self, xs: array, ys: array) -> array:
+        """Get the packed color values of many pixels in one call.
+        
+        Bounds are checked once for the whole batch rather than per pixel.
+        
+        Args:
+            xs: X coordinates
+            ys: Y coordinates, parallel to xs
+        
+        Returns:
+            Packed 0xAARRGGBB colors as an array('I'), parallel to xs
+        
+        Raises:
+            ValidationError: If any coordinate is out of bounds
+        """
+        if not xs:
+            return array('I')
+        
+        if not (0 <= min(xs) and max(xs) < self._width and
+                0 <= min(ys) and max(ys) < self._height):
+            raise ValidationError(tr_error(AppConstants.ERROR_COORDS_OUT_OF_BOUNDS))
+        
+        pixels = self._pixels
+        width = self._width
+        return array('I', [pixels[y * width + x] for x, y in zip(xs, ys)])
     
     def set_pixel(self, x: int, y: int, color: QColor) -> bool:
         """Set color of pixel at coordinates.
@@ -150,8 +367,7 @@ class PixelArtModel(QObject):
             log_error("model", f"set_pixel validation failed: {error_msg} - {color}")
             raise ValidationError(error_msg)
         
-        old_color = self.get_pixel(x, y)
-        if old_color == color:
+        if self._pixels[y * self._width + x] == color.rgba():
             return False
         
         # Use command pattern for undo/redo
@@ -159,45 +375,210 @@ class PixelArtModel(QObject):
         self._command_history.execute_command(command)
         return True
     
-    def _set_pixel_direct(self, x: int, y: int, color: QColor) -> None:
-        """Set pixel directly without undo/redo (used by commands).
+    def set_pixel_rgba(self, x: int, y: int, rgba: int) -> bool:
+        """Set pixel at coordinates from a packed color value.
+        
+        Cheaper than set_pixel for callers that already hold the packed
+        value, as no QColor is involved.
         
         Args:
             x: X coordinate
             y: Y coordinate
+            rgba: Packed 0xAARRGGBB color to set
+        
+        Returns:
+            True if pixel was changed, False if it was already that color
+        
+        Raises:
+            ValidationError: If coordinates are out of bounds
+        """
+        if not (0 <= x < self._width and 0 <= y < self._height):
+            from ..utils.logging import log_error
+            error_msg = tr_error(AppConstants.ERROR_COORDS_OUT_OF_BOUNDS)
+            log_error("model", f"set_pixel_rgba validation failed: {error_msg}")
+            raise ValidationError(error_msg)
+        
+        if self._pixels[y * self._width + x] == rgba:
+            return False
+        
+        command = SetPixelCommand._from_rgba(self, x, y, rgba)
+        self._command_history.execute_command(command)
+        return True
+    
+    def set_pixels(self, points: Iterable[Tuple[int, int]], color: QColor) -> bool:
+        """Set many pixels to one color as a single undoable change.
+        
+        Views are notified with one region_changed for the bounding box of
+        the pixels that actually changed.
+        
+        Args:
+            points: Coordinates of the pixels to set
             color: Color to set
+        
+        Returns:
+            True if any pixel was changed
+        
+        Raises:
+            ValidationError: If any coordinate is out of bounds or color is invalid
         """
-        # Memory optimization: remove default color pixels instead of storing them
-        default_color = QColor(AppConstants.DEFAULT_BG_COLOR)
-        if color == default_color:
-            self._pixels.pop((x, y), None)  # Remove if exists
-        else:
-            self._pixels[(x, y)] = QColor(color)
+        if not color.isValid():
+            from ..utils.logging import log_error
+            error_msg = tr_error(AppConstants.ERROR_INVALID_COLOR)
+            log_error("model", f"set_pixels validation failed: {error_msg} - {color}")
+            raise ValidationError(error_msg)
+        
+        return self.set_pixels_rgba(points, color.rgba())
+    
+    def set_pixels_rgba(self, points: Iterable[Tuple[int, int]], rgba: int) -> bool:
+        """Set many pixels to one packed color as a single undoable change.
+        
+        Args:
+            points: Coordinates of the pixels to set
+            rgba: Packed 0xAARRGGBB color to set
+        
+        Returns:
+            True if any pixel was changed
         
+        Raises:
+            ValidationError: If any coordinate is out of bounds
+        """
+        pixels = self._pixels
+        width = self._width
+        height = self._height
+        
+        # Buffer index -> packed color before the change
+        changes: Dict[int, int] = {}
+        for x, y in points:
+            if not (0 <= x < width and 0 <= y < height):
+                raise ValidationError(tr_error(AppConstants.ERROR_COORDS_OUT_OF_BOUNDS))
+            index = y * width + x
+            old_rgba = pixels[index]
+            if old_rgba != rgba:
+                changes[index] = old_rgba
+        
+        if not changes:
+            return False
+        
+        command = SetMultiplePixelsCommand._from_arrays(
+            self,
+            array('i', [index % width for index in changes]),
+            array('i', [index // width for index in changes]),
+            array('I', [rgba]) * len(changes),
+            array('I', changes.values())
+        )
+        self._command_history.execute_command(command)
+        return True
+    
+    def _set_pixel_direct(self, x: int, y: int, rgba: int) -> None:
+        """Set pixel directly without undo/redo (used by commands).
+        
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            rgba: Packed 0xAARRGGBB color to set
+        """
+        # Commands recorded before the canvas shrank may point past it
+        if x >= self._width or y >= self._height:
+            return
+        
+        self._pixels[y * self._width + x] = rgba
         self._is_modified = True
-        self.pixel_changed.emit(x, y, color)
+        self.pixel_changed.emit(x, y, QColor.fromRgba(rgba))
+    
+    def _set_pixels_direct(self, xs: array, ys: array, rgbas: array) -> None:
+        """Set many pixels directly without undo/redo (used by commands).
+        
+        Emits a single region_changed for the bounding box of the edit
+        instead of one pixel_changed per pixel.
+        
+        Args:
+            xs: X coordinates
+            ys: Y coordinates, parallel to xs
+            rgbas: Packed 0xAARRGGBB colors, parallel to xs
+        """
+        if not xs:
+            return
+        
+        width = self._width
+        height = self._height
+        if max(xs) >= width or max(ys) >= height:
+            # Commands recorded before the canvas shrank may point past it
+            kept = [i for i in range(len(xs)) if xs[i] < width and ys[i] < height]
+            if not kept:
+                return
+            xs = array('i', [xs[i] for i in kept])
+            ys = array('i', [ys[i] for i in kept])
+            rgbas = array('I', [rgbas[i] for i in kept])
+        
+        pixels = self._pixels
+        for x, y, rgba in zip(xs, ys, rgbas):
+            pixels[y * width + x] = rgba
+        self._is_modified = True
+        
+        min_x, min_y = min(xs), min(ys)
+        self.region_changed.emit(min_x, min_y, max(xs) - min_x + 1, max(ys) - min_y + 1)
     
     def get_all_pixels(self) -> Dict[Tuple[int, int], QColor]:
-        """Get all pixels as a dictionary.
+        """Get all non-background pixels as a dictionary.
         
         Returns:
             Dictionary mapping coordinates to colors
         """
-        return self._pixels.copy()
+        width = self._width
+        return {(i % width, i // width): QColor.fromRgba(rgba)
+                for i, rgba in enumerate(self._pixels) if rgba != _DEFAULT_BG_RGBA}
+    
+    def get_pixel_buffer(self) -> memoryview:
+        """Get a read-only view of the packed pixel data.
+        
+        The view shares memory with the model, so no copy is made; it
+        reflects later edits until the buffer is replaced by a resize or load.
+        
+        Returns:
+            Byte view of row-major 32-bit 0xAARRGGBB values in native byte order
+        """
+        return memoryview(self._pixels).cast('B').toreadonly()
     
     def clear(self) -> None:
         """Clear entire canvas to default background color.
         
         Resets all pixels to the default background color (white) and marks
         the model as modified. Emits canvas_cleared signal to notify UI.
-        Uses memory optimization by not storing default color pixels.
         """
-        # Memory optimization: don't store default color pixels
-        self._pixels.clear()
+        self._pixels[:] = self._new_pixel_buffer(self._width, self._height)
         
         self._is_modified = True
         self.canvas_cleared.emit()
     
+    def reset(self, width: int = AppConstants.DEFAULT_CANVAS_WIDTH,
+              height: int = AppConstants.DEFAULT_CANVAS_HEIGHT) -> None:
+        """Reset the model to a blank, unsaved canvas.
+        
+        Lets a new document reuse this model, keeping every existing signal
+        connection, instead of replacing it with a fresh instance.
+        
+        Args:
+            width: Canvas width in pixels (1-256, default: 32)
+            height: Canvas height in pixels (1-256, default: 32)
+        
+        Raises:
+            ValidationError: If width or height are outside valid range
+        """
+        validate_canvas_dimensions(width, height)
+        
+        old_width, old_height = self._width, self._height
+        self._width = width
+        self._height = height
+        self._pixels = self._new_pixel_buffer(width, height)
+        self._current_file = None
+        self._is_modified = False
+        self._command_history.clear()
+        
+        if old_width != width or old_height != height:
+            self.canvas_resized.emit(width, height)
+        
+        self.model_loaded.emit()
+    
     def resize(self, new_width: int, new_height: int) -> None:
         """Resize canvas, preserving existing pixels.
         
@@ -213,25 +594,40 @@ class PixelArtModel(QObject):
         if new_width == self._width and new_height == self._height:
             return
         
-        new_pixels = {}
-        default_color = QColor(AppConstants.DEFAULT_BG_COLOR)
+        old_width = self._width
+        old_pixels = self._pixels
+        copy_height = min(new_height, self._height)
         
-        # Copy existing pixels and fill new areas
-        for x in range(new_width):
-            for y in range(new_height):
-                if x < self._width and y < self._height:
-                    new_pixels[(x, y)] = self.get_pixel(x, y)
-                else:
-                    new_pixels[(x, y)] = default_color
+        if new_width == old_width:
+            # Rows keep their layout, so the overlap is one contiguous block
+            new_pixels = old_pixels[:new_width * copy_height]
+            new_pixels.extend(self._new_pixel_buffer(new_width, new_height - copy_height))
+        else:
+            # Append the overlapping part of each row straight from the old
+            # buffer's memory, padding widened rows with the background, so
+            # every pixel is written once and no temporary row arrays are made
+            copy_width = min(new_width, old_width)
+            padding = self._new_pixel_buffer(new_width - copy_width, 1)
+            itemsize = old_pixels.itemsize
+            row_bytes = old_width * itemsize
+            copy_bytes = copy_width * itemsize
+            new_pixels = array('I')
+            with memoryview(old_pixels).cast('B') as old_bytes:
+                for src in range(0, copy_height * row_bytes, row_bytes):
+                    new_pixels.frombytes(old_bytes[src:src + copy_bytes])
+                    new_pixels.extend(padding)
+            new_pixels.extend(self._new_pixel_buffer(new_width, new_height - copy_height))
         
         self._width = new_width
         self._height = new_height
         self._pixels = new_pixels
         self._is_modified = True
+        # Keep the undo history, but start a new step with the next edit
+        self._command_history.end_merge_window()
         
         self.canvas_resized.emit(new_width, new_height)
     
-    def flood_fill(self, start_x: int, start_y: int, new_color: QColor) -> List[Tuple[int, int]]:
+    def flood_fill(self, start_x: int, start_y: int, new_color: QColor) -> Sequence[Tuple[int, int]]:
         """Perform flood fill starting from given coordinates.
         
         Args:
@@ -240,7 +636,8 @@ class PixelArtModel(QObject):
             new_color: Color to fill with
             
         Returns:
-            List of coordinates that were changed
+            Read-only sequence of the (x, y) coordinates that were changed,
+            equal to a list of the same coordinates; empty if nothing changed
             
         Raises:
             ValidationError: If coordinates are out of bounds or color is invalid
@@ -251,41 +648,42 @@ class PixelArtModel(QObject):
         if not new_color.isValid():
             raise ValidationError("Invalid fill color")
         
-        target_color = self.get_pixel(start_x, start_y)
-        if target_color == new_color:
-            return []
-        
-        changed_pixels = []
-        stack = [(start_x, start_y)]
-        visited = set()
+        pixels = self._pixels
+        width = self._width
+        target_rgba = pixels[start_y * width + start_x]
+        new_rgba = new_color.rgba()
+        if target_rgba == new_rgba:
+            return _SpanPixels([])
+        
+        height = self._height
+        if pixels.count(target_rgba) == len(pixels):
+            # Monochrome canvas (e.g. filling a blank one): the fill covers
+            # every pixel, so overwrite the buffer without walking it
+            pixels[:] = array('I', [new_rgba]) * len(pixels)
+            spans = [(y, 0, width - 1) for y in range(height)]
+        else:
+            spans = _scanline_fill(pixels, width, height, start_x, start_y,
+                                   target_rgba, new_rgba)
+        changed_pixels = _SpanPixels(spans)
+        min_x = min(left for _, left, _ in spans)
+        max_x = max(right for _, _, right in spans)
+        min_y = min(y for y, _, _ in spans)
+        max_y = max(y for y, _, _ in spans)
         
-        while stack:
-            x, y = stack.pop()
-            if (x, y) in visited:
-                continue
-            if not (0 <= x < self._width and 0 <= y < self._height):
-                continue
-            if self.get_pixel(x, y) != target_color:
-                continue
-            
-            visited.add((x, y))
-            self._pixels[(x, y)] = QColor(new_color)
-            changed_pixels.append((x, y))
-            
-            # Add neighboring pixels
-            stack.extend([(x+1, y), (x-1, y), (x, y+1), (x, y-1)])
+        self._is_modified = True
         
-        if changed_pixels:
-            self._is_modified = True
-            # Emit signal for each changed pixel
-            for x, y in changed_pixels:
-                self.pixel_changed.emit(x, y, new_color)
+        # Notify views once with the bounding box instead of once per pixel
+        self.region_changed.emit(min_x, min_y, max_x - min_x + 1, max_y - min_y + 1)
         
         return changed_pixels
     
     def load_from_dict(self, data: Dict) -> None:
         """Load model from dictionary data.
         
+        Pixels may be given either as a base64 encoded packed buffer (the
+        format written by to_dict) or as the legacy ``{"x,y": "#RRGGBB"}``
+        dictionary.
+        
         Args:
             data: Dictionary containing width, height, and pixels
             
@@ -310,58 +708,142 @@ class PixelArtModel(QObject):
             log_error("model", f"Model load validation failed: {str(e)}")
             raise
         
-        if not isinstance(data["pixels"], dict):
-            error_msg = "Pixels data must be a dictionary"
+        pixel_data = data["pixels"]
+        if isinstance(pixel_data, str):
+            new_pixels = self._decode_pixel_buffer(pixel_data, width, height,
+                                                   data.get("compression"))
+        elif isinstance(pixel_data, dict):
+            new_pixels = self._parse_legacy_pixels(pixel_data, width, height)
+        else:
+            error_msg = "Pixels data must be a base64 string or a dictionary"
             log_error("model", f"Model load validation failed: {error_msg}")
             raise ValidationError(error_msg)
         
-        # Parse and validate pixel data
-        new_pixels = {}
+        # Apply loaded data
+        old_width, old_height = self._width, self._height
+        self._width = width
+        self._height = height
+        self._pixels = new_pixels
+        self._is_modified = False
+        self._command_history.clear()
+        
+        # Emit appropriate signals
+        if old_width != width or old_height != height:
+            self.canvas_resized.emit(width, height)
+        
+        self.model_loaded.emit()
+    
+    def _decode_pixel_buffer(self, encoded: str, width: int, height: int,
+                             compression: Optional[str] = None) -> array:
+        """Decode a base64 packed pixel buffer.
+        
+        Args:
+            encoded: Base64 string of little-endian 0xAARRGGBB words
+            width: Canvas width in pixels
+            height: Canvas height in pixels
+            compression: "zlib" if the words were compressed before encoding,
+                None for a plain buffer
+            
+        Returns:
+            Row-major packed pixel buffer
+            
+        Raises:
+            ValidationError: If the data is not valid base64, cannot be
+                decompressed or has the wrong size
+        """
+        from ..utils.logging import log_error
+        
+        new_pixels = array('I')
+        expected_size = width * height * new_pixels.itemsize
+        
+        try:
+            raw = base64.b64decode(encoded, validate=True)
+            if compression == AppConstants.PIXEL_COMPRESSION_ZLIB:
+                # Never inflate past one byte more than a valid buffer needs
+                raw = zlib.decompressobj().decompress(raw, expected_size + 1)
+            elif compression is not None:
+                raise ValueError(f"unsupported compression {compression!r}")
+        except (binascii.Error, zlib.error, ValueError) as e:
+            error_msg = f"Invalid pixel data: {e}"
+            log_error("model", f"Model load pixel validation failed: {error_msg}")
+            raise ValidationError(error_msg)
+        
+        if len(raw) != expected_size:
+            error_msg = f"Invalid pixel data: expected {expected_size} bytes, got {len(raw)}"
+            log_error("model", f"Model load pixel validation failed: {error_msg}")
+            raise ValidationError(error_msg)
+        
+        new_pixels.frombytes(raw)
+        if sys.byteorder != "little":
+            new_pixels.byteswap()
+        return new_pixels
+    
+    def _parse_legacy_pixels(self, pixel_data: Dict, width: int, height: int) -> array:
+        """Parse the legacy ``{"x,y": "#RRGGBB"}`` pixel dictionary.
+        
+        Args:
+            pixel_data: Dictionary mapping "x,y" strings to color names
+            width: Canvas width in pixels
+            height: Canvas height in pixels
+            
+        Returns:
+            Row-major packed pixel buffer
+            
+        Raises:
+            ValidationError: If a coordinate or color is invalid
+        """
+        from ..utils.logging import log_error
+        
         # Initialize all pixels with default background color first
-        for x in range(width):
-            for y in range(height):
-                new_pixels[(x, y)] = QColor(AppConstants.DEFAULT_BG_COLOR)
+        new_pixels = self._new_pixel_buffer(width, height)
+        # Pixel art uses a handful of distinct colors, so each hex string is
+        # parsed once rather than once per pixel
+        parsed_colors: Dict[str, int] = {}
         
         # Then override with loaded pixel data
-        for coord_str, color_str in data["pixels"].items():
+        for coord_str, color_str in pixel_data.items():
             try:
                 x, y = map(int, coord_str.split(','))
                 if not (0 <= x < width and 0 <= y < height):
                     raise ValueError(f"Pixel coordinate out of bounds: ({x}, {y})")
                 
-                color = QColor(color_str)
-                if not color.isValid():
-                    raise ValueError(f"Invalid color: {color_str}")
+                rgba = parsed_colors.get(color_str)
+                if rgba is None:
+                    color = QColor(color_str)
+                    if not color.isValid():
+                        raise ValueError(f"Invalid color: {color_str}")
+                    rgba = parsed_colors[color_str] = color.rgba()
                 
-                new_pixels[(x, y)] = color
+                new_pixels[y * width + x] = rgba
             except ValueError as e:
                 error_msg = f"Invalid pixel data: {e}"
                 log_error("model", f"Model load pixel validation failed: {error_msg}")
                 raise ValidationError(error_msg)
         
-        # Apply loaded data
-        old_width, old_height = self._width, self._height
-        self._width = width
-        self._height = height
-        self._pixels = new_pixels
-        self._is_modified = False
-        
-        # Emit appropriate signals
-        if old_width != width or old_height != height:
-            self.canvas_resized.emit(width, height)
-        
-        self.model_loaded.emit()
+        return new_pixels
     
     def to_dict(self) -> Dict:
         """Convert model to dictionary for serialization.
         
+        Pixels are stored as a zlib compressed, base64 encoded buffer of
+        little-endian 0xAARRGGBB words in row-major order. Pixel art is
+        dominated by runs of identical words, so this is a fraction of the
+        raw buffer size.
+        
         Returns:
-            Dictionary containing width, height, and pixels
+            Dictionary containing width, height, pixel format and pixels
         """
+        pixels = self._pixels
+        if sys.byteorder != "little":
+            pixels = array('I', pixels)
+            pixels.byteswap()
+        
         return {
             "width": self._width,
             "height": self._height,
-            "pixels": {f"{x},{y}": color.name().upper() for (x, y), color in self._pixels.items()}
+            "format": AppConstants.PIXEL_FORMAT_ARGB32,
+            "compression": AppConstants.PIXEL_COMPRESSION_ZLIB,
+            "pixels": base64.b64encode(zlib.compress(pixels.tobytes())).decode("ascii")
         }
     
     def set_current_file(self, file_path: Optional[str]) -> None:
@@ -9,6 +9,7 @@ and atomic file operations.
 
 import json
 import os
+import sys
 import time
 from typing import Dict, Any
 
@@ -104,7 +105,7 @@ class FileService(QObject):
             
             # Get data from model
             data = model.to_dict()
-            pixel_count = len(data.get('pixels', {}))
+            pixel_bytes = len(data.get('pixels', ''))
             canvas_size = f"{data.get('width', 0)}x{data.get('height', 0)}"
             
             # Write to temporary file first for safety
@@ -129,7 +130,7 @@ class FileService(QObject):
                 # Log successful operation
                 duration_ms = (time.time() - start_time) * 1000
                 log_file_operation("SAVE", file_path, True, duration_ms)
-                log_performance("file_save", duration_ms, f"Canvas: {canvas_size}, Pixels: {pixel_count}")
+                log_performance("file_save", duration_ms, f"Canvas: {canvas_size}, Pixel data: {pixel_bytes} bytes")
                 
                 model.set_current_file(file_path)
                 self.file_saved.emit(file_path)
@@ -175,20 +176,30 @@ class FileService(QObject):
             if not file_path.lower().endswith('.png'):
                 file_path += '.png'
             
-            # Create PIL image
-            img = Image.new("RGB", (model.width, model.height), "white")
-            
-            # Count non-default pixels for performance metrics
-            pixel_count = 0
-            
-            # Set pixels
-            for x in range(model.width):
-                for y in range(model.height):
-                    color = model.get_pixel(x, y)
-                    rgb = color.getRgb()[:3]  # Get RGB values
-                    img.putpixel((x, y), rgb)
-                    if rgb != (255, 255, 255):  # Count non-white pixels
-                        pixel_count += 1
+            # Decode the packed pixel buffer straight to RGB in one call; the
+            # 0xAARRGGBB words are laid out as BGRA bytes on little-endian
+            # hosts and the alpha byte is skipped by the raw decoder
+            raw_mode = "BGRX" if sys.byteorder == "little" else "XRGB"
+            img = Image.frombuffer("RGB", (model.width, model.height),
+                                   model.get_pixel_buffer(), "raw", raw_mode, 0, 1)
+            
+            # Count non-white pixels for performance metrics
+            color_counts = img.getcolors(model.width * model.height)
+            white_count = next((count for count, rgb in color_counts if rgb == (255, 255, 255)), 0)
+            pixel_count = model.width * model.height - white_count
+            
+            # Pixel art rarely uses more than 256 colors; an exact palette
+            # image stores one byte per pixel and compresses far better. The
+            # indices come from an exact lookup of each packed pixel's RGB
+            # bits, as quantize() may map near-identical colors to one entry.
+            if len(color_counts) <= 256:
+                palette_index = {(r << 16) | (g << 8) | b: index
+                                 for index, (_, (r, g, b)) in enumerate(color_counts)}
+                indices = bytes(palette_index[value & 0xFFFFFF]
+                                for value in model.get_pixel_buffer().cast('I'))
+                palette_img = Image.frombytes("P", img.size, indices)
+                palette_img.putpalette([channel for _, rgb in color_counts for channel in rgb])
+                img = palette_img
             
             # Save image
             img.save(file_path, "PNG", optimize=True)
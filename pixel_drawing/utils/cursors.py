@@ -1,10 +1,37 @@
 """Cursor management utilities for drawing tools."""
 
 import os
+from functools import lru_cache
 from typing import Dict, Optional
 from PyQt6.QtGui import QCursor, QPixmap, QPainter
 from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtSvg import QSvgRenderer
+
+from .icon_cache import get_svg_renderer
+
+
+@lru_cache(maxsize=None)
+def _render_cursor_pixmap(icon_path: str, size: int) -> QPixmap:
+    """Render an SVG icon into a transparent cursor pixmap.
+    
+    The result only depends on the file and size, so it is rendered once per
+    process and shared by every CursorManager.
+    
+    Args:
+        icon_path: Path to SVG icon file
+        size: Width and height of the pixmap in pixels
+        
+    Returns:
+        QPixmap containing the rendered icon
+    """
+    renderer = get_svg_renderer(icon_path)
+    pixmap = QPixmap(size, size)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    
+    painter = QPainter(pixmap)
+    renderer.render(painter)
+    painter.end()
+    
+    return pixmap
 
 
 class CursorManager:
@@ -74,13 +101,7 @@ class CursorManager:
                 return None
             
             # Create pixmap from SVG
-            renderer = QSvgRenderer(icon_path)
-            pixmap = QPixmap(self._cursor_size, self._cursor_size)
-            pixmap.fill(Qt.GlobalColor.transparent)
-            
-            painter = QPainter(pixmap)
-            renderer.render(painter)
-            painter.end()
+            pixmap = _render_cursor_pixmap(icon_path, self._cursor_size)
             
             # Create cursor with hot spot at center
             hot_spot_x = self._cursor_size // 2
@@ -1,6 +1,6 @@
 """Efficient dirty rectangle management for optimized canvas updates."""
 
-from typing import Set, Tuple, List, Optional
+from typing import Set, Tuple, List
 from PyQt6.QtCore import QRect
 
 
@@ -11,6 +11,10 @@ class DirtyRegionManager:
     - Merging overlapping dirty rectangles
     - Coalescing nearby regions to reduce update calls
     - Managing spatial locality for better cache performance
+    
+    Dirty pixels are folded into bounding boxes as they are marked, so a
+    burst of edits between two repaints costs O(regions) per pixel instead
+    of clustering every pixel pairwise when the update is flushed.
     """
     
     def __init__(self, pixel_size: int = 16, merge_threshold: int = 3):
@@ -22,8 +26,8 @@ class DirtyRegionManager:
         """
         self._pixel_size = pixel_size
         self._merge_threshold = merge_threshold
-        self._dirty_pixels: Set[Tuple[int, int]] = set()
-        self._dirty_rects: List[QRect] = []
+        # Each region is [min_x, min_y, max_x, max_y] in pixel coordinates
+        self._dirty_regions: List[List[int]] = []
     
     def mark_pixel_dirty(self, x: int, y: int) -> None:
         """Mark a single pixel as dirty.
@@ -32,7 +36,21 @@ class DirtyRegionManager:
             x: Pixel X coordinate
             y: Pixel Y coordinate
         """
-        self._dirty_pixels.add((x, y))
+        threshold = self._merge_threshold
+        for region in self._dirty_regions:
+            if (region[0] - threshold <= x <= region[2] + threshold and
+                    region[1] - threshold <= y <= region[3] + threshold):
+                if x < region[0]:
+                    region[0] = x
+                elif x > region[2]:
+                    region[2] = x
+                if y < region[1]:
+                    region[1] = y
+                elif y > region[3]:
+                    region[3] = y
+                return
+        
+        self._dirty_regions.append([x, y, x, y])
     
     def mark_pixels_dirty(self, pixels: Set[Tuple[int, int]]) -> None:
         """Mark multiple pixels as dirty efficiently.
@@ -40,7 +58,22 @@ class DirtyRegionManager:
         Args:
             pixels: Set of (x, y) pixel coordinates
         """
-        self._dirty_pixels.update(pixels)
+        for x, y in pixels:
+            self.mark_pixel_dirty(x, y)
+    
+    def mark_region_dirty(self, x: int, y: int, width: int, height: int) -> None:
+        """Mark a rectangular block of pixels as dirty.
+        
+        Bulk edits such as flood fills already know their bounding box, so it
+        is recorded as one region and merged with its neighbours on flush.
+        
+        Args:
+            x: Left pixel coordinate
+            y: Top pixel coordinate
+            width: Region width in pixels
+            height: Region height in pixels
+        """
+        self._dirty_regions.append([x, y, x + width - 1, y + height - 1])
     
     def get_update_rectangles(self) -> List[QRect]:
         """Get optimized update rectangles for current dirty regions.
@@ -48,121 +81,59 @@ class DirtyRegionManager:
         Returns:
             List of QRect objects representing screen regions to update
         """
-        if not self._dirty_pixels:
+        if not self._dirty_regions:
             return []
         
-        # Convert pixels to screen rectangles and optimize
-        self._optimize_dirty_regions()
+        self._merge_nearby_regions()
         
-        # Return copy and clear internal state
-        result = self._dirty_rects.copy()
+        result = [self._region_to_rect(region) for region in self._dirty_regions]
         self.clear()
         return result
     
-    def _optimize_dirty_regions(self) -> None:
-        """Convert dirty pixels to optimized rectangles."""
-        if not self._dirty_pixels:
-            return
-        
-        # Group pixels into clusters for efficient rectangle generation
-        pixel_clusters = self._cluster_pixels()
-        
-        # Convert clusters to rectangles
-        self._dirty_rects = []
-        for cluster in pixel_clusters:
-            rect = self._pixels_to_rect(cluster)
-            self._dirty_rects.append(rect)
-    
-    def _cluster_pixels(self) -> List[Set[Tuple[int, int]]]:
-        """Group nearby pixels into clusters for rectangle optimization.
-        
-        Returns:
-            List of pixel clusters, each representing a connected region
-        """
-        unprocessed = self._dirty_pixels.copy()
-        clusters = []
-        
-        while unprocessed:
-            # Start new cluster with arbitrary pixel
-            seed_pixel = unprocessed.pop()
-            cluster = {seed_pixel}
-            
-            # Grow cluster by adding nearby pixels
-            self._grow_cluster(cluster, unprocessed)
-            clusters.append(cluster)
-        
-        return clusters
-    
-    def _grow_cluster(self, cluster: Set[Tuple[int, int]], 
-                     unprocessed: Set[Tuple[int, int]]) -> None:
-        """Grow a pixel cluster by adding nearby pixels.
-        
-        Args:
-            cluster: Current cluster to grow
-            unprocessed: Set of unprocessed pixels to consider
-        """
-        added_pixels = True
-        while added_pixels:
-            added_pixels = False
-            to_add = set()
-            
-            for cluster_pixel in cluster:
-                for unprocessed_pixel in unprocessed:
-                    if self._pixels_nearby(cluster_pixel, unprocessed_pixel):
-                        to_add.add(unprocessed_pixel)
-                        added_pixels = True
-            
-            # Add nearby pixels to cluster
-            cluster.update(to_add)
-            unprocessed.difference_update(to_add)
+    def _merge_nearby_regions(self) -> None:
+        """Merge regions that grew close to each other after being created."""
+        threshold = self._merge_threshold
+        regions = self._dirty_regions
+        merged = True
+        while merged:
+            merged = False
+            i = 0
+            while i < len(regions):
+                a = regions[i]
+                j = len(regions) - 1
+                while j > i:
+                    b = regions[j]
+                    if (b[0] - threshold <= a[2] and a[0] - threshold <= b[2] and
+                            b[1] - threshold <= a[3] and a[1] - threshold <= b[3]):
+                        a[0] = min(a[0], b[0])
+                        a[1] = min(a[1], b[1])
+                        a[2] = max(a[2], b[2])
+                        a[3] = max(a[3], b[3])
+                        del regions[j]
+                        merged = True
+                    j -= 1
+                i += 1
     
-    def _pixels_nearby(self, pixel1: Tuple[int, int], 
-                      pixel2: Tuple[int, int]) -> bool:
-        """Check if two pixels are close enough to merge.
+    def _region_to_rect(self, region: List[int]) -> QRect:
+        """Convert a pixel bounding box to a screen rectangle.
         
         Args:
-            pixel1: First pixel coordinates
-            pixel2: Second pixel coordinates
-            
-        Returns:
-            True if pixels should be in same cluster
-        """
-        x1, y1 = pixel1
-        x2, y2 = pixel2
-        return (abs(x1 - x2) <= self._merge_threshold and 
-                abs(y1 - y2) <= self._merge_threshold)
-    
-    def _pixels_to_rect(self, pixels: Set[Tuple[int, int]]) -> QRect:
-        """Convert a set of pixels to a bounding rectangle.
+            region: Bounding box as [min_x, min_y, max_x, max_y]
         
-        Args:
-            pixels: Set of pixel coordinates
-            
         Returns:
             QRect representing the bounding rectangle in screen coordinates
         """
-        if not pixels:
-            return QRect()
-        
-        # Find bounding box
-        min_x = min(x for x, y in pixels)
-        max_x = max(x for x, y in pixels)
-        min_y = min(y for x, y in pixels)
-        max_y = max(y for x, y in pixels)
-        
-        # Convert to screen coordinates
-        screen_x = min_x * self._pixel_size
-        screen_y = min_y * self._pixel_size
-        screen_width = (max_x - min_x + 1) * self._pixel_size
-        screen_height = (max_y - min_y + 1) * self._pixel_size
+        min_x, min_y, max_x, max_y = region
+        pixel_size = self._pixel_size
         
-        return QRect(screen_x, screen_y, screen_width, screen_height)
+        return QRect(min_x * pixel_size, min_y * pixel_size,
+                     (max_x - min_x + 1) * pixel_size,
+                     (max_y - min_y + 1) * pixel_size)
     
     def clear(self) -> None:
         """Clear all dirty regions."""
-        self._dirty_pixels.clear()
-        self._dirty_rects.clear()
+        self._dirty_regions.clear()
     
     def is_empty(self) -> bool:
         """Check if there are no dirty regions."""
-        return len(self._dirty_pixels) == 0
\ No newline at end of file
+        return not self._dirty_regions
@@ -1,6 +1,6 @@
 """SVG icon caching system for improved performance."""
 
-from typing import Dict, Optional, List
+from typing import Dict, Optional, Sequence, Tuple
 from PyQt6.QtGui import QIcon, QPixmap, QPainter
 from PyQt6.QtCore import QSize
 from PyQt6.QtSvg import QSvgRenderer
@@ -19,6 +19,8 @@ class IconCache:
         """Initialize icon cache."""
         self._cache: Dict[str, QIcon] = {}
         self._size_cache: Dict[Tuple[str, int], QIcon] = {}
+        # Parsed SVG documents, shared by every size rendered from a file
+        self._renderers: Dict[str, QSvgRenderer] = {}
     
     def get_icon(self, icon_path: str, size: Optional[int] = None) -> Optional[QIcon]:
         """Get cached icon or create and cache new one.
@@ -66,7 +68,7 @@ class IconCache:
         try:
             if size is not None:
                 # Create icon with specific size
-                renderer = QSvgRenderer(icon_path)
+                renderer = self._get_renderer(icon_path)
                 pixmap = QPixmap(size, size)
                 pixmap.fill()  # Transparent background
                 
@@ -84,12 +86,27 @@ class IconCache:
             log_warning("icon_cache", f"Failed to create icon from {icon_path}: {e}")
             return None
     
-    def preload_icons(self, icon_paths: Dict[str, str], sizes: Optional[List[int]] = None) -> None:
+    def _get_renderer(self, icon_path: str) -> QSvgRenderer:
+        """Get the parsed SVG renderer for a file, parsing it on first use.
+        
+        Args:
+            icon_path: Path to SVG file
+            
+        Returns:
+            QSvgRenderer holding the parsed document
+        """
+        renderer = self._renderers.get(icon_path)
+        if renderer is None:
+            renderer = QSvgRenderer(icon_path)
+            self._renderers[icon_path] = renderer
+        return renderer
+    
+    def preload_icons(self, icon_paths: Dict[str, str], sizes: Optional[Sequence[int]] = None) -> None:
         """Preload icons for better startup performance.
         
         Args:
             icon_paths: Dictionary mapping names to icon file paths
-            sizes: Optional list of sizes to preload
+            sizes: Optional sizes to preload
         """
         for name, path in icon_paths.items():
             # Preload default size
@@ -104,6 +121,7 @@ class IconCache:
         """Clear all cached icons to free memory."""
         self._cache.clear()
         self._size_cache.clear()
+        self._renderers.clear()
     
     def get_cache_stats(self) -> Dict[str, int]:
         """Get cache statistics for debugging.
@@ -135,6 +153,18 @@ def get_cached_icon(icon_path: str, size: Optional[int] = None) -> Optional[QIco
     return _icon_cache.get_icon(icon_path, size)
 
 
+def get_svg_renderer(icon_path: str) -> QSvgRenderer:
+    """Get the parsed SVG document for an icon file, shared process-wide.
+    
+    Args:
+        icon_path: Path to SVG icon file
+    
+    Returns:
+        QSvgRenderer holding the parsed document
+    """
+    return _icon_cache._get_renderer(icon_path)
+
+
 def preload_app_icons() -> None:
     """Preload all application icons for better performance."""
     icon_paths = {
@@ -3,9 +3,10 @@
 from typing import Optional
 from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor
 from PyQt6.QtCore import Qt
-from PyQt6.QtSvg import QSvgRenderer
 import os
 
+from .icon_cache import get_svg_renderer
+
 
 def create_colored_icon(svg_path: str, color: QColor, size: int = 24) -> Optional[QIcon]:
     """Create a colored version of an SVG icon.
@@ -27,7 +28,7 @@ def create_colored_icon(svg_path: str, color: QColor, size: int = 24) -> Optiona
         pixmap.fill(Qt.GlobalColor.transparent)
         
         # Render SVG to pixmap
-        renderer = QSvgRenderer(svg_path)
+        renderer = get_svg_renderer(svg_path)
         painter = QPainter(pixmap)
         renderer.render(painter)
         painter.end()
@@ -83,7 +84,7 @@ def create_icon_with_states(svg_path: str, size: int = 24) -> Optional[QIcon]:
         # Create normal state (dark icon)
         normal_pixmap = QPixmap(size, size)
         normal_pixmap.fill(Qt.GlobalColor.transparent)
-        renderer = QSvgRenderer(svg_path)
+        renderer = get_svg_renderer(svg_path)
         painter = QPainter(normal_pixmap)
         renderer.render(painter)
         painter.end()
@@ -97,10 +98,12 @@ def create_icon_with_states(svg_path: str, size: int = 24) -> Optional[QIcon]:
         selected_pixmap = QPixmap(size, size)
         icon.addPixmap(selected_pixmap, QIcon.Mode.Normal, QIcon.State.On)
 
-        # Now render the white icon used for both Normal/On and Selected states
+        # Now render the white icon used for both Normal/On and Selected states,
+        # tinting a copy of the normal pixmap rather than rasterizing the SVG
+        # a second time
         selected_pixmap.fill(Qt.GlobalColor.transparent)
         painter = QPainter(selected_pixmap)
-        renderer.render(painter)
+        painter.drawPixmap(0, 0, normal_pixmap)
         painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
         painter.fillRect(selected_pixmap.rect(), QColor(255, 255, 255))
         painter.end()
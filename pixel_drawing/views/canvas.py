@@ -1,9 +1,9 @@
 """Interactive canvas widget for pixel art drawing and editing."""
 
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional
 from PyQt6.QtWidgets import QWidget
-from PyQt6.QtCore import Qt, QPoint, QRect, pyqtSignal, QTimer
-from PyQt6.QtGui import QPainter, QPen, QColor, QKeyEvent, QFocusEvent
+from PyQt6.QtCore import Qt, QLine, QPoint, QRect, pyqtSignal, QTimer
+from PyQt6.QtGui import QPainter, QPen, QColor, QImage, QKeyEvent, QFocusEvent
 
 from ..models import PixelArtModel
 from ..controllers.tools import ToolManager
@@ -11,7 +11,7 @@ from ..constants import AppConstants
 from ..exceptions import ValidationError
 from ..utils.cursors import CursorManager
 from ..utils.dirty_rectangles import DirtyRegionManager
-from ..enums import ToolType
+from ..enums import ToolType, AnnouncementPriority
 from ..accessibility import KeyboardNavigationMixin, CanvasKeyboardNavigation, AccessibilityUtils
 from ..accessibility.screen_reader import ScreenReaderSupport
 from ..i18n import tr_status
@@ -58,6 +58,7 @@ class PixelCanvas(QWidget, KeyboardNavigationMixin):
         self.pixel_size = pixel_size
         self.current_color = QColor(AppConstants.DEFAULT_FG_COLOR)
         self._is_drawing = False
+        self._last_pixel: Optional[Tuple[int, int]] = None
         
         # Initialize accessibility components
         self._screen_reader = ScreenReaderSupport(self)
@@ -79,8 +80,10 @@ class PixelCanvas(QWidget, KeyboardNavigationMixin):
         
         # Connect model signals
         self._model.pixel_changed.connect(self._on_pixel_changed)
+        self._model.region_changed.connect(self._on_region_changed)
         self._model.canvas_resized.connect(self._on_canvas_resized)
         self._model.canvas_cleared.connect(self._on_canvas_cleared)
+        self._model.model_loaded.connect(self._on_model_loaded)
         
         # Connect tool signals
         self._connect_tool_signals()
@@ -91,16 +94,21 @@ class PixelCanvas(QWidget, KeyboardNavigationMixin):
         # Enable mouse tracking
         self.setMouseTracking(True)
         
+        # paintEvent covers every exposed pixel with a single image blit, so
+        # Qt can skip erasing the background and compositing the parent first
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+        
         # Initialize accessibility features
         self._setup_accessibility()
         self._setup_keyboard_navigation()
         
         # Performance optimizations
         self._grid_pen = QPen(QColor(AppConstants.GRID_COLOR), 1)
-        self._cached_background = None
-        self._last_canvas_size = (0, 0)
+        self._grid_lines: List[QLine] = []
+        self._grid_lines_key: Optional[Tuple[int, int, int]] = None
         self._update_timer = QTimer()
         self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(AppConstants.UPDATE_TIMER_INTERVAL)
         self._update_timer.timeout.connect(self._delayed_update)
         self._dirty_region_manager = DirtyRegionManager(pixel_size, AppConstants.DIRTY_RECT_MERGE_THRESHOLD)
     
@@ -127,7 +135,14 @@ class PixelCanvas(QWidget, KeyboardNavigationMixin):
         
         # Start or restart the update timer for smooth batching
         if not self._update_timer.isActive():
-            self._update_timer.start(AppConstants.UPDATE_TIMER_INTERVAL)
+            self._update_timer.start()
+    
+    def _on_region_changed(self, x: int, y: int, width: int, height: int) -> None:
+        """Handle bulk pixel changes by batching their bounding box."""
+        self._dirty_region_manager.mark_region_dirty(x, y, width, height)
+        
+        if not self._update_timer.isActive():
+            self._update_timer.start()
     
     def _delayed_update(self) -> None:
         """Process batched pixel updates for better performance."""
@@ -156,17 +171,26 @@ class PixelCanvas(QWidget, KeyboardNavigationMixin):
         """Handle canvas clear from model."""
         self.update()
     
+    def _on_model_loaded(self) -> None:
+        """Handle a file being loaded into the model with one full repaint."""
+        self._dirty_region_manager.clear()
+        self.update()
+    
     def paintEvent(self, event) -> None:
         """Paint the pixel grid with performance optimizations.
         
-        Uses dirty region tracking and cached pen objects for optimal
-        rendering performance, especially on large canvases.
+        Uses dirty region tracking, a single scaled image blit for the pixel
+        colors and cached pen objects for optimal rendering performance,
+        especially on large canvases.
         """
         import time
         start_time = time.time()
         
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+        # The pixel image is upscaled by the blit itself; keep it on the
+        # nearest-neighbour path rather than bilinear filtering
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, False)
         
         # Get update region to optimize drawing
         update_rect = event.rect()
@@ -177,21 +201,45 @@ class PixelCanvas(QWidget, KeyboardNavigationMixin):
         end_x = min(self._model.width, (update_rect.right() // self.pixel_size) + 1)
         end_y = min(self._model.height, (update_rect.bottom() // self.pixel_size) + 1)
         
-        # Performance optimization: batch similar operations
+        pixel_size = self.pixel_size
+        region_width = end_x - start_x
+        region_height = end_y - start_y
+        
+        if region_width > 0 and region_height > 0:
+            # Wrap the model's packed 0xAARRGGBB buffer in an image in one call
+            # and blit the visible region scaled, with no per-pixel work
+            model_width = self._model.width
+            pixel_data = self._model.get_pixel_buffer()
+            image = QImage(pixel_data, model_width, self._model.height,
+                           model_width * 4, QImage.Format.Format_RGB32)
+            
+            # Blit in fixed-size tiles and skip those outside the update
+            # region, so scattered dirty areas don't repaint their whole
+            # bounding box on large canvases
+            update_region = event.region()
+            tile_size = AppConstants.CANVAS_TILE_SIZE
+            first_tile_y = start_y - start_y % tile_size
+            first_tile_x = start_x - start_x % tile_size
+            for tile_y in range(first_tile_y, end_y, tile_size):
+                top = max(tile_y, start_y)
+                bottom = min(tile_y + tile_size, end_y)
+                for tile_x in range(first_tile_x, end_x, tile_size):
+                    left = max(tile_x, start_x)
+                    right = min(tile_x + tile_size, end_x)
+                    target = QRect(left * pixel_size, top * pixel_size,
+                                   (right - left) * pixel_size, (bottom - top) * pixel_size)
+                    if update_region.intersects(target):
+                        painter.drawImage(target, image,
+                                          QRect(left, top, right - left, bottom - top))
+        
+        # Draw only the cached grid lines that cross the update region, in one
+        # call; the painter clips them to the region
+        grid_lines = self._get_grid_lines()
+        first_x = min(start_x, self._model.width)
+        first_y = self._model.width + 1 + min(start_y, self._model.height)
+        last_y = self._model.width + 1 + end_y
         painter.setPen(self._grid_pen)
-        
-        # Draw only the pixels in the update region
-        for x in range(start_x, end_x):
-            for y in range(start_y, end_y):
-                color = self._model.get_pixel(x, y)
-                x1 = x * self.pixel_size
-                y1 = y * self.pixel_size
-                
-                # Fill pixel
-                painter.fillRect(x1, y1, self.pixel_size, self.pixel_size, color)
-                
-                # Draw grid lines (pen already set above for performance)
-                painter.drawRect(x1, y1, self.pixel_size, self.pixel_size)
+        painter.drawLines(grid_lines[first_x:end_x + 1] + grid_lines[first_y:last_y + 1])
         
         # Log rendering performance
         duration_ms = (time.time() - start_time) * 1000
@@ -202,6 +250,27 @@ class PixelCanvas(QWidget, KeyboardNavigationMixin):
         if duration_ms > 10:  # Only log slow renders
             log_performance("canvas_render", duration_ms, f"Region: {update_size}, Pixels: {pixel_count}, Zoom: {self.pixel_size}x")
     
+    def _get_grid_lines(self) -> List[QLine]:
+        """Get the grid lines for the current canvas size and zoom level.
+        
+        The lines only depend on the canvas dimensions and pixel size, so
+        they are built once and reused until either changes.
+        
+        Returns:
+            The width + 1 vertical lines followed by the height + 1
+            horizontal lines, in widget coordinates
+        """
+        key = (self._model.width, self._model.height, self.pixel_size)
+        if key != self._grid_lines_key:
+            width, height, pixel_size = key
+            right = width * pixel_size
+            bottom = height * pixel_size
+            lines = [QLine(x * pixel_size, 0, x * pixel_size, bottom) for x in range(width + 1)]
+            lines += [QLine(0, y * pixel_size, right, y * pixel_size) for y in range(height + 1)]
+            self._grid_lines = lines
+            self._grid_lines_key = key
+        return self._grid_lines
+    
     def get_pixel_coords(self, pos: QPoint) -> Tuple[int, int]:
         """Convert widget coordinates to pixel grid coordinates."""
         pixel_x = pos.x() // self.pixel_size
@@ -225,13 +294,7 @@ class PixelCanvas(QWidget, KeyboardNavigationMixin):
     
     def get_current_tool_id(self) -> Optional[str]:
         """Get current tool ID."""
-        current_tool = self._tool_manager.current_tool
-        if current_tool:
-            # Find tool ID by comparing tool instances
-            for tool_id, tool in self._tool_manager._tools.items():
-                if tool is current_tool:
-                    return tool_id
-        return None
+        return self._tool_manager.current_tool_id
     
     def mousePressEvent(self, event) -> None:
         """Handle mouse press events."""
@@ -242,20 +305,32 @@ class PixelCanvas(QWidget, KeyboardNavigationMixin):
             from ..utils.logging import log_debug
             log_debug("canvas", f"Mouse press: screen({event.pos().x()},{event.pos().y()}) -> pixel({pixel_x},{pixel_y}) [pixel_size={self.pixel_size}]")
             
+            self._last_pixel = (pixel_x, pixel_y)
             if 0 <= pixel_x < self._model.width and 0 <= pixel_y < self._model.height:
                 self._is_drawing = self._tool_manager.handle_press(pixel_x, pixel_y, self.current_color)
     
     def mouseMoveEvent(self, event) -> None:
         """Handle mouse move events for continuous drawing and hover."""
-        pixel_x, pixel_y = self.get_pixel_coords(event.pos())
+        pos = event.pos()
+        pixel_size = self.pixel_size
+        pixel_x = pos.x() // pixel_size
+        pixel_y = pos.y() // pixel_size
+        
+        # Motion events arrive many times per logical pixel; only react when
+        # the pointer enters a different pixel, without allocating a tuple
+        # for the events that are skipped
+        last_pixel = self._last_pixel
+        if last_pixel is not None and last_pixel[0] == pixel_x and last_pixel[1] == pixel_y:
+            return
+        self._last_pixel = (pixel_x, pixel_y)
         
-        # Emit hover signal for status updates
-        if 0 <= pixel_x < self._model.width and 0 <= pixel_y < self._model.height:
+        model = self._model
+        if 0 <= pixel_x < model.width and 0 <= pixel_y < model.height:
+            # Emit hover signal for status updates
             self.pixel_hovered.emit(pixel_x, pixel_y)
-        
-        # Handle drawing
-        if self._is_drawing:
-            if 0 <= pixel_x < self._model.width and 0 <= pixel_y < self._model.height:
+            
+            # Handle drawing
+            if self._is_drawing:
                 self._tool_manager.handle_move(pixel_x, pixel_y, self.current_color)
     
     def mouseReleaseEvent(self, event) -> None:
@@ -265,6 +340,7 @@ class PixelCanvas(QWidget, KeyboardNavigationMixin):
             if 0 <= pixel_x < self._model.width and 0 <= pixel_y < self._model.height:
                 self._tool_manager.handle_release(pixel_x, pixel_y, self.current_color)
             self._is_drawing = False
+            self._last_pixel = None
     
     def wheelEvent(self, event) -> None:
         """Handle mouse wheel events for zooming.
@@ -284,6 +360,7 @@ class PixelCanvas(QWidget, KeyboardNavigationMixin):
             if new_pixel_size != self.pixel_size:
                 old_pixel_size = self.pixel_size
                 self.pixel_size = new_pixel_size
+                self._last_pixel = None
                 
                 # Update dirty region manager with new pixel size
                 self._dirty_region_manager = DirtyRegionManager(
@@ -408,7 +485,7 @@ class PixelCanvas(QWidget, KeyboardNavigationMixin):
         # Handle escape to exit keyboard navigation mode
         if event.key() == Qt.Key.Key_Escape:
             self.clearFocus()
-            self._screen_reader.announce("Exited drawing mode", "normal")
+            self._screen_reader.announce("Exited drawing mode", AnnouncementPriority.NORMAL)
             event.accept()
             return
         
@@ -428,7 +505,7 @@ class PixelCanvas(QWidget, KeyboardNavigationMixin):
         
         # Announce keyboard instructions
         instructions = tr_status("canvas_keyboard_instructions")
-        self._screen_reader.announce(instructions, "low")
+        self._screen_reader.announce(instructions, AnnouncementPriority.LOW)
     
     def focusOutEvent(self, event: QFocusEvent) -> None:
         """Handle focus out events."""
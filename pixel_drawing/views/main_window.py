@@ -1,8 +1,9 @@
 """Main application window for the Pixel Drawing application."""
 
 import os
+from collections import OrderedDict
 from functools import partial
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
@@ -18,9 +19,9 @@ from ..constants import AppConstants
 from ..exceptions import ValidationError
 from ..models.pixel_art_model import PixelArtModel
 from ..services.file_service import FileService
-from ..controllers.tools.manager import ToolManager
 from ..views.canvas import PixelCanvas
 from ..views.widgets.color_button import ColorButton
+from ..accessibility import AccessibilityUtils
 from ..views.dialogs.preferences_dialog import PreferencesDialog
 from ..utils.shortcuts import setup_keyboard_shortcuts
 from ..utils.icon_cache import get_cached_icon, preload_app_icons
@@ -70,7 +71,17 @@ class PixelDrawingApp(QMainWindow):
         
         # UI state
         self.current_color = QColor(AppConstants.DEFAULT_FG_COLOR)
-        self.recent_colors = [QColor(AppConstants.DEFAULT_BG_COLOR)] * AppConstants.RECENT_COLORS_COUNT
+        # Recent colors keyed by packed RGBA, least recently used first, so
+        # de-duplication and eviction are O(1) dictionary operations
+        default_bg = QColor(AppConstants.DEFAULT_BG_COLOR)
+        self.recent_colors: "OrderedDict[int, QColor]" = OrderedDict([(default_bg.rgba(), default_bg)])
+        
+        # Hover reports arrive once per pixel crossed while dragging; the
+        # status bar only needs the latest one each frame
+        self._hovered_pixel: Optional[Tuple[int, int]] = None
+        self._hover_timer = QTimer(self)
+        self._hover_timer.setSingleShot(True)
+        self._hover_timer.timeout.connect(self._show_hovered_pixel)
         
         # Set up connections
         self._setup_connections()
@@ -107,6 +118,9 @@ class PixelDrawingApp(QMainWindow):
         main_layout.setSpacing(0)  # No spacing for Material Design layout
         main_layout.setContentsMargins(0, 0, 0, 0)
         
+        # Preload icons so the tool buttons render from already parsed SVGs
+        preload_app_icons()
+        
         # Create Material Design navigation rail (left sidebar)
         self.create_navigation_rail(main_layout)
         
@@ -134,9 +148,6 @@ class PixelDrawingApp(QMainWindow):
         
         # Create status bar
         self.statusBar().showMessage(AppConstants.STATUS_READY)
-        
-        # Preload icons for better performance
-        preload_app_icons()
     
     def create_navigation_rail(self, main_layout) -> None:
         """Create Material Design navigation rail (left sidebar)."""
@@ -468,21 +479,17 @@ class PixelDrawingApp(QMainWindow):
         recent_layout.setSpacing(ModernDesignConstants.COLOR_GRID_SPACING)
         
         # Arrange in 3x2 grid with modern styling
+        recent_colors = self._recent_color_list()
         for i in range(ModernDesignConstants.RECENT_COLORS_COUNT):
-            btn = ColorButton(self.recent_colors[i])
-            btn.setFixedSize(ModernDesignConstants.COLOR_SWATCH_SIZE, ModernDesignConstants.COLOR_SWATCH_SIZE)
-            btn.setStyleSheet(
-                f"""
-                QPushButton {{
-                    border: 2px solid {ModernDesignConstants.BORDER_LIGHT};
-                    border-radius: {ModernDesignConstants.RADIUS_SMALL}px;
-                }}
-                QPushButton:hover {{
-                    border-color: {ModernDesignConstants.PRIMARY_PURPLE};
-                    box-shadow: 0 2px 4px rgba(160, 32, 240, 0.2);
-                }}
-                """
+            # The button owns its stylesheet so restyling on a color change
+            # keeps the swatch frame
+            btn = ColorButton(
+                recent_colors[i],
+                border=f"2px solid {ModernDesignConstants.BORDER_LIGHT}",
+                border_radius=ModernDesignConstants.RADIUS_SMALL,
+                hover_border=f"2px solid {ModernDesignConstants.PRIMARY_PURPLE}"
             )
+            btn.setFixedSize(ModernDesignConstants.COLOR_SWATCH_SIZE, ModernDesignConstants.COLOR_SWATCH_SIZE)
             btn.clicked.connect(partial(self._on_recent_color_clicked, i))
             self.recent_buttons.append(btn)
             
@@ -490,6 +497,9 @@ class PixelDrawingApp(QMainWindow):
             col = i % ModernDesignConstants.COLOR_GRID_COLUMNS
             recent_layout.addWidget(btn, row, col)
         
+        # Name each swatch after its color for screen readers and tooltips
+        AccessibilityUtils.setup_color_buttons_accessibility(zip(self.recent_buttons, recent_colors))
+        
         # Add recent colors container
         recent_container = QWidget()
         recent_container.setObjectName("recentColorsGrid")
@@ -508,20 +518,22 @@ class PixelDrawingApp(QMainWindow):
     
     def set_color(self, color: QColor, add_to_recent: bool = False) -> None:
         """Set the current color and optionally update recent colors."""
-        if add_to_recent and color != self.current_color and color not in self.recent_colors:
-            self.recent_colors.insert(0, color)
-            self.recent_colors = self.recent_colors[:6]
-            self.update_recent_colors()
+        if color == self.current_color:
+            return  # Nothing to restyle; the display already shows this color
+        
+        if add_to_recent:
+            self._add_recent_color(color)
         
         self.current_color = color
         self.canvas.current_color = color
         
-        # Update Material Design color bar
-        self.color_display.setText(color.name().upper())
+        # Update Material Design color bar, formatting the hex name only once
+        hex_name = color.name().upper()
+        self.color_display.setText(hex_name)
         self.color_display.setStyleSheet(
             f"""
             QPushButton#materialColorBar {{
-                background-color: {color.name().upper()};
+                background-color: {hex_name};
                 border: none;
                 border-radius: 4px;
                 min-height: 56px;
@@ -533,7 +545,7 @@ class PixelDrawingApp(QMainWindow):
                 box-shadow: 0 2px 4px rgba(160, 32, 240, 0.3);
             }}
             QPushButton#materialColorBar:pressed {{
-                background-color: {color.name().upper()};
+                background-color: {hex_name};
                 filter: brightness(0.9);
             }}
             """
@@ -543,15 +555,39 @@ class PixelDrawingApp(QMainWindow):
     
     def _on_recent_color_clicked(self, index: int, checked: bool = False) -> None:
         """Handle recent color button clicks."""
-        if 0 <= index < len(self.recent_colors):
-            self.set_color(self.recent_colors[index], add_to_recent=True)
+        if 0 <= index < len(self.recent_buttons):
+            self.set_color(self.recent_buttons[index].color, add_to_recent=True)
+    
+    def _add_recent_color(self, color: QColor) -> None:
+        """Move a color to the front of the recent colors, evicting the oldest."""
+        key = color.rgba()
+        self.recent_colors.pop(key, None)
+        self.recent_colors[key] = color
+        while len(self.recent_colors) > AppConstants.RECENT_COLORS_COUNT:
+            self.recent_colors.popitem(last=False)
+        self.update_recent_colors()
+    
+    def _recent_color_list(self) -> List[QColor]:
+        """Get recent colors most recent first, padded with the background color.
+        
+        Returns:
+            One color per recent color button
+        """
+        colors = list(reversed(self.recent_colors.values()))
+        padding = AppConstants.RECENT_COLORS_COUNT - len(colors)
+        return colors + [QColor(AppConstants.DEFAULT_BG_COLOR)] * padding
     
     def update_recent_colors(self) -> None:
-        """Update recent color buttons."""
-        for i, btn in enumerate(self.recent_buttons):
-            btn.set_color(self.recent_colors[i])
-            btn.clicked.disconnect()
-            btn.clicked.connect(partial(self._on_recent_color_clicked, i))
+        """Update recent color buttons.
+        
+        The buttons and their click connections are created once; each click
+        handler reads its button's color, so only the colors and their
+        accessible names change here.
+        """
+        recent_colors = self._recent_color_list()
+        for btn, color in zip(self.recent_buttons, recent_colors):
+            btn.set_color(color)
+        AccessibilityUtils.setup_color_buttons_accessibility(zip(self.recent_buttons, recent_colors))
     
     def choose_color(self) -> None:
         """Open color chooser dialog."""
@@ -567,22 +603,9 @@ class PixelDrawingApp(QMainWindow):
             if reply != QMessageBox.StandardButton.Yes:
                 return
         
-        # Create new model
-        self._model = PixelArtModel()
-        self.canvas._model = self._model
-        self.canvas._tool_manager = ToolManager(self._model)
-        
-        # Reconnect signals
-        self._model.model_loaded.connect(self._on_model_loaded)
-        self._model.model_saved.connect(self._on_model_saved)
-        
-        # Update canvas
-        self.canvas._update_widget_size()
-        self.canvas.update()
-        
-        # Update UI
-        self.width_spin.setValue(self._model.width)
-        self.height_spin.setValue(self._model.height)
+        # Reset the existing model in place; the canvas, tools and this window
+        # stay connected to it and model_loaded refreshes the UI
+        self._model.reset()
         self.setWindowTitle(tr_window("app_title"))
     
     def open_file(self) -> None:
@@ -669,13 +692,6 @@ class PixelDrawingApp(QMainWindow):
             self._model.clear()
     
     # Signal handlers
-    def _on_color_used(self, color: QColor) -> None:
-        """Handle color usage on canvas."""
-        if color != self.current_color and color not in self.recent_colors:
-            self.recent_colors.insert(0, color)
-            self.recent_colors = self.recent_colors[:AppConstants.RECENT_COLORS_COUNT]
-            self.update_recent_colors()
-    
     def _on_color_used(self, color: QColor) -> None:
         """Handle color used on canvas (including from color picker)."""
         self.set_color(color, add_to_recent=True)
@@ -685,9 +701,23 @@ class PixelDrawingApp(QMainWindow):
         self.statusBar().showMessage(tr_status("tool_changed", tool_id=tool_id))
     
     def _on_pixel_hovered(self, x: int, y: int) -> None:
-        """Handle pixel hover events."""
-        color = self._model.get_pixel(x, y)
-        self.statusBar().showMessage(tr_status("pixel_info", x=x, y=y, color=color.name().upper()))
+        """Handle pixel hover events by scheduling one status update per frame."""
+        self._hovered_pixel = (x, y)
+        if not self._hover_timer.isActive():
+            self._hover_timer.start(AppConstants.UPDATE_TIMER_INTERVAL)
+    
+    def _show_hovered_pixel(self) -> None:
+        """Show the most recently hovered pixel in the status bar."""
+        if self._hovered_pixel is None:
+            return
+        x, y = self._hovered_pixel
+        self._hovered_pixel = None
+        
+        # The canvas may have shrunk since the hover was reported
+        if not (0 <= x < self._model.width and 0 <= y < self._model.height):
+            return
+        rgba = self._model.get_pixel_rgba(x, y)
+        self.statusBar().showMessage(tr_status("pixel_info", x=x, y=y, color=f"#{rgba & 0xFFFFFF:06X}"))
     
     def _on_model_loaded(self) -> None:
         """Handle model loaded."""
@@ -20,9 +20,24 @@ class ColorButton(QPushButton):
         - Fixed size for consistent layout in color palette
     """
     
-    def __init__(self, color: QColor, parent=None):
+    def __init__(self, color: QColor, parent=None,
+                 border: str = f"1px solid {AppConstants.BORDER_COLOR}",
+                 border_radius: int = 2,
+                 hover_border: str = f"3px solid {AppConstants.HOVER_COLOR}"):
+        """Initialize color button.
+        
+        Args:
+            color: Color to display
+            parent: Parent widget
+            border: CSS border of the button
+            border_radius: Corner radius in pixels
+            hover_border: CSS border while the pointer is over the button
+        """
         super().__init__(parent)
         self.color = color
+        self._border = border
+        self._border_radius = border_radius
+        self._hover_border = hover_border
         self.setFixedSize(AppConstants.COLOR_BUTTON_SIZE, AppConstants.COLOR_BUTTON_SIZE)
         self._update_stylesheet()
     
@@ -35,19 +50,24 @@ class ColorButton(QPushButton):
         self.setStyleSheet(f"""
             QPushButton {{
                 background-color: {self.color.name().upper()};
-                border: 1px solid {AppConstants.BORDER_COLOR};
-                border-radius: 2px;
+                border: {self._border};
+                border-radius: {self._border_radius}px;
             }}
             QPushButton:hover {{
-                border: 3px solid {AppConstants.HOVER_COLOR};
+                border: {self._hover_border};
             }}
         """)
     
     def set_color(self, color: QColor) -> None:
         """Update the button's displayed color.
         
+        Restyling re-parses the stylesheet, so it is skipped when the color
+        is unchanged.
+        
         Args:
             color: New color to display on the button
         """
+        if color == self.color:
+            return
         self.color = color
         self._update_stylesheet()
\ No newline at end of file
@@ -0,0 +1,91 @@
+"""
+Unit tests for AccessibilityUtils - Accessible names and color contrast.
+
+Tests that palette buttons receive their accessible names and tooltips and
+that batch helpers agree with their single-item counterparts.
+"""
+
+import pytest
+from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QPushButton
+from pixel_drawing.accessibility.accessibility_utils import AccessibilityUtils
+
+
+class TestColorButtonAccessibility:
+    """Test accessible names and tooltips on color buttons."""
+    
+    def test_setup_color_buttons_accessibility(self, mock_qt_application):
+        """Test the batch setup names every button after its color."""
+        colors = [QColor(255, 0, 0), QColor(0, 0, 255), QColor(255, 0, 0)]
+        buttons = [QPushButton() for _ in colors]
+        
+        AccessibilityUtils.setup_color_buttons_accessibility(zip(buttons, colors))
+        
+        for button, color in zip(buttons, colors):
+            single = QPushButton()
+            AccessibilityUtils.setup_color_button_accessibility(single, color)
+            assert button.accessibleName() == single.accessibleName()
+            assert button.accessibleDescription() == single.accessibleDescription()
+            assert button.toolTip() == single.toolTip()
+        
+        assert buttons[0].toolTip().endswith("(#FF0000)")
+        assert buttons[1].toolTip().endswith("(#0000FF)")
+        assert buttons[0].accessibleName().startswith("Color ")
+    
+    def test_setup_color_buttons_accessibility_follows_color_change(self, mock_qt_application):
+        """Test re-running the setup updates a button whose color changed."""
+        button = QPushButton()
+        AccessibilityUtils.setup_color_buttons_accessibility([(button, QColor(255, 0, 0))])
+        
+        AccessibilityUtils.setup_color_buttons_accessibility([(button, QColor(0, 255, 0))])
+        
+        assert button.toolTip().endswith("(#00FF00)")
+
+
+class TestContrastBatch:
+    """Test palette-wide contrast helpers against the pairwise versions."""
+    
+    PALETTE = [
+        QColor(0, 0, 0),
+        QColor(255, 255, 255),
+        QColor(255, 0, 0),
+        QColor(118, 118, 118),
+        QColor(254, 1, 0),
+    ]
+    
+    def test_contrast_matrix_matches_pairwise_ratio(self):
+        """Test every matrix entry equals get_contrast_ratio for that pair."""
+        matrix = AccessibilityUtils.contrast_matrix(self.PALETTE)
+        
+        assert len(matrix) == len(self.PALETTE)
+        for i, color1 in enumerate(self.PALETTE):
+            assert len(matrix[i]) == len(self.PALETTE)
+            for j, color2 in enumerate(self.PALETTE):
+                expected = AccessibilityUtils.get_contrast_ratio(color1, color2)
+                assert matrix[i][j] == pytest.approx(expected)
+    
+    def test_contrast_matrix_symmetric_with_unit_diagonal(self):
+        """Test the matrix is symmetric and each color has ratio 1.0 with itself."""
+        matrix = AccessibilityUtils.contrast_matrix(self.PALETTE)
+        
+        for i in range(len(self.PALETTE)):
+            assert matrix[i][i] == pytest.approx(1.0)
+            for j in range(len(self.PALETTE)):
+                assert matrix[i][j] == pytest.approx(matrix[j][i])
+        assert matrix[0][1] == pytest.approx(21.0)
+    
+    def test_contrast_matrix_empty_palette(self):
+        """Test an empty palette gives an empty matrix."""
+        assert AccessibilityUtils.contrast_matrix([]) == []
+    
+    def test_meets_contrast_requirement_batch_matches_pairwise(self):
+        """Test batch WCAG checks agree with meets_contrast_requirement."""
+        for level in ("AA", "AAA"):
+            results = AccessibilityUtils.meets_contrast_requirement_batch(self.PALETTE, level)
+            
+            for i, color1 in enumerate(self.PALETTE):
+                for j, color2 in enumerate(self.PALETTE):
+                    expected = AccessibilityUtils.meets_contrast_requirement(color1, color2, level)
+                    assert results[i][j] == expected
+                    assert results[i][j] == results[j][i]
+                assert not results[i][i]
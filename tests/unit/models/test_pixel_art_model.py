@@ -5,9 +5,15 @@ Tests the fundamental data model operations including pixel management,
 validation, serialization, and business rule enforcement.
 """
 
+import base64
+import sys
+import zlib
+from array import array
+
 import pytest
 from PyQt6.QtGui import QColor
 from pixel_drawing.models.pixel_art_model import PixelArtModel
+from pixel_drawing.commands import SetMultiplePixelsCommand
 from pixel_drawing.exceptions import ValidationError
 from pixel_drawing.constants import AppConstants
 
@@ -96,6 +102,70 @@ class TestPixelOperations:
             with pytest.raises(ValidationError, match="out of bounds"):
                 empty_model.get_pixel(x, y)
     
+    def test_get_pixel_rgba(self, empty_model, test_colors):
+        """Test getting the packed color value of a pixel."""
+        empty_model.set_pixel(3, 4, test_colors['red'])
+        
+        assert empty_model.get_pixel_rgba(3, 4) == 0xFFFF0000
+        assert empty_model.get_pixel_rgba(0, 0) == QColor(AppConstants.DEFAULT_BG_COLOR).rgba()
+        
+        with pytest.raises(ValidationError, match="out of bounds"):
+            empty_model.get_pixel_rgba(8, 0)
+    
+    def test_get_pixels_rgba(self, empty_model, test_colors):
+        """Test reading the packed colors of several pixels at once."""
+        empty_model.set_pixel(3, 4, test_colors['red'])
+        background = QColor(AppConstants.DEFAULT_BG_COLOR).rgba()
+        
+        assert list(empty_model.get_pixels_rgba(array('i', [3, 0]), array('i', [4, 0]))) == [
+            0xFFFF0000, background]
+        assert len(empty_model.get_pixels_rgba(array('i'), array('i'))) == 0
+        
+        with pytest.raises(ValidationError, match="out of bounds"):
+            empty_model.get_pixels_rgba(array('i', [0, 8]), array('i', [0, 0]))
+    
+    def test_set_pixel_rgba(self, empty_model):
+        """Test setting a pixel from a packed color value."""
+        assert empty_model.set_pixel_rgba(2, 3, 0xFF00FF00)
+        assert not empty_model.set_pixel_rgba(2, 3, 0xFF00FF00)
+        assert empty_model.get_pixel_rgba(2, 3) == 0xFF00FF00
+        
+        empty_model.undo()
+        
+        assert empty_model.get_pixel(2, 3) == QColor(AppConstants.DEFAULT_BG_COLOR)
+        
+        with pytest.raises(ValidationError, match="out of bounds"):
+            empty_model.set_pixel_rgba(0, 8, 0xFF00FF00)
+    
+    def test_set_pixels(self, empty_model, test_colors):
+        """Test painting several pixels as one undoable region update."""
+        regions = []
+        empty_model.region_changed.connect(lambda *args: regions.append(args))
+        
+        assert empty_model.set_pixels([(1, 1), (2, 1), (3, 2)], test_colors['red'])
+        
+        assert regions == [(1, 1, 3, 2)]
+        assert empty_model.get_pixel(3, 2) == test_colors['red']
+        assert not empty_model.set_pixels([(1, 1), (2, 1)], test_colors['red'])
+        
+        empty_model.undo()
+        
+        assert empty_model.get_pixel(1, 1) == QColor(AppConstants.DEFAULT_BG_COLOR)
+        assert not empty_model.can_undo()
+        
+        with pytest.raises(ValidationError, match="out of bounds"):
+            empty_model.set_pixels([(0, 0), (8, 0)], test_colors['red'])
+    
+    def test_get_pixel_buffer_shares_model_memory(self, empty_model, test_colors):
+        """Test the pixel buffer is a read-only view that tracks later edits."""
+        buffer = empty_model.get_pixel_buffer()
+        assert buffer.readonly
+        assert len(buffer) == 8 * 8 * 4
+        
+        empty_model.set_pixel(1, 0, test_colors['red'])
+        
+        assert int.from_bytes(buffer[4:8], sys.byteorder) == 0xFFFF0000
+    
     def test_set_pixel_invalid_color(self, empty_model, test_colors):
         """Test setting pixel with invalid color raises ValidationError."""
         # Create an invalid color (QColor with invalid spec)
@@ -125,6 +195,7 @@ class TestFloodFill:
         changed = empty_model.flood_fill(0, 0, test_colors['red'])
         
         assert len(changed) == 0
+        assert changed == []
     
     def test_flood_fill_bounded_area(self, empty_model, test_colors):
         """Test flood fill stops at color boundaries."""
@@ -142,6 +213,20 @@ class TestFloodFill:
         assert empty_model.get_pixel(0, 2) == test_colors['red']  # Boundary unchanged
         assert empty_model.get_pixel(0, 3) == QColor(AppConstants.DEFAULT_BG_COLOR)  # Below unchanged
     
+    def test_flood_fill_returns_changed_coordinates(self, empty_model, test_colors):
+        """Test flood fill reports changed pixels as a list-comparable sequence."""
+        for x in range(8):
+            empty_model.set_pixel(x, 1, test_colors['red'])
+        empty_model.set_pixel(1, 0, test_colors['red'])
+        
+        changed = empty_model.flood_fill(0, 0, test_colors['blue'])
+        
+        assert changed == [(0, 0)]
+        assert list(changed) == [(0, 0)]
+        assert changed[0] == (0, 0) and changed[-1] == (0, 0)
+        assert (0, 0) in changed and (1, 0) not in changed
+        assert changed != [(1, 0)]
+    
     def test_flood_fill_invalid_coordinates(self, empty_model, test_colors):
         """Test flood fill with invalid start coordinates raises ValidationError."""
         with pytest.raises(ValidationError, match="out of bounds"):
@@ -177,6 +262,19 @@ class TestCanvasOperations:
         
         assert model_with_pixels.is_modified
     
+    def test_reset_canvas(self, model_with_pixels):
+        """Test reset gives a blank, unsaved default-size canvas."""
+        model_with_pixels.set_current_file("/tmp/test.json")
+        
+        model_with_pixels.reset()
+        
+        assert model_with_pixels.width == AppConstants.DEFAULT_CANVAS_WIDTH
+        assert model_with_pixels.height == AppConstants.DEFAULT_CANVAS_HEIGHT
+        assert model_with_pixels.get_pixel(0, 0) == QColor(AppConstants.DEFAULT_BG_COLOR)
+        assert model_with_pixels.current_file is None
+        assert not model_with_pixels.is_modified
+        assert not model_with_pixels.can_undo()
+    
     def test_resize_canvas_larger(self, model_with_pixels, test_colors):
         """Test resizing canvas to larger dimensions preserves existing pixels."""
         original_pixel = model_with_pixels.get_pixel(0, 0)
@@ -200,7 +298,42 @@ class TestCanvasOperations:
         
         with pytest.raises(ValidationError):
             model_with_pixels.get_pixel(2, 2)
+
+    def test_resize_preserves_pixel_positions(self, empty_model, test_colors):
+        """Test resizing keeps pixels at the same coordinates when width changes."""
+        empty_model.set_pixel(3, 5, test_colors['red'])
+        empty_model.set_pixel(7, 7, test_colors['blue'])
+
+        empty_model.resize(12, 6)
+
+        assert empty_model.get_pixel(3, 5) == test_colors['red']
+        assert empty_model.get_pixel(11, 0) == QColor(AppConstants.DEFAULT_BG_COLOR)
+
+        empty_model.resize(5, 8)
+
+        assert empty_model.get_pixel(3, 5) == test_colors['red']
+        assert empty_model.get_pixel(4, 7) == QColor(AppConstants.DEFAULT_BG_COLOR)
+
+        # Height-only changes keep the row layout
+        empty_model.resize(5, 4)
+        empty_model.resize(5, 10)
+
+        assert empty_model.get_pixel(3, 5) == QColor(AppConstants.DEFAULT_BG_COLOR)
+        assert empty_model.get_pixel(4, 9) == QColor(AppConstants.DEFAULT_BG_COLOR)
+        assert len(empty_model.get_pixel_buffer()) == 5 * 10 * 4
     
+    def test_undo_after_resize_smaller(self, empty_model, test_colors):
+        """Test undo after shrinking keeps history but skips cropped pixels."""
+        empty_model.set_pixels([(1, 2), (5, 0), (3, 7)], test_colors['red'])
+        empty_model.resize(4, 4)
+        
+        assert empty_model.undo()
+        assert empty_model.get_all_pixels() == {}
+        
+        # (5, 0) must not wrap onto (1, 1) in the narrower buffer
+        assert empty_model.redo()
+        assert empty_model.get_all_pixels() == {(1, 2): test_colors['red']}
+
     def test_resize_same_dimensions_no_change(self, empty_model):
         """Test resizing to same dimensions doesn't mark as modified."""
         empty_model.resize(8, 8)  # Same as initial size
@@ -226,7 +359,11 @@ class TestSerialization:
         
         assert data['width'] == 8
         assert data['height'] == 8
-        assert data['pixels'] == {}  # Empty canvas has no stored pixels
+        assert data['format'] == AppConstants.PIXEL_FORMAT_ARGB32
+        assert data['compression'] == AppConstants.PIXEL_COMPRESSION_ZLIB
+        # Packed buffer stores one 32-bit word per pixel
+        raw = zlib.decompress(base64.b64decode(data['pixels']))
+        assert len(raw) == 8 * 8 * 4
     
     def test_to_dict_with_pixels(self, model_with_pixels):
         """Test serializing model with pixels to dictionary."""
@@ -234,8 +371,9 @@ class TestSerialization:
         
         assert data['width'] == 8
         assert data['height'] == 8
-        assert '0,0' in data['pixels']
-        assert data['pixels']['0,0'] == '#FF0000'  # Red pixel
+        raw = zlib.decompress(base64.b64decode(data['pixels']))
+        assert int.from_bytes(raw[0:4], 'little') == 0xFFFF0000  # Red pixel at (0, 0)
+        assert int.from_bytes(raw[4:8], 'little') == 0xFF00FF00  # Green pixel at (1, 0)
     
     def test_load_from_dict_valid_data(self, empty_model, sample_project_data):
         """Test loading valid data from dictionary."""
@@ -277,6 +415,44 @@ class TestSerialization:
         with pytest.raises(ValidationError, match="Invalid pixel data"):
             empty_model.load_from_dict(invalid_data)
     
+    def test_load_from_dict_wrong_buffer_size(self, empty_model):
+        """Test loading a packed pixel buffer of the wrong size raises ValidationError."""
+        invalid_data = {
+            'width': 4,
+            'height': 4,
+            'pixels': base64.b64encode(bytes(12)).decode('ascii')
+        }
+        
+        with pytest.raises(ValidationError, match="Invalid pixel data"):
+            empty_model.load_from_dict(invalid_data)
+    
+    def test_load_from_dict_uncompressed_buffer(self, empty_model):
+        """Test loading a packed pixel buffer saved without compression."""
+        words = [0xFFFF0000] + [0xFFFFFFFF] * 3
+        data = {
+            'width': 2,
+            'height': 2,
+            'format': AppConstants.PIXEL_FORMAT_ARGB32,
+            'pixels': base64.b64encode(b''.join(w.to_bytes(4, 'little') for w in words)).decode('ascii')
+        }
+        
+        empty_model.load_from_dict(data)
+        
+        assert empty_model.get_pixel(0, 0) == QColor('#FF0000')
+        assert empty_model.get_pixel(1, 1) == QColor('#FFFFFF')
+    
+    def test_load_from_dict_corrupt_compressed_buffer(self, empty_model):
+        """Test loading a compressed buffer that does not inflate raises ValidationError."""
+        invalid_data = {
+            'width': 4,
+            'height': 4,
+            'compression': AppConstants.PIXEL_COMPRESSION_ZLIB,
+            'pixels': base64.b64encode(b'not zlib data').decode('ascii')
+        }
+        
+        with pytest.raises(ValidationError, match="Invalid pixel data"):
+            empty_model.load_from_dict(invalid_data)
+    
     def test_round_trip_serialization(self, model_with_pixels):
         """Test that serialize -> deserialize preserves all data."""
         original_data = model_with_pixels.to_dict()
@@ -348,6 +524,83 @@ class TestUndoRedoSupport:
         assert empty_model.get_pixel(0, 0) == test_colors['red']
         assert empty_model.can_undo()
         assert not empty_model.can_redo()
+    
+    def test_quick_pixel_edits_merge_into_one_undo_step(self, empty_model, test_colors):
+        """Test pixels painted in quick succession are undone together."""
+        background = QColor(AppConstants.DEFAULT_BG_COLOR)
+        empty_model.set_pixel(0, 0, test_colors['red'])
+        empty_model.set_pixel(1, 0, test_colors['red'])
+        empty_model.set_pixel(0, 0, test_colors['blue'])
+        
+        assert empty_model.undo()
+        
+        assert empty_model.get_pixel(0, 0) == background
+        assert empty_model.get_pixel(1, 0) == background
+        assert not empty_model.can_undo()
+        
+        assert empty_model.redo()
+        
+        assert empty_model.get_pixel(0, 0) == test_colors['blue']
+        assert empty_model.get_pixel(1, 0) == test_colors['red']
+    
+    def test_quick_edits_do_not_merge_across_resize(self, empty_model, test_colors):
+        """Test an edit right after a resize starts a new undo step."""
+        empty_model.set_pixel(0, 0, test_colors['red'])
+        empty_model.resize(10, 10)
+        empty_model.set_pixel(1, 0, test_colors['red'])
+        
+        assert empty_model.undo()
+        
+        assert empty_model.get_pixel(0, 0) == test_colors['red']
+        assert empty_model.get_pixel(1, 0) == QColor(AppConstants.DEFAULT_BG_COLOR)
+        
+        # The edit before the resize is still its own undo step
+        assert empty_model.undo()
+        assert empty_model.get_pixel(0, 0) == QColor(AppConstants.DEFAULT_BG_COLOR)
+    
+    def test_quick_edits_do_not_merge_across_load(self, empty_model, test_colors):
+        """Test an edit right after loading starts a new undo step."""
+        empty_model.set_pixel(0, 0, test_colors['red'])
+        empty_model.load_from_dict(empty_model.to_dict())
+        empty_model.set_pixel(1, 0, test_colors['red'])
+        
+        assert empty_model.undo()
+        
+        assert empty_model.get_pixel(0, 0) == test_colors['red']
+        assert empty_model.get_pixel(1, 0) == QColor(AppConstants.DEFAULT_BG_COLOR)
+        assert not empty_model.can_undo()
+    
+    def test_quick_edits_do_not_merge_across_reset(self, empty_model, test_colors):
+        """Test an edit right after a reset starts a new undo step."""
+        empty_model.set_pixel(0, 0, test_colors['red'])
+        empty_model.reset(8, 8)
+        empty_model.set_pixel(1, 0, test_colors['red'])
+        
+        assert empty_model.undo()
+        
+        assert empty_model.get_pixel(1, 0) == QColor(AppConstants.DEFAULT_BG_COLOR)
+        assert not empty_model.can_undo()
+    
+    def test_multiple_pixels_command_emits_one_region(self, empty_model, test_colors):
+        """Test a multi-pixel command applies and undoes as one region update."""
+        regions = []
+        empty_model.region_changed.connect(lambda *args: regions.append(args))
+        command = SetMultiplePixelsCommand(empty_model, {
+            (1, 2): test_colors['red'],
+            (4, 3): test_colors['blue'],
+        })
+        
+        command.execute()
+        
+        assert empty_model.get_pixel(1, 2) == test_colors['red']
+        assert empty_model.get_pixel(4, 3) == test_colors['blue']
+        assert regions == [(1, 2, 4, 2)]
+        
+        command.undo()
+        
+        assert empty_model.get_pixel(1, 2) == QColor(AppConstants.DEFAULT_BG_COLOR)
+        assert empty_model.get_pixel(4, 3) == QColor(AppConstants.DEFAULT_BG_COLOR)
+        assert len(regions) == 2
 
 
 class TestSignalEmission:
@@ -393,4 +646,32 @@ class TestSignalEmission:
         
         assert len(signals_received) == 1
         width, height = signals_received[0]
-        assert width == 16 and height == 20
\ No newline at end of file
+        assert width == 16 and height == 20
+    
+    def test_flood_fill_emits_single_region_signal(self, empty_model, test_colors):
+        """Test flood fill reports its bounding box once instead of per pixel."""
+        for i in range(8):
+            empty_model.set_pixel(4, i, test_colors['black'])
+        
+        regions_received = []
+        pixels_received = []
+        empty_model.region_changed.connect(lambda *args: regions_received.append(args))
+        empty_model.pixel_changed.connect(lambda *args: pixels_received.append(args))
+        
+        empty_model.flood_fill(0, 0, test_colors['red'])
+        
+        assert regions_received == [(0, 0, 4, 8)]
+        assert pixels_received == []
+    
+    def test_flood_fill_uniform_canvas(self, test_colors):
+        """Test filling a single-color canvas recolors every pixel."""
+        model = PixelArtModel(6, 4)
+        regions_received = []
+        model.region_changed.connect(lambda *args: regions_received.append(args))
+        
+        changed = model.flood_fill(2, 1, test_colors['red'])
+        
+        assert len(changed) == 6 * 4
+        assert regions_received == [(0, 0, 6, 4)]
+        assert all(model.get_pixel_rgba(x, y) == test_colors['red'].rgba()
+                   for x in range(6) for y in range(4))
@@ -0,0 +1,71 @@
+"""
+Unit tests for DirtyRegionManager - Canvas update region tracking.
+
+Tests that dirty pixels are coalesced into bounding rectangles in
+screen coordinates and that distant edits stay in separate regions.
+"""
+
+from PyQt6.QtCore import QRect
+from pixel_drawing.utils.dirty_rectangles import DirtyRegionManager
+
+
+class TestDirtyRegionManager:
+    """Test dirty pixel tracking and rectangle generation."""
+    
+    def test_empty_manager_returns_no_rectangles(self):
+        """Test that no rectangles are produced without dirty pixels."""
+        manager = DirtyRegionManager(pixel_size=10, merge_threshold=3)
+        
+        assert manager.is_empty()
+        assert manager.get_update_rectangles() == []
+    
+    def test_single_pixel_rectangle(self):
+        """Test a single dirty pixel maps to one pixel-sized screen rectangle."""
+        manager = DirtyRegionManager(pixel_size=10, merge_threshold=3)
+        manager.mark_pixel_dirty(2, 5)
+        
+        assert manager.get_update_rectangles() == [QRect(20, 50, 10, 10)]
+        assert manager.is_empty()  # Flushing clears the manager
+    
+    def test_nearby_pixels_are_merged(self):
+        """Test that pixels within the merge threshold share one rectangle."""
+        manager = DirtyRegionManager(pixel_size=10, merge_threshold=3)
+        for x in range(0, 12, 2):
+            manager.mark_pixel_dirty(x, 1)
+        
+        assert manager.get_update_rectangles() == [QRect(0, 10, 110, 10)]
+    
+    def test_distant_pixels_stay_separate(self):
+        """Test that pixels further apart than the threshold are not merged."""
+        manager = DirtyRegionManager(pixel_size=10, merge_threshold=3)
+        manager.mark_pixel_dirty(0, 0)
+        manager.mark_pixel_dirty(20, 20)
+        
+        rects = manager.get_update_rectangles()
+        
+        assert len(rects) == 2
+        assert QRect(0, 0, 10, 10) in rects
+        assert QRect(200, 200, 10, 10) in rects
+    
+    def test_regions_bridged_by_later_pixels_are_merged(self):
+        """Test that separate regions joined by later edits collapse into one."""
+        manager = DirtyRegionManager(pixel_size=10, merge_threshold=3)
+        manager.mark_pixel_dirty(0, 0)
+        manager.mark_pixel_dirty(10, 0)
+        for x in range(2, 9, 2):
+            manager.mark_pixel_dirty(x, 0)
+        
+        assert manager.get_update_rectangles() == [QRect(0, 0, 110, 10)]
+    
+    def test_region_merges_with_nearby_pixels(self):
+        """Test that a marked block joins pixel edits next to it."""
+        manager = DirtyRegionManager(pixel_size=10, merge_threshold=3)
+        manager.mark_region_dirty(2, 2, 4, 3)
+        manager.mark_pixel_dirty(7, 4)
+        manager.mark_pixel_dirty(30, 30)
+        
+        rects = manager.get_update_rectangles()
+        
+        assert len(rects) == 2
+        assert QRect(20, 20, 60, 30) in rects
+        assert QRect(300, 300, 10, 10) in rects